@@ -1,5 +1,7 @@
 """Tooling to convert Django models and fields to Pydantic native models."""
 
+import sys
+from collections.abc import Hashable, Mapping
 from enum import Enum, IntEnum
 from types import UnionType
 from typing import TYPE_CHECKING, Any, cast
@@ -11,6 +13,7 @@ from django.db.models import (
     Field,
     ForeignKey,
     ForeignObjectRel,
+    JSONField,
     ManyToManyField,
     ManyToManyRel,
     ManyToOneRel,
@@ -22,6 +25,13 @@ from pydantic import BaseModel, create_model, field_validator
 from pydantic.fields import FieldInfo
 from pydantic_core import PydanticUndefined
 
+from django2pydantic.cache import (
+    InferredFields,
+    fingerprint,
+    get_disk_cache,
+    stable_repr,
+)
+from django2pydantic.getter import mark_json_keys_schema
 from django2pydantic.mixin import BaseMixins
 from django2pydantic.registry import FieldTypeRegistry
 from django2pydantic.types import (
@@ -33,7 +43,7 @@ from django2pydantic.types import (
     SetType,
     TDjangoModel,
 )
-from django2pydantic.utils import override_type_and_meta
+from django2pydantic.utils import contains_model, override_type_and_meta
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -46,6 +56,28 @@ type PydanticFields = dict[
     ],
 ]
 
+SINGLE_RELATION_FIELD_TYPES = (ForeignKey, OneToOneField, OneToOneRel)
+"""Relation fields that refer to a single related object."""
+
+MULTIPLE_RELATION_FIELD_TYPES = (ManyToManyField, ManyToManyRel, ManyToOneRel)
+"""Relation fields that refer to multiple related objects."""
+
+RELATION_FIELD_TYPES = SINGLE_RELATION_FIELD_TYPES + MULTIPLE_RELATION_FIELD_TYPES
+
+type SchemaCacheKey = tuple[Hashable, ...]
+
+_schema_cache: dict[SchemaCacheKey, type[BaseModel]] = {}
+"""Already built Pydantic models keyed by their canonical build arguments."""
+
+
+class _UncacheableFieldsError(TypeError):
+    """Raised when the fields definition can not be reduced to a hashable form."""
+
+
+def clear_schema_cache() -> None:
+    """Clear the memoized Pydantic models built by `create_pydantic_model`."""
+    _schema_cache.clear()
+
 
 @beartype
 def has_property(cls: type[object], property_name: str) -> bool:
@@ -56,15 +88,91 @@ def has_property(cls: type[object], property_name: str) -> bool:
     )
 
 
-def create_pydantic_model(  # noqa: C901, PLR0912, PLR0915, WPS210, WPS231 # NOSONAR
+def create_pydantic_model(  # noqa: PLR0913
     django_model: type[TDjangoModel],
     field_type_registry: FieldTypeRegistry,
     fields: ModelFields | ModelFieldsCompact,
     bases: tuple[type[BaseModel], ...] | None = None,
     model_name: str | None = None,
+    *,
+    defer_build: bool = False,
 ) -> type[BaseModel]:
     """Create a Pydantic model from a Django model.
 
+    The built models are memoized: calling this again with the same Django model,
+    field type registry, fields definition, bases and model name returns the already
+    built Pydantic model instead of creating a new one. Equivalent fields definitions
+    (e.g. `{"id": Infer}`, `["id"]` and `[("id", Infer)]`) share the same model.
+
+    Args:
+        django_model (type[models.Model]): The Django model class.
+        field_type_registry (FieldTypeRegistry): The field type registry.
+        fields (ModelFields | ModelFieldsCompact): The included fields.
+        bases (tuple[type[BaseModel], ...], optional): The base classes for the Pydantic
+            model. Defaults to None.
+        model_name (str, optional): The name of the Pydantic model. Defaults to None.
+        defer_build (bool, optional): Whether to defer building the Pydantic core
+            schema, validator and serializer of the model (and its nested models)
+            until the first validation, serialization or JSON schema generation.
+            Defaults to False.
+
+    Returns:
+        type[BaseModel]: The Pydantic model.
+
+    Raises:
+        ValueError: If included_fields is None.
+        AttributeError: If there are errors creating the Pydantic model.
+    """
+    if fields is None:
+        msg = "The 'fields' argument is required."
+        raise ValueError(msg)
+
+    model_name = model_name or f"{django_model.__name__}Schema"
+
+    try:
+        cache_key = _get_schema_cache_key(
+            django_model=django_model,
+            field_type_registry=field_type_registry,
+            fields=fields,
+            bases=bases,
+            model_name=model_name,
+            defer_build=defer_build,
+        )
+    except _UncacheableFieldsError:
+        return _build_pydantic_model(
+            django_model,
+            field_type_registry,
+            fields,
+            bases,
+            model_name,
+            defer_build=defer_build,
+        )
+
+    pydantic_model = _schema_cache.get(cache_key)
+    if pydantic_model is None:
+        pydantic_model = _build_pydantic_model(
+            django_model,
+            field_type_registry,
+            fields,
+            bases,
+            model_name,
+            defer_build=defer_build,
+        )
+        _schema_cache[cache_key] = pydantic_model
+    return pydantic_model
+
+
+def _build_pydantic_model(  # noqa: C901, PLR0912, PLR0913, PLR0915, WPS210, WPS231 # NOSONAR
+    django_model: type[TDjangoModel],
+    field_type_registry: FieldTypeRegistry,
+    fields: ModelFields | ModelFieldsCompact,
+    bases: tuple[type[BaseModel], ...] | None = None,
+    model_name: str | None = None,
+    *,
+    defer_build: bool = False,
+) -> type[BaseModel]:
+    """Build a Pydantic model from a Django model without memoization.
+
     Args:
         django_model (type[models.Model]): The Django model class.
         field_type_registry (FieldTypeRegistry): The field type registry.
@@ -72,6 +180,8 @@ def create_pydantic_model(  # noqa: C901, PLR0912, PLR0915, WPS210, WPS231 # NOS
         bases (tuple[type[BaseModel], ...], optional): The base classes for the Pydantic
             model. Defaults to None.
         model_name (str, optional): The name of the Pydantic model. Defaults to None.
+        defer_build (bool, optional): Whether to defer building the Pydantic core
+            schema, validator and serializer. Defaults to False.
 
     Returns:
         type[BaseModel]: The Pydantic model.
@@ -92,6 +202,19 @@ def create_pydantic_model(  # noqa: C901, PLR0912, PLR0915, WPS210, WPS231 # NOS
         msg = "The 'fields' argument is required."
         raise ValueError(msg)
 
+    # Inferred field types may be reused from the persistent on-disk cache:
+    disk_cache = get_disk_cache()
+    disk_cache_key: str | None = None
+    disk_cached_fields: InferredFields = {}
+    if disk_cache is not None:
+        disk_cache_key = _get_disk_cache_key(
+            django_model=django_model,
+            field_type_registry=field_type_registry,
+            fields=fields,
+        )
+        disk_cached_fields = disk_cache.load(disk_cache_key) or {}
+    inferred_fields: InferredFields = {}
+
     # for field_name, field_def in fields.items():
     field_name: str
     field_def: (
@@ -132,35 +255,48 @@ def create_pydantic_model(  # noqa: C901, PLR0912, PLR0915, WPS210, WPS231 # NOS
 
         pydantic_field_info: FieldInfo
         if field_def is Infer or isinstance(field_def, InferExcept):
-            type_handler = field_type_registry.get_handler(django_field)
-            python_type = type_handler.get_pydantic_type()
-            pydantic_field_info = type_handler.get_pydantic_field()
-
-            if isinstance(field_def, InferExcept):
-                python_type, pydantic_field_info = override_type_and_meta(
-                    pydantic_type=python_type,
-                    field_info=pydantic_field_info,
-                    overrides=field_def,
+            if field_name in disk_cached_fields:
+                python_type, pydantic_field_info = disk_cached_fields[field_name]
+            else:
+                python_type, pydantic_field_info = field_type_registry.infer_field(
+                    django_field
                 )
 
-            if type(django_field) in {  # noqa: WPS516
-                ForeignKey,
-                ManyToOneRel,
-                ManyToManyField,
-                ManyToManyRel,
-                OneToOneField,
-                OneToOneRel,
-            }:
-                validators[f"{field_name}_relation"] = field_validator(
-                    field_name,
-                    mode="wrap",
-                )(BaseMixins.validate_relation)
+                if isinstance(field_def, InferExcept):
+                    python_type, pydantic_field_info = override_type_and_meta(
+                        pydantic_type=python_type,
+                        field_info=pydantic_field_info,
+                        overrides=field_def,
+                    )
+            inferred_fields[field_name] = (python_type, pydantic_field_info)
+
+            if isinstance(django_field, RELATION_FIELD_TYPES):
+                validators[f"{field_name}_relation"] = _get_relation_validator(
+                    django_field, field_name, python_type
+                )
 
             pydantic_fields[field_name] = (  # pyre-ignore[6]
                 python_type,
                 pydantic_field_info,
             )
 
+        # The keys read from the documents of a JSON field:
+        elif isinstance(django_field, JSONField) and isinstance(field_def, dict | list):
+            try:
+                keys_schema = _create_json_keys_schema(
+                    django_model=django_model,
+                    path=(field_name,),
+                    keys_fields=field_def,  # pyright: ignore [reportUnknownArgumentType]
+                    bases=bases,
+                )
+            except ValueError as e:
+                errors.append(str(e))
+                continue
+            pydantic_fields[field_name] = (
+                keys_schema,
+                FieldInfo(title=field_name, description=field_name),
+            )
+
         # If the extracted fields is a type[pydantic.BaseModel]:
         elif isinstance(field_def, type) and issubclass(field_def, BaseModel):
             related_schema = field_def
@@ -200,9 +336,9 @@ def create_pydantic_model(  # noqa: C901, PLR0912, PLR0915, WPS210, WPS231 # NOS
                     field_type_registry=field_type_registry,
                     field_name=field_name,
                     bases=bases,
-                    model_name=model_name,
                     related_django_model_name=related_django_model_name,
                     related_model_fields=related_model_fields,
+                    defer_build=defer_build,
                 )
             except ValueError as e:
                 errors.append(str(e))
@@ -237,6 +373,13 @@ def create_pydantic_model(  # noqa: C901, PLR0912, PLR0915, WPS210, WPS231 # NOS
         )
         raise AttributeError(msg)
 
+    if (
+        disk_cache is not None
+        and disk_cache_key is not None
+        and inferred_fields.keys() != disk_cached_fields.keys()
+    ):
+        disk_cache.store(disk_cache_key, inferred_fields)
+
     # Finally, create the Pydantic model:
     # https://docs.pydantic.dev/2.9/concepts/models/#dynamic-model-creation
     return create_model(
@@ -246,7 +389,7 @@ def create_pydantic_model(  # noqa: C901, PLR0912, PLR0915, WPS210, WPS231 # NOS
         __doc__=None,
         __module__=__name__,
         __validators__=validators,
-        __cls_kwargs__=None,
+        __cls_kwargs__={"defer_build": True} if defer_build else None,
         **pydantic_fields,
     )
 
@@ -302,16 +445,184 @@ def _get_field_info(
     return field_name, field_def
 
 
+def _get_schema_cache_key(  # noqa: PLR0913
+    *,
+    django_model: type[Model],
+    field_type_registry: FieldTypeRegistry,
+    fields: ModelFields | ModelFieldsCompact,
+    bases: tuple[type[BaseModel], ...] | None,
+    model_name: str | None,
+    defer_build: bool,
+) -> SchemaCacheKey:
+    """Return the key under which the built Pydantic model is memoized.
+
+    Raises:
+        _UncacheableFieldsError: If the fields definition contains unhashable values.
+    """
+    return (
+        django_model,
+        field_type_registry,
+        field_type_registry.revision,
+        _canonical_value(field_type_registry.options),
+        _canonical_fields(fields),
+        bases,
+        model_name,
+        defer_build,
+    )
+
+
+def _get_disk_cache_key(
+    *,
+    django_model: type[Model],
+    field_type_registry: FieldTypeRegistry,
+    fields: ModelFields | ModelFieldsCompact,
+) -> str:
+    """Return the key of the inferred fields in the persistent on-disk cache.
+
+    The key is a fingerprint of everything the inferred fields depend on: the
+    django2pydantic version, the Django model's fields, the properties used in the
+    fields definition, the registered field type handlers with the versions of their
+    packages, the registry options, the database vendor and the fields definition
+    itself. The code of the handlers is not part of the key.
+    """
+    from django2pydantic import __version__  # noqa: PLC0415
+
+    try:
+        fields_repr = stable_repr(_canonical_fields(fields))
+    except _UncacheableFieldsError:
+        fields_repr = stable_repr(fields)
+
+    field_names = (_get_field_info(field, fields)[0] for field in fields or ())
+    properties = {
+        name: _describe_property(getattr(django_model, name))
+        for name in field_names
+        if has_property(django_model, name)
+    }
+
+    return fingerprint(
+        __version__,
+        django_model._meta.label,  # noqa: SLF001
+        _describe_model_fields(django_model),
+        properties,
+        _describe_handlers(field_type_registry.handlers),
+        field_type_registry.options,
+        field_type_registry.database_vendor,
+        fields_repr,
+    )
+
+
+def _describe_model_fields(django_model: type[Model]) -> list[object]:
+    """Describe the Django model fields for fingerprinting purposes."""
+    description: list[object] = []
+    for field in django_model._meta.get_fields(include_hidden=True):  # noqa: SLF001
+        if isinstance(field, Field):
+            description.append(field.deconstruct())
+        else:
+            description.append((type(field), field.name))
+        related_model = field.related_model
+        if isinstance(related_model, type) and issubclass(related_model, Model):
+            description.append(related_model._meta.pk.deconstruct())  # noqa: SLF001  # pyright: ignore [reportOptionalMemberAccess]
+        if isinstance(field, ForeignKey):
+            description.append(field.target_field.deconstruct())
+    return description
+
+
+def _describe_handlers(handlers: Mapping[type, type]) -> dict[type, tuple[object, ...]]:
+    """Describe the field type handlers for fingerprinting purposes."""
+    description: dict[type, tuple[object, ...]] = {}
+    for field_class, handler_class in handlers.items():
+        package = sys.modules.get(handler_class.__module__.partition(".")[0])
+        description[field_class] = (
+            handler_class,
+            getattr(package, "__version__", None),
+        )
+    return description
+
+
+def _describe_property(prop: property) -> tuple[object, ...]:
+    """Describe a property for fingerprinting purposes."""
+    func = prop.fget
+    return (
+        func,
+        getattr(func, "__annotations__", {}).get("return"),
+        getattr(func, "__doc__", None),
+        getattr(func, "deprecated", False),
+    )
+
+
+def _canonical_fields(
+    fields: ModelFields | ModelFieldsCompact,
+) -> tuple[tuple[str, Hashable], ...]:
+    """Return a canonical, hashable form of the fields definition.
+
+    Both the dict based `ModelFields` and the sequence based `ModelFieldsCompact`
+    are reduced to the same ordered tuple of `(field_name, field_definition)` pairs.
+    """
+    if fields is None:
+        return ()
+    field_infos = (_get_field_info(field, fields) for field in fields)
+    return tuple(
+        (field_name, _canonical_field_def(field_def))
+        for field_name, field_def in field_infos
+    )
+
+
+def _canonical_field_def(field_def: Any) -> Hashable:  # noqa: ANN401  # pyright: ignore [reportExplicitAny]
+    """Return a canonical, hashable form of a single field definition."""
+    if isinstance(field_def, InferExcept):
+        return (InferExcept, _canonical_value(field_def.args))
+    if isinstance(field_def, dict):
+        return (dict, _canonical_fields(cast("ModelFields", field_def)))
+    if isinstance(field_def, list):
+        return (list, tuple(_canonical_value(item) for item in field_def))  # pyright: ignore [reportUnknownVariableType]
+    return _canonical_value(field_def)
+
+
+def _canonical_value(value: Any) -> Hashable:  # noqa: ANN401  # pyright: ignore [reportExplicitAny]
+    """Return a hashable form of an arbitrary value.
+
+    Every value is tagged with its type, so that equal values of different types,
+    e.g. `1`, `1.0` and `True` or lists and tuples, are kept apart.
+
+    Raises:
+        _UncacheableFieldsError: If the value can not be made hashable.
+    """
+    if isinstance(value, Mapping):
+        items = cast("Mapping[object, object]", value).items()
+        return (
+            type(value),
+            frozenset(
+                (_canonical_value(key), _canonical_value(item)) for key, item in items
+            ),
+        )
+    if isinstance(value, list | tuple):
+        return (type(value), tuple(_canonical_value(item) for item in value))  # pyright: ignore [reportUnknownVariableType]
+    if isinstance(value, set | frozenset):
+        return (type(value), frozenset(_canonical_value(item) for item in value))  # pyright: ignore [reportUnknownVariableType]
+    try:
+        _ = hash(value)
+    except TypeError as e:
+        msg = f"Field definition value {value!r} is not hashable."
+        raise _UncacheableFieldsError(msg) from e
+    return (type(value), value)
+
+
 def _recursively_create_related_schema(  # noqa: PLR0913
     *,
     django_model: type[Model],
     field_type_registry: FieldTypeRegistry,
     field_name: str,
     bases: tuple[type[BaseModel], ...] | None,
-    model_name: str,
     related_django_model_name: str,
     related_model_fields: ModelFields | ModelFieldsCompact,
+    defer_build: bool,
 ) -> type[BaseModel]:
+    """Create the nested schema of a related model.
+
+    Nested schemas are not tied to the parent schema: the same related model and
+    fields definition resolve to the same (memoized) nested schema and name under
+    every parent schema.
+    """
     related_django_model = django_model._meta.get_field(  # noqa: SLF001, WPS437 # pyright: ignore[reportUnknownMemberType]
         field_name=related_django_model_name,
     ).related_model
@@ -346,11 +657,128 @@ def _recursively_create_related_schema(  # noqa: PLR0913
         nested_dj_model,
         field_type_registry,
         related_model_fields,
-        model_name=f"{model_name}_{related_django_model_name}",
+        model_name=_get_related_schema_name(
+            nested_dj_model, field_type_registry, related_model_fields
+        ),
         bases=bases,
+        defer_build=defer_build,
     )
 
 
+def _get_related_schema_name(
+    django_model: type[Model],
+    field_type_registry: FieldTypeRegistry,
+    fields: ModelFields | ModelFieldsCompact,
+) -> str:
+    """Return a stable name for a nested schema of the given related model.
+
+    The name is derived from the Django model name and a digest of the fields
+    definition and the registry's handlers and options, so it does not depend on the
+    parent schema, is the same across processes and differs between registries
+    building different types.
+    """
+    digest = _get_fields_digest(
+        fields, field_type_registry.handlers, field_type_registry.options
+    )
+    return f"{django_model.__name__}Schema_{digest}"
+
+
+def _get_fields_digest(
+    fields: ModelFields | ModelFieldsCompact,
+    *context: object,
+) -> str:
+    """Return a short digest of a fields definition, stable across processes.
+
+    The context, e.g. the registry options, is included in the digest.
+    """
+    try:
+        fields_repr = stable_repr(_canonical_fields(fields))
+    except _UncacheableFieldsError:
+        fields_repr = stable_repr(fields)
+    return fingerprint(*context, fields_repr)[:8]
+
+
+def _create_json_keys_schema(
+    *,
+    django_model: type[Model],
+    path: tuple[str, ...],
+    keys_fields: ModelFields | ModelFieldsCompact,
+    bases: tuple[type[BaseModel], ...] | None,
+) -> type[BaseModel]:
+    """Create the schema of the keys read from the documents of a JSON field.
+
+    Inferred keys accept any JSON value and read as None when missing. The type of a
+    key can be given with InferExcept(annotation=...) or a FieldInfo, and the keys
+    of nested objects with a nested fields definition.
+
+    Raises:
+        ValueError: If a key definition is not supported.
+    """
+    pydantic_fields: PydanticFields = {}
+    for key in keys_fields or ():
+        key_name, key_def = _get_field_info(key, keys_fields)
+        if key_def is Infer:
+            pydantic_fields[key_name] = (Any, FieldInfo(default=None))
+        elif isinstance(key_def, InferExcept):
+            pydantic_fields[key_name] = override_type_and_meta(  # pyright: ignore [reportArgumentType]
+                pydantic_type=Any,  # pyright: ignore [reportArgumentType]
+                field_info=FieldInfo(default=None),
+                overrides=key_def,
+            )
+        elif isinstance(key_def, FieldInfo):
+            annotation = Any if key_def.annotation is None else key_def.annotation  # pyright: ignore [reportAny]
+            pydantic_fields[key_name] = (annotation, key_def)
+        elif isinstance(key_def, dict | list):
+            nested_schema = _create_json_keys_schema(
+                django_model=django_model,
+                path=(*path, key_name),
+                keys_fields=key_def,  # pyright: ignore [reportUnknownArgumentType]
+                bases=bases,
+            )
+            pydantic_fields[key_name] = (nested_schema | None, FieldInfo(default=None))
+        else:
+            msg = (
+                f"Invalid definition for the key '{'.'.join((*path, key_name))}' "
+                f"of the JSON field in the Django model '{django_model.__name__}'. "
+                f"The key definition was: {key_def}"
+            )
+            raise ValueError(msg)  # noqa: TRY004
+
+    name = "".join(part.title().replace("_", "") for part in path)
+    keys_schema = create_model(
+        f"{django_model.__name__}{name}Keys_{_get_fields_digest(keys_fields)}",
+        __base__=bases,
+        __module__=__name__,
+        **pydantic_fields,  # pyright: ignore [reportArgumentType]
+    )
+    mark_json_keys_schema(keys_schema)
+    return keys_schema
+
+
+def _get_relation_validator(
+    django_field: Field[SetType, GetType] | ForeignObjectRel | GenericForeignKey,
+    field_name: str,
+    python_type: Any,  # noqa: ANN401  # pyright: ignore [reportExplicitAny]
+) -> Any:  # noqa: ANN401  # pyright: ignore [reportExplicitAny]
+    """Choose the validator of an inferred relation field by its type.
+
+    Fields typed as related primary keys replace related instances with their keys
+    before validation, without trying to validate the instances first.
+    """
+    if contains_model(python_type):
+        return field_validator(field_name, mode="wrap")(BaseMixins.validate_relation)
+    # Note: OneToOneRel is a subclass of ManyToOneRel, so it must be checked first.
+    if isinstance(django_field, SINGLE_RELATION_FIELD_TYPES):
+        return field_validator(field_name, mode="before")(
+            BaseMixins.validate_related_pk
+        )
+    if isinstance(django_field, MULTIPLE_RELATION_FIELD_TYPES):
+        return field_validator(field_name, mode="before")(
+            BaseMixins.validate_related_pks
+        )
+    return field_validator(field_name, mode="before")(BaseMixins.validate_related_pk)
+
+
 def _determine_field_type(
     *,
     django_field: Field[SetType, GetType]
@@ -365,14 +793,15 @@ def _determine_field_type(
     default: PydanticUndefined | None = PydanticUndefined  # type: ignore[valid-type]
     field_type: Any  # noqa: F821  # pyright: ignore [reportExplicitAny]
 
-    dj_field_type = type(django_field)
-    if dj_field_type in {ForeignKey, OneToOneField, OneToOneRel}:
+    # Subclasses are matched as well, since handlers are resolved through the MRO.
+    # Note: OneToOneRel is a subclass of ManyToOneRel, so it must be checked first.
+    if isinstance(django_field, SINGLE_RELATION_FIELD_TYPES):
         if django_field.null:  # type: ignore[union-attr]  # type narrowing doesn't work
             field_type = related_schema | None  # noqa: UP007  # pyright: ignore [reportAny]
             default = None  # pyright: ignore [reportUnknownVariableType]
         else:
             field_type = related_schema  # pyright: ignore [reportAny]
-    elif dj_field_type in {ManyToManyField, ManyToManyRel, ManyToOneRel}:
+    elif isinstance(django_field, MULTIPLE_RELATION_FIELD_TYPES):
         # TODO(jhassine): Check if through model is set and if it defines the foreign
         #   key as unique then the return type should not be a list
         #   Ref: https://docs.djangoproject.com/en/dev/ref/models/fields/#django.db.models.ManyToManyField.through_fields
@@ -386,9 +815,9 @@ def _determine_field_type(
         )
         raise TypeError(msg)
 
-    type_handler = field_type_registry.get_handler(django_field)
-    title = type_handler.title
-    description = type_handler.description
+    _, inferred_field_info = field_type_registry.infer_field(django_field)
+    title = inferred_field_info.title
+    description = inferred_field_info.description
 
     return (
         field_type,
@@ -0,0 +1,221 @@
+"""Persistent on-disk cache for the inferred field types of built schemas.
+
+The cache stores, per built schema, the Pydantic types and `FieldInfo`s inferred by the
+field type handlers, so that the next process can skip the handler introspection. It is
+enabled by pointing the `DJANGO2PYDANTIC_CACHE_DIR` Django setting to a directory.
+
+The entries are pickled, so the cache directory must only be writable by trusted users.
+"""
+
+import hashlib
+import io
+import logging
+import os
+import pickle  # noqa: S403
+import re
+import sys
+import tempfile
+from collections.abc import Mapping
+from enum import Enum, IntEnum
+from pathlib import Path
+from types import FunctionType
+from typing import Any, cast, override
+
+from django.conf import settings
+from django.utils.functional import Promise
+from pydantic._internal._fields import (  # pyright: ignore [reportPrivateImportUsage]
+    pydantic_general_metadata,
+)
+from pydantic.fields import FieldInfo
+
+from django2pydantic.handlers.base import CHOICES_KEY_ATTRIBUTE, intern_choices_enum
+from django2pydantic.types import SupportedPydanticTypes
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_SETTING = "DJANGO2PYDANTIC_CACHE_DIR"
+"""Name of the Django setting holding the cache directory."""
+
+type InferredFields = dict[str, tuple[SupportedPydanticTypes, FieldInfo]]
+"""Inferred Pydantic type and field information keyed by the field name."""
+
+_GeneralMetadata = type(pydantic_general_metadata())
+
+_MEMORY_ADDRESS = re.compile(r" at 0x[0-9a-fA-F]+")
+"""The memory addresses in the default representations of objects."""
+
+
+def stable_repr(value: Any) -> str:  # noqa: ANN401, PLR0911  # pyright: ignore [reportExplicitAny]
+    """Return a representation of the value that is stable across processes.
+
+    Lazy translation strings are resolved, mappings are sorted, classes and
+    functions are represented by their qualified names, objects without a
+    representation of their own, e.g. validators, by their arguments or attributes,
+    and memory addresses are left out of the other representations.
+    """
+    if isinstance(value, Promise):
+        return repr(str(value))
+    if isinstance(value, Mapping):
+        items = cast("Mapping[object, object]", value).items()
+        items_repr = sorted(f"{stable_repr(k)}: {stable_repr(v)}" for k, v in items)
+        return "{" + ", ".join(items_repr) + "}"
+    if isinstance(value, list | tuple):
+        items_repr = ", ".join(stable_repr(item) for item in value)  # pyright: ignore [reportUnknownVariableType]
+        return f"{type(value).__name__}({items_repr})"  # pyright: ignore [reportUnknownArgumentType]
+    if isinstance(value, set | frozenset):
+        items_repr = sorted(stable_repr(item) for item in value)  # pyright: ignore [reportUnknownVariableType]
+        return "{" + ", ".join(items_repr) + "}"
+    if isinstance(value, type | FunctionType):
+        return f"{value.__module__}.{value.__qualname__}"
+    if isinstance(value, property):
+        return f"property({stable_repr(value.fget)})"
+    if type(value).__repr__ is object.__repr__:
+        state = _get_state(value)
+        if state is not None:
+            return f"{stable_repr(type(value))}({stable_repr(state)})"
+    return _MEMORY_ADDRESS.sub("", repr(value))
+
+
+def _get_state(value: object) -> object | None:
+    """Get the arguments or attributes an object without a representation is made of.
+
+    E.g. validators are described by their deconstructed arguments.
+    """
+    deconstruct = getattr(value, "deconstruct", None)
+    if callable(deconstruct):
+        return cast("object", deconstruct())
+    return getattr(value, "__dict__", None)
+
+
+def fingerprint(*parts: Any) -> str:  # noqa: ANN401  # pyright: ignore [reportExplicitAny]
+    """Return a digest of the stable representation of the given parts."""
+    return hashlib.sha256(stable_repr(parts).encode()).hexdigest()
+
+
+def _is_importable(cls: type[object]) -> bool:
+    """Check whether the class can be pickled by reference."""
+    module = sys.modules.get(cls.__module__)
+    obj: object = module
+    for attr in cls.__qualname__.split("."):
+        obj = getattr(obj, attr, None)
+    return obj is cls
+
+
+def _rebuild_enum(
+    enum_base: type[Enum],
+    name: str,
+    members: list[tuple[str, Any]],  # pyright: ignore [reportExplicitAny]
+    module: str,
+) -> type[Enum]:
+    """Rebuild a dynamically created Enum class which is not interned."""
+    return cast("type[Enum]", enum_base(name, members, module=module))
+
+
+def _rebuild_field_info(slots: dict[str, Any]) -> FieldInfo:  # pyright: ignore [reportExplicitAny]
+    """Rebuild a FieldInfo from its slot values."""
+    field_info = FieldInfo.__new__(FieldInfo)
+    for name, value in slots.items():
+        object.__setattr__(field_info, name, value)  # noqa: PLC2801
+    return field_info
+
+
+def _rebuild_general_metadata(metadata: dict[str, Any]) -> object:  # pyright: ignore [reportExplicitAny]
+    """Rebuild Pydantic's general metadata (e.g. `pattern` and `max_digits`)."""
+    return pydantic_general_metadata(**metadata)
+
+
+class _InferredFieldsPickler(pickle.Pickler):
+    """Pickler supporting the dynamically created objects found in inferred fields."""
+
+    @override
+    def reducer_override(self, obj: Any) -> Any:  # noqa: ANN401  # pyright: ignore [reportExplicitAny, reportImplicitOverride]
+        if isinstance(obj, FieldInfo):
+            slots = {
+                name: getattr(obj, name)
+                for name in FieldInfo.__slots__
+                if hasattr(obj, name)
+            }
+            return _rebuild_field_info, (slots,)
+        if isinstance(obj, _GeneralMetadata):
+            return _rebuild_general_metadata, (dict(vars(obj)),)
+        if isinstance(obj, type) and issubclass(obj, Enum) and not _is_importable(obj):
+            choices_key = obj.__dict__.get(CHOICES_KEY_ATTRIBUTE)
+            if choices_key is not None:
+                return intern_choices_enum, choices_key
+            enum_base = IntEnum if issubclass(obj, IntEnum) else Enum
+            members = [(member.name, member.value) for member in obj]
+            return _rebuild_enum, (enum_base, obj.__name__, members, obj.__module__)
+        return NotImplemented
+
+
+class SchemaDiskCache:
+    """Directory of pickled inferred fields keyed by a schema fingerprint."""
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        """Initialize the cache.
+
+        Args:
+            directory: The directory where the cache entries are stored.
+        """
+        self.directory: Path = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.pickle"
+
+    def load(self, key: str) -> InferredFields | None:
+        """Load the inferred fields stored under the key.
+
+        Returns:
+            The inferred fields or None if there is no usable entry.
+        """
+        try:
+            with self._path(key).open("rb") as file:
+                return cast("InferredFields", pickle.load(file))  # noqa: S301
+        except FileNotFoundError:
+            return None
+        except Exception:  # noqa: BLE001
+            logger.debug("Ignoring unreadable schema cache entry '%s'", key)
+            return None
+
+    def store(self, key: str, inferred_fields: InferredFields) -> None:
+        """Store the inferred fields under the key.
+
+        Entries that can not be pickled or written, e.g. to a read-only directory,
+        are skipped.
+        """
+        buffer = io.BytesIO()
+        try:
+            _InferredFieldsPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(
+                inferred_fields
+            )
+        except (pickle.PicklingError, AttributeError, TypeError):
+            logger.debug("Skipping schema cache entry '%s': not picklable", key)
+            return
+
+        temp_path: Path | None = None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Write atomically so that concurrently starting processes never read a
+            # partially written entry:
+            with tempfile.NamedTemporaryFile(
+                dir=self.directory, suffix=".tmp", delete=False
+            ) as file:
+                temp_path = Path(file.name)
+                _ = file.write(buffer.getvalue())
+            _ = temp_path.replace(self._path(key))
+        except OSError:
+            logger.debug("Skipping schema cache entry '%s': not writable", key)
+            if temp_path is not None:
+                temp_path.unlink(missing_ok=True)
+
+
+def get_disk_cache() -> SchemaDiskCache | None:
+    """Return the on-disk cache configured with the Django settings, if any."""
+    if not settings.configured:
+        return None
+    directory = cast(
+        "str | os.PathLike[str] | None", getattr(settings, CACHE_DIR_SETTING, None)
+    )
+    if not directory:
+        return None
+    return SchemaDiskCache(directory)
@@ -0,0 +1,450 @@
+"""Ahead-of-time code generation of static schema modules.
+
+Renders the Pydantic models built from Django models into plain Python source, so
+that production code can import ordinary `BaseModel` classes with explicit
+annotations, constraints and enums instead of building them at import time.
+
+Example:
+```python
+from django2pydantic.codegen import write_module
+
+from myapp.schemas import AuthorSchema, BookSchema
+
+write_module("myapp/generated_schemas.py", AuthorSchema, BookSchema)
+```
+"""
+
+import builtins
+import dataclasses
+import keyword
+import math
+import re
+import sys
+from collections.abc import Iterable, Mapping
+from datetime import date, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from os import PathLike
+from pathlib import Path
+from types import NoneType, UnionType
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    Literal,
+    Union,
+    cast,
+    get_args,
+    get_origin,
+)
+from uuid import UUID
+
+from django.utils.functional import Promise
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic._internal._fields import (  # pyright: ignore [reportPrivateImportUsage]
+    pydantic_general_metadata,
+)
+from pydantic.fields import FieldInfo
+from pydantic_core import PydanticUndefined
+
+from django2pydantic.schema import SchemaConfig, build_schema
+
+if TYPE_CHECKING:
+    from pydantic._internal._decorators import (  # pyright: ignore [reportPrivateImportUsage]
+        DecoratorInfos,
+    )
+
+__all__ = [
+    "CodegenError",
+    "generate_module",
+    "write_module",
+]
+
+_GeneralMetadata = type(pydantic_general_metadata())
+
+_HEADER = '"""Generated by django2pydantic. Do not edit manually."""'
+
+_DECORATOR_KINDS = (
+    "validators",
+    "field_validators",
+    "root_validators",
+    "field_serializers",
+    "model_serializers",
+    "model_validators",
+    "computed_fields",
+)
+
+
+class CodegenError(ValueError):
+    """Raised when a schema can not be rendered to Python source."""
+
+
+def generate_module(
+    *schemas: type[BaseModel] | SchemaConfig[Any],  # pyright: ignore [reportExplicitAny]
+    header: str = _HEADER,
+) -> str:
+    """Render the schemas and the nested schemas and enums they use to source code.
+
+    Args:
+        schemas: The schemas to render, either as built Pydantic models (e.g.
+            `BaseSchema` subclasses) or as schema configurations.
+        header: The module docstring of the generated module.
+
+    Returns:
+        The source code of the generated module.
+
+    Raises:
+        CodegenError: If a schema uses a value which can not be rendered, e.g. a
+            lambda or a locally defined class.
+    """
+    return _ModuleRenderer().render(
+        [
+            build_schema(schema) if isinstance(schema, SchemaConfig) else schema
+            for schema in schemas
+        ],
+        header=header,
+    )
+
+
+def write_module(
+    path: str | PathLike[str],
+    *schemas: type[BaseModel] | SchemaConfig[Any],  # pyright: ignore [reportExplicitAny]
+    header: str = _HEADER,
+) -> None:
+    """Render the schemas with `generate_module` and write the source to the path."""
+    _ = Path(path).write_text(generate_module(*schemas, header=header))
+
+
+def _is_identifier(name: str) -> bool:
+    return name.isidentifier() and not keyword.iskeyword(name)
+
+
+def _resolve(module_name: str, qualname: str) -> object:
+    """Resolve the object by its module and qualified name, if importable."""
+    obj: object = sys.modules.get(module_name)
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr, None)
+    return obj
+
+
+class _ModuleRenderer:  # noqa: WPS214
+    """Render Pydantic models and their dependencies to a Python module."""
+
+    def __init__(self) -> None:
+        self._imports: dict[str, dict[str, str]] = {}
+        """Imported names (alias -> name) keyed by the module name."""
+        self._imported: dict[str, object] = {}
+        """Imported objects keyed by their local name."""
+        self._module_imports: set[str] = set()
+        self._names: dict[int, str] = {}
+        """Local names of the generated classes keyed by their id."""
+        self._generated: dict[str, object] = {}
+        """Generated classes keyed by their local name."""
+        self._blocks: list[str] = []
+        self._in_progress: set[int] = set()
+        self._explicit: set[int] = set()
+
+    def render(self, models: list[type[BaseModel]], *, header: str) -> str:
+        self._explicit = {id(model) for model in models}
+        names = [self._model(model) for model in models]
+
+        lines = [header, ""]
+        if self._module_imports:
+            lines.extend(f"import {module}" for module in sorted(self._module_imports))
+        for module in sorted(self._imports):
+            imported = ", ".join(
+                name if name == alias else f"{name} as {alias}"
+                for alias, name in sorted(self._imports[module].items())
+            )
+            lines.append(f"from {module} import {imported}")
+        lines.extend(["", "__all__ = ["])
+        lines.extend(f"    {name!r}," for name in names)
+        lines.append("]")
+        for block in self._blocks:
+            lines.extend(["", "", block])
+        return "\n".join(lines) + "\n"
+
+    def _unique_name(self, name: str) -> str:
+        unique_name = name
+        suffix = 2
+        while (
+            unique_name in self._generated
+            or unique_name in self._imported
+            or unique_name == "__all__"
+            or hasattr(builtins, unique_name)
+        ):
+            unique_name = f"{name}_{suffix}"
+            suffix += 1
+        return unique_name
+
+    def _import_module(self, module: str) -> str:
+        self._module_imports.add(module)
+        return module
+
+    def _reference(
+        self,
+        obj: Any,  # noqa: ANN401  # pyright: ignore [reportExplicitAny]
+        module: str | None = None,
+        qualname: str | None = None,
+    ) -> str:
+        """Return an expression referring to an importable object."""
+        module = module or cast("str | None", getattr(obj, "__module__", None))
+        qualname = qualname or cast("str | None", getattr(obj, "__qualname__", None))
+        if module is None or qualname is None or _resolve(module, qualname) is not obj:
+            msg = f"'{obj!r}' can not be imported in the generated module."
+            raise CodegenError(msg)
+        if module == "builtins":
+            return qualname
+
+        top_level, _, rest = qualname.partition(".")
+        top_level_obj = _resolve(module, top_level)
+        # Prefer the public import path, e.g. `pydantic` over `pydantic.main`:
+        package = module.partition(".")[0]
+        if _resolve(package, top_level) is top_level_obj:
+            module = package
+        alias = next(
+            (
+                alias
+                for alias, imported in self._imported.items()
+                if imported is top_level_obj
+            ),
+            None,
+        )
+        if alias is None:
+            alias = self._unique_name(top_level)
+            self._imports.setdefault(module, {})[alias] = top_level
+            self._imported[alias] = top_level_obj
+        return f"{alias}.{rest}" if rest else alias
+
+    def _type(self, tp: Any) -> str:  # noqa: ANN401, C901, PLR0911  # pyright: ignore [reportExplicitAny]
+        """Return the annotation expression of the type."""
+        if tp is None or tp is NoneType:
+            return "None"
+
+        origin = get_origin(tp)
+        args = get_args(tp)
+        if origin is Annotated:
+            metadata = ", ".join(self._value(item) for item in args[1:])
+            return f"{self._reference(Annotated)}[{self._type(args[0])}, {metadata}]"
+        if origin in {Union, UnionType}:
+            return " | ".join(self._type(arg) for arg in args)
+        if origin is Literal:
+            values = ", ".join(self._value(arg) for arg in args)
+            return f"{self._reference(Literal)}[{values}]"
+        if origin is not None:
+            items = ", ".join(self._type(arg) for arg in args)
+            return f"{self._type(origin)}[{items}]"
+
+        if isinstance(tp, type):
+            if issubclass(tp, BaseModel) and (
+                id(tp) in self._explicit
+                or _resolve(tp.__module__, tp.__qualname__) is not tp
+            ):
+                return self._model(tp)
+            if (
+                issubclass(tp, Enum)
+                and _resolve(tp.__module__, tp.__qualname__) is not tp
+            ):
+                return self._enum(tp)
+        return self._reference(tp)
+
+    def _value(self, value: Any) -> str:  # noqa: ANN401, C901, PLR0911, PLR0912  # pyright: ignore [reportExplicitAny]
+        """Return an expression evaluating to the value."""
+        if value is None or isinstance(value, bool | int | str | bytes):
+            return repr(value)
+        if isinstance(value, float):
+            return repr(value) if math.isfinite(value) else f"float({str(value)!r})"
+        if isinstance(value, Promise):
+            return repr(str(value))
+        if isinstance(value, Enum):
+            return f"{self._type(type(value))}[{value.name!r}]"
+        if isinstance(value, re.Pattern):
+            pattern = cast("re.Pattern[str]", value)
+            flags = "" if pattern.flags == re.UNICODE else f", {pattern.flags}"
+            return f"{self._import_module('re')}.compile({pattern.pattern!r}{flags})"
+        if isinstance(value, Mapping):
+            items = cast("Mapping[object, object]", value).items()
+            return (
+                "{"
+                + ", ".join(f"{self._value(k)}: {self._value(v)}" for k, v in items)
+                + "}"
+            )
+        if isinstance(value, list):
+            return "[" + ", ".join(self._value(item) for item in value) + "]"  # pyright: ignore [reportUnknownVariableType]
+        if isinstance(value, tuple):
+            items = [self._value(item) for item in value]  # pyright: ignore [reportUnknownVariableType]
+            return "(" + ", ".join(items) + ("," if len(items) == 1 else "") + ")"
+        if isinstance(value, set | frozenset):
+            items = sorted(self._value(item) for item in value)  # pyright: ignore [reportUnknownVariableType]
+            return f"{type(value).__name__}([{', '.join(items)}])"  # pyright: ignore [reportUnknownArgumentType]
+        if isinstance(value, Decimal | UUID):
+            return f"{self._reference(type(value))}({str(value)!r})"
+        if isinstance(value, date | time):
+            return (
+                f"{self._reference(type(value))}.fromisoformat({value.isoformat()!r})"
+            )
+        if isinstance(value, timedelta):
+            return (
+                f"{self._reference(timedelta)}(days={value.days}, "
+                f"seconds={value.seconds}, microseconds={value.microseconds})"
+            )
+        if value is PydanticUndefined:
+            return self._reference(value, "pydantic_core", "PydanticUndefined")
+        if isinstance(value, _GeneralMetadata):
+            return self._call(Field, vars(value))
+        if isinstance(value, type) or callable(value):
+            return (
+                self._type(value) if isinstance(value, type) else self._reference(value)
+            )
+        if dataclasses.is_dataclass(value):
+            return self._call(type(value), self._dataclass_kwargs(value))
+        msg = f"Value '{value!r}' can not be rendered in the generated module."
+        raise CodegenError(msg)
+
+    def _call(self, func: Any, kwargs: Mapping[str, object]) -> str:  # noqa: ANN401  # pyright: ignore [reportExplicitAny]
+        arguments = ", ".join(
+            f"{key}={self._value(value)}" for key, value in kwargs.items()
+        )
+        return f"{self._reference(func)}({arguments})"
+
+    @staticmethod
+    def _dataclass_kwargs(value: Any) -> dict[str, object]:  # noqa: ANN401  # pyright: ignore [reportExplicitAny]
+        """Return the non-default init arguments of the dataclass instance."""
+        kwargs: dict[str, object] = {}
+        for field in dataclasses.fields(value):
+            if not field.init:
+                continue
+            field_value = cast("object", getattr(value, field.name))
+            if (
+                field.default is not dataclasses.MISSING
+                and field_value is field.default
+            ):
+                continue
+            kwargs[field.name] = field_value
+        return kwargs
+
+    def _enum(self, enum: type[Enum]) -> str:
+        if id(enum) in self._names:
+            return self._names[id(enum)]
+        # Enums with the same name and members are emitted only once:
+        members = [(member.name, member.value) for member in enum]
+        for name, generated in self._generated.items():
+            if (
+                isinstance(generated, type)
+                and issubclass(generated, Enum)
+                and generated.__name__ == enum.__name__
+                and generated.__bases__ == enum.__bases__
+                and [(member.name, member.value) for member in generated] == members
+            ):
+                self._names[id(enum)] = name
+                return name
+
+        name = self._unique_name(enum.__name__)
+        self._names[id(enum)] = name
+        self._generated[name] = enum
+        bases = ", ".join(self._reference(base) for base in enum.__bases__)
+
+        if all(_is_identifier(k) and not k.startswith("_") for k, _ in members):
+            lines = [f"class {name}({bases}):"]
+            lines.extend(f"    {k} = {self._value(v)}" for k, v in members)
+        else:
+            items = ", ".join(f"({k!r}, {self._value(v)})" for k, v in members)
+            lines = [f"{name} = {bases}({enum.__name__!r}, [{items}])"]
+        self._blocks.append("\n".join(lines))
+        return name
+
+    def _model(self, model: type[BaseModel]) -> str:
+        if id(model) in self._names:
+            return self._names[id(model)]
+        if id(model) in self._in_progress:
+            msg = f"Recursive schema '{model.__name__}' is not supported."
+            raise CodegenError(msg)
+        self._in_progress.add(id(model))
+        name = self._unique_name(model.__name__)
+        self._generated[name] = model
+
+        # Render the class body first, so that its dependencies are emitted first:
+        body = [*self._config_lines(model, renamed=name != model.__name__)]
+        fields = [
+            self._field_line(field_name, field_info)
+            for field_name, field_info in model.model_fields.items()
+        ]
+        validators = list(self._validator_lines(model))
+        for section in (fields, validators):
+            if section:
+                body.extend([*([""] if body else []), *section])
+        bases = ", ".join(self._type(base) for base in model.__bases__)
+        self._names[id(model)] = name
+        self._in_progress.discard(id(model))
+
+        lines = [f"class {name}({bases}):"]
+        lines.extend(f"    {line}" if line else "" for line in body or ["pass"])
+        self._blocks.append("\n".join(lines))
+        return name
+
+    def _config_lines(self, model: type[BaseModel], *, renamed: bool) -> Iterable[str]:
+        inherited: dict[str, object] = {}
+        for base in reversed(model.__mro__[1:]):
+            if issubclass(base, BaseModel):
+                inherited.update(base.model_config)
+        own_config = {
+            key: value
+            for key, value in model.model_config.items()
+            if key not in inherited or inherited[key] != value
+        }
+        if renamed:
+            # Keep the JSON schema title of a schema renamed due to a name clash:
+            own_config.setdefault("title", model.__name__)
+        if own_config:
+            yield f"model_config = {self._call(ConfigDict, own_config)}"
+
+    def _field_line(self, name: str, field_info: FieldInfo) -> str:
+        annotation = self._type(field_info.annotation)
+        if field_info.metadata:
+            metadata = ", ".join(self._value(item) for item in field_info.metadata)
+            annotation = f"{self._reference(Annotated)}[{annotation}, {metadata}]"
+
+        kwargs: dict[str, object] = {}
+        for key, value in field_info._attributes_set.items():  # noqa: SLF001  # pyright: ignore [reportPrivateUsage]
+            if key == "annotation" or key in FieldInfo.metadata_lookup:
+                continue
+            if key == "default":
+                if value is not PydanticUndefined:
+                    kwargs[key] = value
+            elif value is not None:
+                kwargs[key] = value
+        return f"{name}: {annotation} = {self._call(Field, kwargs)}"
+
+    def _validator_lines(self, model: type[BaseModel]) -> Iterable[str]:
+        decorators: DecoratorInfos = model.__pydantic_decorators__
+        inherited_names = {
+            name
+            for base in model.__mro__[1:]
+            if issubclass(base, BaseModel) and base is not BaseModel
+            for kind in _DECORATOR_KINDS
+            for name in getattr(base.__pydantic_decorators__, kind)
+        }
+        for kind in _DECORATOR_KINDS:
+            for name, decorator in getattr(decorators, kind).items():
+                if name in inherited_names:
+                    continue
+                if kind != "field_validators" or not _is_identifier(name):
+                    msg = (
+                        f"Decorator '{name}' of schema '{model.__name__}' is not "
+                        f"supported in the generated module."
+                    )
+                    raise CodegenError(msg)
+                info = decorator.info
+                kwargs: dict[str, object] = {"mode": info.mode}
+                if info.check_fields is not None:
+                    kwargs["check_fields"] = info.check_fields
+                if info.json_schema_input_type is not PydanticUndefined:
+                    kwargs["json_schema_input_type"] = info.json_schema_input_type
+                fields = ", ".join(repr(field) for field in info.fields)
+                arguments = ", ".join(
+                    [fields, *(f"{k}={self._value(v)}" for k, v in kwargs.items())]
+                )
+                yield (
+                    f"{name} = {self._reference(field_validator)}({arguments})"
+                    f"({self._reference(decorator.func)})"
+                )
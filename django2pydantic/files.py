@@ -0,0 +1,163 @@
+"""Resolvers of the URLs of the files read from FileFields and ImageFields.
+
+The files of many instances are resolved with a single call, so that resolvers can
+build the URLs in bulk, e.g. sign them with one request to the storage service. The
+resolver is selected with the `DJANGO2PYDANTIC_FILE_URL_RESOLVER` Django setting,
+given as a callable or its dotted import path:
+
+```
+DJANGO2PYDANTIC_FILE_URL_RESOLVER = "django2pydantic.files.file_names"
+```
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from functools import lru_cache
+from typing import TYPE_CHECKING, cast
+
+from django.conf import settings
+from django.db.models.fields.files import FieldFile
+from django.utils.encoding import filepath_to_uri
+from django.utils.module_loading import import_string
+
+if TYPE_CHECKING:
+    from django.core.files.storage import Storage
+
+__all__ = [
+    "FILE_URL_RESOLVER_SETTING",
+    "CachedFileURLs",
+    "FileURLResolver",
+    "PrefixedFileURLs",
+    "file_names",
+    "file_urls",
+    "get_file_url_resolver",
+    "resolve_file_urls",
+]
+
+FILE_URL_RESOLVER_SETTING = "DJANGO2PYDANTIC_FILE_URL_RESOLVER"
+"""Name of the Django setting holding the file URL resolver."""
+
+type FileURLResolver = Callable[[Sequence[FieldFile]], list[str | None]]
+"""Resolve the URLs of files, None for the empty files."""
+
+
+def file_urls(files: Sequence[FieldFile]) -> list[str | None]:
+    """Resolve the URLs of files with their storages' url(). The default resolver."""
+    return [file.url if file else None for file in files]
+
+
+def file_names(files: Sequence[FieldFile]) -> list[str | None]:
+    """Read the stored names of files, without building URLs."""
+    return [file.name if file else None for file in files]
+
+
+class PrefixedFileURLs:
+    """Resolve the URLs of files by joining a base URL and the files' names.
+
+    Equivalent to the url() of FileSystemStorage, without calling the storage per file.
+    The base URL defaults to the `base_url` of each file's storage, e.g. `MEDIA_URL`.
+    """
+
+    def __init__(self, base_url: str | None = None) -> None:
+        """Initialize the resolver.
+
+        Args:
+            base_url: The URL the names are joined to.
+        """
+        self.base_url: str | None = base_url
+
+    def __call__(self, files: Sequence[FieldFile]) -> list[str | None]:
+        """Resolve the URLs of files."""
+        base_urls: dict[Storage, str] = {}
+        urls: list[str | None] = []
+        for file in files:
+            if not file:
+                urls.append(None)
+                continue
+            base_url = self.base_url
+            if base_url is None:
+                try:
+                    base_url = base_urls[file.storage]
+                except KeyError:
+                    base_url = base_urls[file.storage] = cast(
+                        "str", getattr(file.storage, "base_url", "")
+                    )
+            urls.append(base_url + filepath_to_uri(file.name).lstrip("/"))  # pyright: ignore [reportArgumentType]
+        return urls
+
+
+class CachedFileURLs:
+    """Cache the URLs of the recently resolved files by their storages and names.
+
+    The files missing from the cache are resolved with a single call of the wrapped
+    resolver.
+    """
+
+    def __init__(
+        self,
+        resolver: FileURLResolver = file_urls,
+        maxsize: int = 10_000,
+    ) -> None:
+        """Initialize the resolver.
+
+        Args:
+            resolver: The resolver of the files missing from the cache.
+            maxsize: The maximum number of cached URLs.
+        """
+        self.resolver: FileURLResolver = resolver
+        self.maxsize: int = maxsize
+        self._urls: OrderedDict[tuple[Storage, str], str | None] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def __call__(self, files: Sequence[FieldFile]) -> list[str | None]:
+        """Resolve the URLs of files."""
+        urls: list[str | None] = []
+        missing: dict[int, FieldFile] = {}
+        with self._lock:
+            for index, file in enumerate(files):
+                url = None
+                if file:
+                    key = (file.storage, cast("str", file.name))
+                    try:
+                        url = self._urls[key]
+                        self._urls.move_to_end(key)
+                    except KeyError:
+                        missing[index] = file
+                urls.append(url)
+        if not missing:
+            return urls
+
+        resolved = self.resolver(list(missing.values()))
+        with self._lock:
+            for (index, file), url in zip(missing.items(), resolved, strict=True):
+                urls[index] = self._urls[file.storage, cast("str", file.name)] = url
+            while len(self._urls) > self.maxsize:
+                _ = self._urls.popitem(last=False)
+        return urls
+
+
+@lru_cache(maxsize=8)
+def _import_resolver(path: str) -> FileURLResolver:
+    """Import a resolver by its dotted path."""
+    return cast("FileURLResolver", import_string(path))
+
+
+def get_file_url_resolver() -> FileURLResolver:
+    """Return the file URL resolver configured with the Django settings, if any."""
+    if not settings.configured:
+        return file_urls
+    resolver = cast(
+        "FileURLResolver | str | None",
+        getattr(settings, FILE_URL_RESOLVER_SETTING, None),
+    )
+    if resolver is None:
+        return file_urls
+    if isinstance(resolver, str):
+        return _import_resolver(resolver)
+    return resolver
+
+
+def resolve_file_urls(files: Sequence[FieldFile]) -> list[str | None]:
+    """Resolve the URLs of files with the configured resolver."""
+    return get_file_url_resolver()(files)
@@ -1,16 +1,561 @@
 """Getter for Pydantic related Django models."""
 
-from typing import Any
+import inspect
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, override
+from weakref import WeakKeyDictionary
 
-from django.db.models import Manager, QuerySet
+from django.db.models import (
+    FileField,
+    JSONField,
+    Manager,
+    ManyToManyField,
+    ManyToManyRel,
+    ManyToOneRel,
+    Model,
+    QuerySet,
+)
 from django.db.models.fields.files import FieldFile
+from pydantic import BaseModel
+
+from django2pydantic.files import resolve_file_urls
+from django2pydantic.utils import contains_model, find_model
 
 __all__ = [
+    "BatchAccessor",
     "DjangoGetter",
+    "FileURLs",
+    "JSONKeys",
+    "ModelValues",
+    "RelatedKeys",
+    "get_accessor_plan",
+    "get_json_keys_schema",
+    "get_key_paths",
+    "get_key_tree",
+    "get_model_attributes",
+    "mark_json_keys_schema",
+    "nest_values",
+    "read_attributes",
+    "read_attributes_many",
 ]
 
 Result = list[Any] | list[Any] | None | str | Any
 
+type Accessor = Callable[[Any], Result]
+type AccessorPlan = tuple[tuple[str, Accessor], ...]
+type SplitPlan = tuple[tuple[str, tuple[str, ...]], ...]
+type KeyTree = tuple[tuple[str, KeyTree | None], ...]
+
+JSON_KEYS_SCHEMA_ATTRIBUTE = "__d2p_json_keys__"
+"""Class attribute marking the schemas of the keys read from JSON fields."""
+
+_accessor_plans: WeakKeyDictionary[
+    type[BaseModel], dict[type[Model], AccessorPlan | None]
+] = WeakKeyDictionary()
+
+
+def convert_result(result: Any) -> Result:  # noqa: ANN401  # pyright: ignore [reportExplicitAny]
+    """Convert the result to a serializable format."""
+    if isinstance(result, Manager):
+        return list(result.all())
+
+    if isinstance(result, getattr(QuerySet, "__origin__", QuerySet)):
+        return list(result)
+
+    if callable(result):
+        return result()
+
+    if isinstance(result, FieldFile):
+        return resolve_file_urls([result])[0]
+
+    return result
+
+
+class BatchAccessor(ABC):
+    """Accessor which can read the values of many instances at once."""
+
+    __slots__: tuple[str, ...] = ()
+
+    @abstractmethod
+    def __call__(self, obj: Model) -> Result:
+        """Return the value of an instance."""
+
+    @abstractmethod
+    def read_many(self, objects: list[Model]) -> list[Result]:
+        """Return the values of the instances, in the same order."""
+
+
+class FileURLs(BatchAccessor):
+    """Accessor for the URLs of a file field.
+
+    The URLs are resolved with the resolver configured with the
+    `DJANGO2PYDANTIC_FILE_URL_RESOLVER` setting, with one call for many instances.
+    """
+
+    __slots__: tuple[str, ...] = ("name",)
+
+    def __init__(self, name: str) -> None:
+        """Initialize the accessor.
+
+        Args:
+            name: The name of the file field.
+        """
+        self.name: str = name
+
+    @override
+    def __call__(self, obj: Model) -> str | None:
+        return resolve_file_urls([getattr(obj, self.name)])[0]
+
+    @override
+    def read_many(self, objects: list[Model]) -> list[Result]:
+        return resolve_file_urls([getattr(obj, self.name) for obj in objects])  # pyright: ignore [reportReturnType]
+
+
+def _get_related_list(name: str) -> Accessor:
+    """Return an accessor for the related objects of a to-many relation."""
+
+    def get_related_list(obj: Model) -> list[Model]:
+        return list(getattr(obj, name).all())
+
+    return get_related_list
+
+
+class RelatedKeys(BatchAccessor):
+    """Accessor for the related keys of a to-many relation.
+
+    A single instance is read through its related manager, while the keys of many
+    instances are loaded in bulk with one values_list() query of the related model.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "lookup",
+        "name",
+        "parent_attname",
+        "prefetch_cache_name",
+        "related_model",
+    )
+
+    def __init__(  # noqa: PLR0913
+        self,
+        name: str,
+        related_model: type[Model],
+        lookup: str,
+        parent_attname: str,
+        prefetch_cache_name: str,
+    ) -> None:
+        """Initialize the accessor.
+
+        Args:
+            name: The attribute name of the related manager.
+            related_model: The related model.
+            lookup: The lookup from the related model to the instances.
+            parent_attname: The attribute of the instances the lookup refers to.
+            prefetch_cache_name: The name under which prefetch_related() caches the
+                related objects of an instance.
+        """
+        self.name: str = name
+        self.related_model: type[Model] = related_model
+        self.lookup: str = lookup
+        self.parent_attname: str = parent_attname
+        self.prefetch_cache_name: str = prefetch_cache_name
+
+    @override
+    def __call__(self, obj: Model) -> list[Model]:
+        """Return the related objects of an instance."""
+        return list(getattr(obj, self.name).all())
+
+    @override
+    def read_many(self, objects: list[Model]) -> list[Result]:
+        """Return the related keys of the instances."""
+        related_keys = self.load(objects)
+        return [
+            related_keys.get(getattr(obj, self.parent_attname), []) for obj in objects
+        ]
+
+    def load(self, objects: list[Model]) -> dict[Any, list[Any]]:  # pyright: ignore [reportExplicitAny]
+        """Load the related keys of the instances by the instances' keys.
+
+        The related objects already loaded with prefetch_related() are used as is.
+        """
+        if all(
+            self.prefetch_cache_name in getattr(obj, "_prefetched_objects_cache", ())
+            for obj in objects
+        ):
+            return {
+                getattr(obj, self.parent_attname): [
+                    related.pk for related in getattr(obj, self.name).all()
+                ]
+                for obj in objects
+            }
+        keys = {getattr(obj, self.parent_attname) for obj in objects} - {None}
+        related_keys: dict[Any, list[Any]] = {}  # pyright: ignore [reportExplicitAny]
+        if not keys:
+            return related_keys
+        rows = (
+            self.related_model._default_manager.db_manager(objects[0]._state.db)  # noqa: SLF001
+            .filter(**{f"{self.lookup}__in": keys})
+            .values_list(self.lookup, "pk")
+        )
+        for key, related_key in rows:
+            related_keys.setdefault(key, []).append(related_key)
+        return related_keys
+
+
+def _get_related_keys(field: Any, name: str) -> Accessor:  # noqa: ANN401  # pyright: ignore [reportExplicitAny]
+    """Return an accessor for the related keys of a to-many relation."""
+    if isinstance(field, ManyToManyField):
+        if field.remote_field.hidden:  # pyright: ignore [reportUnknownMemberType]
+            # The related model can not be queried by the hidden reverse relation
+            return _get_related_list(name)
+        lookup = field.related_query_name()
+        parent_attname = field.model._meta.pk.attname  # noqa: SLF001
+        prefetch_cache_name = field.name
+    elif isinstance(field, ManyToManyRel):
+        lookup = field.field.name
+        parent_attname = field.model._meta.pk.attname  # noqa: SLF001
+        prefetch_cache_name = field.field.related_query_name()
+    elif isinstance(field, ManyToOneRel) and field.one_to_many:
+        lookup = field.field.name
+        parent_attname = field.field.target_field.attname
+        prefetch_cache_name = (
+            field.cache_name  # Django 5.1+
+            if hasattr(type(field), "cache_name")
+            else field.get_cache_name()
+        )
+    else:
+        return _get_related_list(name)
+    return RelatedKeys(
+        name, field.related_model, lookup, parent_attname, prefetch_cache_name
+    )
+
+
+def mark_json_keys_schema(schema: type[BaseModel]) -> None:
+    """Mark a schema as the keys read from the documents of a JSON field."""
+    type.__setattr__(schema, JSON_KEYS_SCHEMA_ATTRIBUTE, True)
+
+
+def get_json_keys_schema(annotation: Any) -> type[BaseModel] | None:  # noqa: ANN401  # pyright: ignore [reportExplicitAny]
+    """Get the schema of the JSON keys in an annotation, if any.
+
+    Other schemas, e.g. the ones JSON field subclasses validate the whole documents
+    with, are not read as keys.
+    """
+    schema = find_model(annotation)
+    if schema is None or not schema.__dict__.get(JSON_KEYS_SCHEMA_ATTRIBUTE, False):
+        return None
+    return schema
+
+
+def get_key_tree(schema: type[BaseModel]) -> KeyTree:
+    """Get the keys a schema reads from JSON documents, and the nested objects' keys."""
+    tree: list[tuple[str, KeyTree | None]] = []
+    for field_name, field_info in schema.model_fields.items():
+        nested_schema = get_json_keys_schema(field_info.annotation)
+        tree.append(
+            (field_name, None if nested_schema is None else get_key_tree(nested_schema))
+        )
+    return tuple(tree)
+
+
+def get_key_paths(prefix: str, tree: KeyTree) -> tuple[str, ...]:
+    """Get the lookups of the keys read from a JSON field, e.g. `settings__theme`."""
+    paths: list[str] = []
+    for key, nested_tree in tree:
+        path = f"{prefix}__{key}"
+        paths.extend(
+            (path,) if nested_tree is None else get_key_paths(path, nested_tree)
+        )
+    return tuple(paths)
+
+
+def _project_document(document: Any, tree: KeyTree) -> "ModelValues":  # noqa: ANN401  # pyright: ignore [reportExplicitAny]
+    """Read the keys of a JSON document. Missing keys are read as None."""
+    if not isinstance(document, dict):
+        document = {}
+    return ModelValues(
+        (
+            key,
+            document.get(key)  # pyright: ignore [reportUnknownMemberType]
+            if nested_tree is None
+            else _project_document(document.get(key), nested_tree),  # pyright: ignore [reportUnknownMemberType]
+        )
+        for key, nested_tree in tree
+    )
+
+
+def _project_annotations(
+    values: dict[str, Any],  # pyright: ignore [reportExplicitAny]
+    prefix: str,
+    tree: KeyTree,
+) -> "ModelValues":
+    """Read the keys of a JSON field from the annotations of their lookups."""
+    return ModelValues(
+        (
+            key,
+            values.get(f"{prefix}__{key}")
+            if nested_tree is None
+            else _project_annotations(values, f"{prefix}__{key}", nested_tree),
+        )
+        for key, nested_tree in tree
+    )
+
+
+class JSONKeys:
+    """Accessor for the keys a schema reads from a JSON field.
+
+    The keys are read from the queryset annotations of their lookups when present,
+    as added by optimize_queryset(), and otherwise from the whole document.
+    """
+
+    __slots__: tuple[str, ...] = ("name", "paths", "tree")
+
+    def __init__(self, name: str, tree: KeyTree) -> None:
+        """Initialize the accessor.
+
+        Args:
+            name: The name of the JSON field.
+            tree: The keys read from the documents.
+        """
+        self.name: str = name
+        self.tree: KeyTree = tree
+        self.paths: tuple[str, ...] = get_key_paths(name, tree)
+
+    def __call__(self, obj: Model) -> "ModelValues":
+        """Return the keys read from the JSON field of an instance."""
+        values = obj.__dict__
+        if self.paths and self.paths[0] in values:
+            return _project_annotations(values, self.name, self.tree)
+        return _project_document(getattr(obj, self.name), self.tree)
+
+
+def _call_method(name: str) -> Accessor:
+    """Return an accessor for the return value of a method."""
+
+    def call_method(obj: Model) -> Result:
+        return getattr(obj, name)()
+
+    return call_method
+
+
+def _get_converted(name: str) -> Accessor:
+    """Return an accessor converting the value of an arbitrary attribute."""
+
+    def get_converted(obj: Model) -> Result:
+        return convert_result(getattr(obj, name))
+
+    return get_converted
+
+
+def get_model_attributes(model: type[Model]) -> dict[str, Any]:  # pyright: ignore [reportExplicitAny]
+    """Map the attribute names of the Django model fields to the fields."""
+    attributes: dict[str, Any] = {}  # pyright: ignore [reportExplicitAny]
+    for field in model._meta.get_fields():  # noqa: SLF001
+        if field.auto_created and not field.concrete:
+            # Reverse relations are accessed by their accessor names
+            attributes[field.get_accessor_name()] = field  # pyright: ignore [reportAttributeAccessIssue, reportUnknownMemberType]
+        else:
+            attributes[field.name] = field
+            attributes.setdefault(getattr(field, "attname", field.name), field)
+    return attributes
+
+
+def _compile_field_accessor(
+    field: Any,  # noqa: ANN401  # pyright: ignore [reportExplicitAny]
+    name: str,
+    *,
+    expects_pk: bool,
+    nested_schema: type[BaseModel] | None,
+) -> Accessor:
+    """Choose the accessor of a Django model field by its kind.
+
+    Forward to-one relations expecting the related object's key are read from the
+    field's attname, without fetching the related object. To-many relations
+    expecting the related objects' keys can be loaded in bulk. JSON fields with
+    nested schemas are read as the keys of the documents.
+    """
+    if expects_pk and field.concrete and (field.many_to_one or field.one_to_one):
+        return attrgetter(field.attname)
+    if field.many_to_many or field.one_to_many:
+        if expects_pk:
+            return _get_related_keys(field, name)
+        return _get_related_list(name)
+    if isinstance(field, FileField):
+        return FileURLs(name)
+    keys_schema = get_json_keys_schema(nested_schema)
+    if isinstance(field, JSONField) and keys_schema is not None:
+        return JSONKeys(name, get_key_tree(keys_schema))
+    return attrgetter(name)
+
+
+def _compile_accessor(
+    model: type[Model],
+    name: str,
+    model_attributes: dict[str, Any],  # pyright: ignore [reportExplicitAny]
+    *,
+    expects_pk: bool = False,
+    nested_schema: type[BaseModel] | None = None,
+) -> Accessor:
+    """Choose the accessor of a Django model attribute by its kind."""
+    field = model_attributes.get(name)
+    if field is not None:
+        return _compile_field_accessor(
+            field, name, expects_pk=expects_pk, nested_schema=nested_schema
+        )
+
+    try:
+        attribute = inspect.getattr_static(model, name)
+    except AttributeError:
+        return _get_converted(name)
+    if inspect.isfunction(attribute) or isinstance(
+        attribute, staticmethod | classmethod
+    ):
+        return _call_method(name)
+    return _get_converted(name)
+
+
+def _expects_pk(schema: type[BaseModel], field_name: str) -> bool:
+    """Check if an inferred relation field of a schema expects related keys."""
+    return f"{field_name}_relation" in (
+        schema.__pydantic_decorators__.field_validators
+    ) and not contains_model(schema.model_fields[field_name].annotation)
+
+
+def get_accessor_plan(
+    schema: type[BaseModel],
+    model: type[Model],
+) -> AccessorPlan | None:
+    """Get the accessors reading the fields of a schema from a Django model instance.
+
+    The plan is compiled once per schema and Django model. None if the schema fields
+    can not be read by plain attribute names (e.g. AliasPath validation aliases).
+    """
+    plans = _accessor_plans.setdefault(schema, {})
+    try:
+        return plans[model]
+    except KeyError:
+        pass
+
+    model_attributes = get_model_attributes(model)
+    accessors: list[tuple[str, Accessor]] = []
+    for field_name, field_info in schema.model_fields.items():
+        key = field_info.validation_alias or field_name
+        if not isinstance(key, str):
+            plans[model] = None
+            return None
+        accessor = _compile_accessor(
+            model,
+            key,
+            model_attributes,
+            expects_pk=_expects_pk(schema, field_name),
+            nested_schema=find_model(field_info.annotation),
+        )
+        accessors.append((key, accessor))
+    plan = plans[model] = tuple(accessors)
+    return plan
+
+
+class ModelValues(dict[str, Result]):
+    """Field values read from a Django model instance or row, ready for validation."""
+
+
+def read_attributes(obj: Model, plan: AccessorPlan) -> ModelValues:
+    """Read the fields of the accessor plan from a Django model instance.
+
+    Attributes which do not exist are left out, as if they were not given.
+    """
+    values = ModelValues()
+    for key, accessor in plan:
+        try:
+            values[key] = accessor(obj)
+        except AttributeError:
+            continue
+    return values
+
+
+def read_attributes_many(
+    objects: list[Model],
+    plan: AccessorPlan,
+) -> list[ModelValues]:
+    """Read the fields of the accessor plan from Django model instances.
+
+    The related keys of to-many relations are loaded with one query per relation,
+    and the URLs of the files are resolved with one call per file field.
+    """
+    batches = [
+        (key, accessor.read_many(objects))
+        for key, accessor in plan
+        if isinstance(accessor, BatchAccessor)
+    ]
+    if not batches:
+        return [read_attributes(obj, plan) for obj in objects]
+
+    remaining_plan = tuple(
+        (key, accessor)
+        for key, accessor in plan
+        if not isinstance(accessor, BatchAccessor)
+    )
+    rows: list[ModelValues] = []
+    for index, obj in enumerate(objects):
+        values = read_attributes(obj, remaining_plan)
+        for key, batch in batches:
+            values[key] = batch[index]
+        rows.append(values)
+    return rows
+
+
+def _split_paths(names: list[str]) -> dict[str, tuple[str, ...]]:
+    """Split the `related__field` names into the paths of a nested dict tree.
+
+    A name is kept as is when its first part is also given as a name of its own, as
+    the plain value takes precedence over the related values.
+    """
+    given_names = set(names)
+    paths: dict[str, tuple[str, ...]] = {}
+    related: dict[str, list[str]] = {}
+    for name in names:
+        head, separator, rest = name.partition("__")
+        if separator and head not in given_names:
+            related.setdefault(head, []).append(rest)
+        else:
+            paths[name] = (name,)
+    for head, rests in related.items():
+        for rest, path in _split_paths(rests).items():
+            paths[f"{head}__{rest}"] = (head, *path)
+    return paths
+
+
+@lru_cache(maxsize=256)
+def _get_split_plan(keys: tuple[str, ...]) -> SplitPlan:
+    """Get the nested dict tree paths of the keys of a values() row shape."""
+    paths = _split_paths(list(keys))
+    return tuple((key, paths[key]) for key in keys)
+
+
+def nest_values(row: dict[str, Any]) -> dict[str, Any]:  # pyright: ignore [reportExplicitAny]
+    """Turn a values() row with `related__field` keys into a nested dict tree.
+
+    The key split plan is computed once per row shape, so building the tree is a
+    single pass over the row.
+
+    Example:
+    ```
+    nest_values({"id": 1, "author__id": 2, "author__name": "Name"})
+    # {"id": 1, "author": {"id": 2, "name": "Name"}}
+    ```
+    """
+    if not any("__" in key for key in row):
+        return row
+    tree: dict[str, Any] = {}  # pyright: ignore [reportExplicitAny]
+    for key, path in _get_split_plan(tuple(row)):
+        node = tree
+        for part in path[:-1]:
+            node = node.setdefault(part, {})
+        node[path[-1]] = row[key]
+    return tree
+
 
 class DjangoGetterMixin:
     """Mixin for DjangoGetter."""
@@ -20,21 +565,7 @@ class DjangoGetterMixin:
         result: Any,
     ) -> Result:
         """Convert the result to a serializable format."""
-        if isinstance(result, Manager):
-            return list(result.all())
-
-        if isinstance(result, getattr(QuerySet, "__origin__", QuerySet)):
-            return list(result)
-
-        if callable(result):
-            return result()
-
-        if isinstance(result, FieldFile):
-            if not result:
-                return None
-            return result.url
-
-        return result
+        return convert_result(result)
 
 
 class DjangoGetter(DjangoGetterMixin):
@@ -53,10 +584,10 @@ class DjangoGetter(DjangoGetterMixin):
         }
 
         """
-        values = {}
-        for k, v in self._obj.items():
-            if k.startswith(f"{key}__"):
-                values[k[len(key) + 2 :]] = v
+        prefix = f"{key}__"
+        values = {
+            k[len(prefix) :]: v for k, v in self._obj.items() if k.startswith(prefix)
+        }
 
         # If values is empty, bubble up AttributeError as there's no value for the key
         if not values:
@@ -3,11 +3,15 @@
 import re
 from abc import ABC, abstractmethod
 from collections.abc import Callable
+from dataclasses import dataclass
 from enum import Enum, IntEnum
 from types import UnionType
 from typing import (
+    TYPE_CHECKING,
+    Annotated,
     Any,
     Generic,
+    Literal,
     Protocol,
     TypeVar,
     Union,  # pyright: ignore [reportDeprecated]
@@ -27,23 +31,196 @@ from django.core.validators import (
 )
 from django.db import models
 from django.utils.encoding import force_str
-from pydantic import Field
+from pydantic import Field, GetCoreSchemaHandler, GetJsonSchemaHandler
 from pydantic.fields import FieldInfo
-from pydantic_core import PydanticUndefined, PydanticUndefinedType
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import (
+    PydanticCustomError,
+    PydanticUndefined,
+    PydanticUndefinedType,
+    core_schema,
+)
 
 from django2pydantic.types import (
+    ChoicesStrategy,
     ForwardRel,
     GetType,
     ReverseRel,
     SetType,
     SupportedPydanticTypes,
     TFieldType_co,
+    TypeProfile,
 )
 
+if TYPE_CHECKING:
+    from django2pydantic.registry import FieldTypeRegistry
+
 CallableOutput = TypeVar("CallableOutput", int, str, bool, UUID, float)
 DefaultCallable = Callable[..., CallableOutput]
 
 
+type NamedChoices = tuple[tuple[str, Any], ...]  # pyright: ignore [reportExplicitAny]
+
+type ChoicesKey = tuple[str, str, NamedChoices]
+"""The label of the Django model, the name of the field and its choices."""
+
+CHOICES_KEY_ATTRIBUTE = "__d2p_choices_key__"
+"""Class attribute holding the key an interned Enum type of choices is stored under."""
+
+_choices_enums: dict[ChoicesKey, type[Enum]] = {}
+"""Interned Enum types of the fields with choices, keyed by `ChoicesKey`."""
+
+
+def get_choices_enum(
+    model: type[models.Model],
+    field_name: str,
+    named_choices: NamedChoices,
+) -> type[Enum]:
+    """Return the Enum type of a field with choices.
+
+    The Enum types are interned: every schema using the same field with the same
+    choices gets the same Enum type, and thus a single OpenAPI component.
+
+    Args:
+        model: The Django model class of the field.
+        field_name: The name of the field.
+        named_choices: The choices as `(label, value)` pairs.
+
+    Returns:
+        IntEnum if all choices are integers, Enum otherwise.
+    """
+    return intern_choices_enum(model._meta.label, field_name, named_choices)  # noqa: SLF001
+
+
+def intern_choices_enum(
+    model_label: str,
+    field_name: str,
+    named_choices: NamedChoices,
+) -> type[Enum]:
+    """Return the interned Enum type of the choices of a field.
+
+    Also used to restore the Enum types of the on-disk cache entries, so that the
+    schemas loaded from the cache share the Enum types with the built schemas.
+    """
+    key: ChoicesKey | None = (model_label, field_name, named_choices)
+    try:
+        return _choices_enums[key]
+    except KeyError:
+        pass
+    except TypeError:  # Unhashable choice values can not be interned
+        key = None
+
+    # We need to create a unique name for the Enum type:
+    model_name = model_label.rpartition(".")[2]
+    enum_name = f"{model_name}{field_name.title().replace('_', '')}Enum"
+
+    # If all choices are integers, we can use IntEnum, otherwise a regular Enum:
+    enum_base = (
+        IntEnum if all(isinstance(value, int) for _, value in named_choices) else Enum
+    )
+    enum = cast("type[Enum]", enum_base(enum_name, named_choices, module=__name__))
+    if key is not None:
+        setattr(enum, CHOICES_KEY_ATTRIBUTE, key)
+        _choices_enums[key] = enum
+    return enum
+
+
+@dataclass(frozen=True)
+class ChoicesValidator:
+    """Validate that the value is one of the choices using a set membership check.
+
+    Used as `Annotated` metadata. The choices are listed as `enum` in the JSON schema.
+    """
+
+    choices: tuple[Any, ...]  # pyright: ignore [reportExplicitAny]
+    """The allowed values."""
+
+    def __get_pydantic_core_schema__(
+        self,
+        source_type: Any,  # noqa: ANN401  # pyright: ignore [reportExplicitAny]
+        handler: GetCoreSchemaHandler,
+    ) -> core_schema.CoreSchema:
+        """Add the membership check after validating the value's type."""
+        allowed: frozenset[Any] | tuple[Any, ...]  # pyright: ignore [reportExplicitAny]
+        try:
+            allowed = frozenset(self.choices)
+        except TypeError:  # Unhashable choice values
+            allowed = self.choices
+
+        def validate_choice(value: Any) -> Any:  # noqa: ANN401  # pyright: ignore [reportExplicitAny]
+            if value not in allowed:
+                error_type = "enum"
+                msg = "Input should be one of the choices: {expected}"
+                raise PydanticCustomError(
+                    error_type, msg, {"expected": self._format_choices()}
+                )
+            return value
+
+        return core_schema.no_info_after_validator_function(
+            validate_choice, handler(source_type)
+        )
+
+    def _format_choices(self, limit: int = 10) -> str:
+        """Format the choices for error messages, truncated to the limit."""
+        expected = ", ".join(repr(choice) for choice in self.choices[:limit])
+        if len(self.choices) > limit:
+            expected += f", ... ({len(self.choices)} choices)"
+        return expected
+
+    def __get_pydantic_json_schema__(
+        self, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
+    ) -> JsonSchemaValue:
+        """List the choices as `enum` in the JSON schema."""
+        json_schema = handler(schema)
+        json_schema["enum"] = list(self.choices)
+        return json_schema
+
+
+@dataclass(frozen=True)
+class FormatHint:
+    """Add a `format` to the JSON schema of a plain type.
+
+    Used as `Annotated` metadata in place of the validating types by the OUTPUT type
+    profile, e.g. `Annotated[str, FormatHint("email")]` for `EmailStr`.
+    """
+
+    format: str
+    """The JSON schema format."""
+
+    def __get_pydantic_json_schema__(
+        self, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
+    ) -> JsonSchemaValue:
+        """Set the format in the JSON schema."""
+        json_schema = handler(schema)
+        json_schema["format"] = self.format
+        return json_schema
+
+
+@dataclass(frozen=True)
+class DecimalDigitsHint:
+    """Describe the digits of a decimal in the JSON schema without checking them.
+
+    Used as `Annotated` metadata in place of the `max_digits` and `decimal_places`
+    constraints by the OUTPUT type profile.
+    """
+
+    max_digits: int | None
+    """The maximum number of digits."""
+
+    decimal_places: int | None
+    """The maximum number of decimal places."""
+
+    def __get_pydantic_json_schema__(
+        self, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
+    ) -> JsonSchemaValue:
+        """Describe the digits like the constraints would."""
+        return handler(
+            core_schema.decimal_schema(
+                max_digits=self.max_digits, decimal_places=self.decimal_places
+            )
+        )
+
+
 @runtime_checkable
 class PydanticConverter(Protocol[TFieldType_co]):
     """Define the interface for a Pydantic field converter."""
@@ -110,6 +287,9 @@ class PydanticConverter(Protocol[TFieldType_co]):
 class FieldTypeHandler(Generic[TFieldType_co], PydanticConverter[TFieldType_co], ABC):  # noqa: WPS214 - Found too many methods
     """Abstract base class for handling generic model fields."""
 
+    registry: "FieldTypeRegistry | None" = None
+    """The registry which created the handler, set by `FieldTypeRegistry`."""
+
     @override
     def __init__(self, field_obj: TFieldType_co) -> None:  # pyright: ignore[reportMissingSuperCall]
         pass  # noqa: WPS420
@@ -340,11 +520,16 @@ class DjangoFieldHandler(  # noqa: WPS214
                 return [self.field_obj.default()]
         return None
 
+    @property
+    def field_validators(self) -> list[Callable[..., object]]:
+        """Return the validators of the field."""
+        return self.field_obj.validators
+
     @property
     @override
     def ge(self) -> int | None:
         # check if the field has MinValueValidator
-        for validator in self.field_obj.validators:
+        for validator in self.field_validators:
             if isinstance(validator, MinValueValidator):
                 return cast("int", validator.limit_value)
         return None
@@ -353,7 +538,7 @@ class DjangoFieldHandler(  # noqa: WPS214
     @override
     def le(self) -> int | None:
         # check if the field has MaxValueValidator
-        for validator in self.field_obj.validators:
+        for validator in self.field_validators:
             if isinstance(validator, MaxValueValidator):
                 return cast("int", validator.limit_value)
 
@@ -362,7 +547,7 @@ class DjangoFieldHandler(  # noqa: WPS214
     @property
     @override
     def multiple_of(self) -> int | None:
-        for validator in self.field_obj.validators:
+        for validator in self.field_validators:
             if isinstance(validator, StepValueValidator) and not getattr(
                 validator, "offset", None
             ):
@@ -374,7 +559,7 @@ class DjangoFieldHandler(  # noqa: WPS214
     @override
     def max_length(self) -> int | None:
         """Return the max length of the field if it has a MaxLengthValidator."""
-        for validator in self.field_obj.validators:
+        for validator in self.field_validators:
             if isinstance(validator, MaxLengthValidator):
                 if callable(validator.limit_value):  # pyright: ignore [reportAny]
                     return cast("int", validator.limit_value())
@@ -385,7 +570,7 @@ class DjangoFieldHandler(  # noqa: WPS214
     @override
     def min_length(self) -> int | None:
         """Return the min length of the field if it has a MinLengthValidator."""
-        for validator in self.field_obj.validators:
+        for validator in self.field_validators:
             if isinstance(validator, MinLengthValidator):
                 if callable(validator.limit_value):  # pyright: ignore [reportAny]
                     return cast("int", validator.limit_value())
@@ -397,11 +582,30 @@ class DjangoFieldHandler(  # noqa: WPS214
     def pattern(self) -> re.Pattern[str] | str | None:
         """Return the pattern of the field if it has a RegexValidator."""
         # Check if the Django field has any RegexValidator
-        for validator in self.field_obj.validators:
+        for validator in self.field_validators:
             if isinstance(validator, RegexValidator):
                 return validator.regex
         return None
 
+    @property
+    def uses_output_types(self) -> bool:
+        """Whether the registry represents the fields with the cheap output types."""
+        return (
+            self.registry is not None
+            and self.registry.type_profile is TypeProfile.OUTPUT
+        )
+
+    def _get_choices_strategy(self, choices_count: int) -> ChoicesStrategy:
+        """Return the registry's choices strategy for the number of choices."""
+        if self.registry is None:
+            return ChoicesStrategy.ENUM
+        strategy = self.registry.choices_strategy
+        if strategy is ChoicesStrategy.AUTO:
+            if choices_count > self.registry.choices_threshold:
+                return ChoicesStrategy.SET
+            return ChoicesStrategy.ENUM
+        return strategy
+
     @abstractmethod
     def get_pydantic_type_raw(
         self,
@@ -414,33 +618,28 @@ class DjangoFieldHandler(  # noqa: WPS214
     ) -> UnionType | SupportedPydanticTypes | list[SupportedPydanticTypes]:
         """Return the Pydantic type of the field.
 
-        If the field has choices, return an Enum/IntEnum type. Otherwise, return the
-        raw type.
+        If the field has choices, return a type allowing only the choices, as selected
+        by the registry's choices strategy (an Enum/IntEnum type by default).
+        Otherwise, return the raw type.
         """
         if self.field_obj.choices:
             ch = self.field_obj.get_choices(include_blank=False)
-            # We need to reverse the choices tuples to make the enum work correctly:
-            named_choices = [(force_str(c[1]), c[0]) for c in ch]
-
-            # We need to create a unique name for the Enum type:
-            model_name = self.field_obj.model.__name__
-            field_name = self.field_obj.name.title().replace("_", "")
-            enum_name = f"{model_name}{field_name}Enum"
-
-            # If all choices are integers, we can use IntEnum:
-            if all(isinstance(c[0], int) for c in ch):
-                return IntEnum(
-                    enum_name,
-                    named_choices,
-                    module=__name__,
-                )
-
-            # Otherwise, we use a regular Enum:
-            return Enum(
-                enum_name,
-                named_choices,
-                module=__name__,
-            )
+            match self._get_choices_strategy(len(ch)):
+                case ChoicesStrategy.LITERAL:
+                    return Literal[tuple(c[0] for c in ch)]  # type: ignore[return-value]  # pyright: ignore [reportReturnType]
+                case ChoicesStrategy.SET:
+                    return Annotated[  # type: ignore[return-value]
+                        self.get_pydantic_type_raw(),
+                        ChoicesValidator(tuple(c[0] for c in ch)),
+                    ]
+                case _:
+                    # Reverse the choices tuples to make the enum work correctly:
+                    named_choices = tuple((force_str(c[1]), c[0]) for c in ch)
+                    return get_choices_enum(
+                        self.field_obj.model,
+                        self.field_obj.name,
+                        named_choices,
+                    )
 
         if self.field_obj.null:
             return Union[self.get_pydantic_type_raw(), None]  # type: ignore[return-value]  # noqa: UP007
@@ -1,11 +1,11 @@
 """File-related field handlers."""
 
-from typing import override
+from typing import Annotated, override
 
 from django.db import models
 from pydantic import FilePath
 
-from django2pydantic.handlers.base import DjangoFieldHandler
+from django2pydantic.handlers.base import DjangoFieldHandler, FormatHint
 
 
 class FileFieldHandler(DjangoFieldHandler[models.FileField]):
@@ -31,6 +31,9 @@ class FilePathFieldHandler(DjangoFieldHandler[models.FilePathField[str, str]]):
 
     @override
     def get_pydantic_type_raw(self) -> type[str]:
+        if self.uses_output_types:
+            # FilePath checks that the file exists
+            return Annotated[str, FormatHint("file-path")]  # type: ignore[return-value]
         return FilePath
 
 
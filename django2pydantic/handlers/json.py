@@ -34,12 +34,17 @@ class JSONFieldHandler(DjangoFieldHandler[models.JSONField[SetType, GetType]]):
     def get_pydantic_type_raw(
         self,
     ) -> UnionType | SupportedPydanticTypes | list[SupportedPydanticTypes]:
+        if self.uses_output_types:
+            # The values decoded by the JSONField are passed through as is
+            return Any  # type: ignore[return-value]
         return Json  # type: ignore[no-any-return]
 
     @override
     def get_pydantic_type(
         self,
     ) -> UnionType | SupportedPydanticTypes | list[SupportedPydanticTypes]:
+        if self.uses_output_types:
+            return super().get_pydantic_type()
         return Annotated[  # type: ignore[return-value]
             super().get_pydantic_type(), BeforeValidator(ensure_json_str)
         ]
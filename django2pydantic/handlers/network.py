@@ -1,11 +1,11 @@
 """Field handlers for network fields."""
 
-from typing import override
+from typing import Annotated, override
 
 from django.db import models
 from pydantic import IPvAnyAddress
 
-from django2pydantic.handlers.base import DjangoFieldHandler
+from django2pydantic.handlers.base import DjangoFieldHandler, FormatHint
 
 
 class GenericIpAddressFieldHandler(
@@ -20,4 +20,6 @@ class GenericIpAddressFieldHandler(
 
     @override
     def get_pydantic_type_raw(self) -> type[IPvAnyAddress]:
+        if self.uses_output_types:
+            return Annotated[str, FormatHint("ipvanyaddress")]  # type: ignore[return-value]
         return IPvAnyAddress
@@ -1,12 +1,67 @@
 """Numbers field handlers."""
 # pylint: disable=too-few-public-methods
 
+from collections.abc import Callable
 from decimal import Decimal
-from typing import Generic, cast, override
-
-from django.db import connection, models
-
-from django2pydantic.handlers.base import DjangoFieldHandler, TDjangoField_co
+from typing import Annotated, Generic, cast, override
+
+from django.db import models
+
+from django2pydantic.handlers.base import (
+    DecimalDigitsHint,
+    DjangoFieldHandler,
+    TDjangoField_co,
+)
+
+type IntegerFieldRanges = dict[str, tuple[int, int]]
+"""Integer field `(min_value, max_value)` ranges keyed by the field class name."""
+
+DEFAULT_INTEGER_FIELD_RANGES: IntegerFieldRanges = {
+    "SmallIntegerField": (-32768, 32767),
+    "IntegerField": (-2147483648, 2147483647),
+    "BigIntegerField": (-9223372036854775808, 9223372036854775807),
+    "PositiveBigIntegerField": (0, 9223372036854775807),
+    "PositiveSmallIntegerField": (0, 32767),
+    "PositiveIntegerField": (0, 2147483647),
+    "SmallAutoField": (-32768, 32767),
+    "AutoField": (-2147483648, 2147483647),
+    "BigAutoField": (-9223372036854775808, 9223372036854775807),
+}
+"""Integer field ranges of Django's base database operations."""
+
+INTEGER_FIELD_RANGES: dict[str, IntegerFieldRanges] = {
+    "postgresql": DEFAULT_INTEGER_FIELD_RANGES,
+    # SQLite does not enforce integer ranges, but supports integers up to 64 bits:
+    "sqlite": {
+        field_name: (
+            0 if field_name.startswith("Positive") else -9223372036854775808,
+            9223372036854775807,
+        )
+        for field_name in DEFAULT_INTEGER_FIELD_RANGES
+    },
+    "mysql": {
+        **DEFAULT_INTEGER_FIELD_RANGES,
+        "PositiveSmallIntegerField": (0, 65535),
+        "PositiveIntegerField": (0, 4294967295),
+        "PositiveBigIntegerField": (0, 18446744073709551615),
+    },
+    "oracle": {
+        "SmallIntegerField": (-99999999999, 99999999999),
+        "IntegerField": (-99999999999, 99999999999),
+        "BigIntegerField": (-9999999999999999999, 9999999999999999999),
+        "PositiveBigIntegerField": (0, 9999999999999999999),
+        "PositiveSmallIntegerField": (0, 99999999999),
+        "PositiveIntegerField": (0, 99999999999),
+        "SmallAutoField": (-99999, 99999),
+        "AutoField": (-99999999999, 99999999999),
+        "BigAutoField": (-9999999999999999999, 9999999999999999999),
+    },
+}
+"""Integer field ranges keyed by the database vendor.
+
+Mirrors `DatabaseOperations.integer_field_range()` of Django's built-in database
+backends, so that the ranges can be resolved without loading a database backend.
+"""
 
 
 class DjangoIntegerFieldHandler(
@@ -14,18 +69,39 @@ class DjangoIntegerFieldHandler(
 ):
     """Base handler for Django Integer fields."""
 
+    @property
+    @override
+    def field_validators(self) -> list[Callable[..., object]]:
+        """Return the validators of the field without the database range validators.
+
+        Django adds the range validators of the default database to the integer
+        fields' validators. The handler uses the ranges of the registry's database
+        vendor instead, which also avoids loading the default database backend.
+        """
+        return [
+            *self.field_obj.default_validators,
+            *self.field_obj._validators,  # noqa: SLF001  # pyright: ignore [reportUnknownMemberType, reportAttributeAccessIssue]
+        ]
+
+    def _get_integer_field_range(self) -> tuple[int, int]:
+        """Return the range of the field in the registry's database vendor."""
+        from django2pydantic.registry import FieldTypeRegistry  # noqa: PLC0415
+
+        registry = self.registry or FieldTypeRegistry.instance()
+        return registry.integer_field_ranges[self.field().__name__]
+
     @property
     @override
     def ge(self) -> int | None:
         validator_min = super().ge
-        db_min = connection.ops.integer_field_range(self.field().__name__)[0]
+        db_min = self._get_integer_field_range()[0]
         return max(db_min, validator_min) if validator_min is not None else db_min
 
     @property
     @override
     def le(self) -> int | None:
         validator_max = super().le
-        db_max = connection.ops.integer_field_range(self.field().__name__)[1]
+        db_max = self._get_integer_field_range()[1]
         return min(db_max, validator_max) if validator_max is not None else db_max
 
     @override
@@ -136,17 +212,35 @@ class DecimalFieldHandler(DjangoFieldHandler[models.DecimalField[Decimal, Decima
     @property
     @override
     def max_digits(self) -> int | None:
-        return cast("models.DecimalField[Decimal, Decimal]", self.field_obj).max_digits
+        if self.uses_output_types:
+            return None
+        return self._field_max_digits
 
     @property
     @override
     def decimal_places(self) -> int | None:
+        if self.uses_output_types:
+            return None
+        return self._field_decimal_places
+
+    @property
+    def _field_max_digits(self) -> int | None:
+        return cast("models.DecimalField[Decimal, Decimal]", self.field_obj).max_digits
+
+    @property
+    def _field_decimal_places(self) -> int | None:
         return cast(
             "models.DecimalField[Decimal, Decimal]", self.field_obj
         ).decimal_places
 
     @override
     def get_pydantic_type_raw(self) -> type[Decimal]:
+        if self.uses_output_types:
+            # The digits are described in the JSON schema, but not checked
+            return Annotated[  # type: ignore[return-value]
+                Decimal,
+                DecimalDigitsHint(self._field_max_digits, self._field_decimal_places),
+            ]
         return Decimal
 
 
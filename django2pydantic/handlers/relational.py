@@ -90,7 +90,8 @@ class RelatedFieldHandler(
         """Return the field type handler."""
         from django2pydantic.registry import FieldTypeRegistry  # noqa: PLC0415
 
-        return FieldTypeRegistry.instance().get_handler(field)
+        registry = self.registry or FieldTypeRegistry.instance()
+        return registry.get_handler(field)
 
     # TODO(phuongfi91): https://github.com/NextGenContributions/django2pydantic/issues/50
     # @property
@@ -19,9 +19,21 @@ from pydantic import (
 from pydantic_core import PydanticUndefined
 from pydantic_core.core_schema import ValidatorFunctionWrapHandler
 
-from django2pydantic.handlers.base import DjangoFieldHandler, TDjangoField_co
+from django2pydantic.handlers.base import (
+    DjangoFieldHandler,
+    FormatHint,
+    TDjangoField_co,
+)
 from django2pydantic.types import GetType, SetType, SupportedPydanticTypes
 
+UUID_VERSIONS = (
+    (uuid.uuid1, UUID1, "uuid1"),
+    (uuid.uuid3, UUID3, "uuid3"),
+    (uuid.uuid4, UUID4, "uuid4"),
+    (uuid.uuid5, UUID5, "uuid5"),
+)
+"""The default functions of the UUID fields with their Pydantic types and formats."""
+
 
 def handle_empty_string(value: Any, handler: ValidatorFunctionWrapHandler) -> str:  # noqa: ANN401  # pyright: ignore [reportExplicitAny]
     """Handle empty string, which can fail Pydantic validation e.g. Email/URL."""
@@ -117,6 +129,8 @@ class EmailFieldHandler(DjangoStringBasedFieldHandler[models.EmailField[str, str
         self,
     ) -> UnionType | SupportedPydanticTypes | list[SupportedPydanticTypes]:
         """Return the type of the field."""
+        if self.uses_output_types:
+            return Annotated[str, FormatHint("email")]  # type: ignore[return-value]
         return EmailStr  # pyright: ignore [reportReturnType]
 
     @property
@@ -146,6 +160,8 @@ class UrlFieldHandler(DjangoStringBasedFieldHandler[models.URLField[str, str]]):
     def get_pydantic_type_raw(
         self,
     ) -> UnionType | SupportedPydanticTypes | list[SupportedPydanticTypes]:
+        if self.uses_output_types:
+            return Annotated[str, FormatHint("uri")]  # type: ignore[return-value]
         return AnyUrl
 
     @property
@@ -183,14 +199,11 @@ class UUIDFieldHandler(DjangoFieldHandler[models.UUIDField[SetType, GetType]]):
         self,
     ) -> UnionType | SupportedPydanticTypes | list[SupportedPydanticTypes]:
         # Find out uuid version from Django field by examining the default value
-        if self.field_obj.default is uuid.uuid1:
-            return UUID1  # pyright: ignore [reportReturnType]
-        if self.field_obj.default is uuid.uuid3:
-            return UUID3  # pyright: ignore [reportReturnType]
-        if self.field_obj.default is uuid.uuid4:
-            return UUID4  # pyright: ignore [reportReturnType]
-        if self.field_obj.default is uuid.uuid5:
-            return UUID5  # pyright: ignore [reportReturnType]
+        for default, uuid_type, uuid_format in UUID_VERSIONS:
+            if self.field_obj.default is default:
+                if self.uses_output_types:
+                    return Annotated[UUID, FormatHint(uuid_format)]  # type: ignore[return-value]
+                return uuid_type  # pyright: ignore [reportReturnType]
 
         # If not determinable, default to just generic UUID
         return UUID
@@ -68,11 +68,11 @@ class InferredField:  # pylint: disable=too-few-public-methods
             else (django_model_field.field, None)
         )
 
-        type_handler = field_type_registry.get_handler(field)  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType, reportAttributeAccessIssue]
+        inferred_type, inferred_info = field_type_registry.infer_field(field)  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType, reportAttributeAccessIssue]
 
         pydantic_type, pydantic_field_info = override_type_and_meta(
-            pydantic_type=type_handler.get_pydantic_type(),
-            field_info=type_handler.get_pydantic_field(),
+            pydantic_type=inferred_type,
+            field_info=inferred_info,
             overrides=overrides,
         )
 
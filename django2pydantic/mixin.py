@@ -1,12 +1,15 @@
 """Mixin class for the Pydantic model."""
 
 import functools
-from typing import TYPE_CHECKING, Any, ClassVar, TypeVar, cast
+from collections.abc import Iterable, Iterator
+from itertools import batched
+from typing import TYPE_CHECKING, Any, ClassVar, Self, TypeVar, cast
 
-from django.db.models import Model
+from django.db.models import Model, QuerySet
 from pydantic import (
     BaseModel,
     ConfigDict,
+    TypeAdapter,
     ValidationError,
     ValidationInfo,
     model_validator,
@@ -14,13 +17,31 @@ from pydantic import (
 from pydantic.functional_validators import ModelWrapValidatorHandler
 from pydantic_core.core_schema import ValidatorFunctionWrapHandler
 
-from django2pydantic.getter import DjangoGetter
+from django2pydantic.getter import (
+    DjangoGetter,
+    ModelValues,
+    get_accessor_plan,
+    nest_values,
+    read_attributes,
+    read_attributes_many,
+)
+from django2pydantic.queryset import get_values_plan, optimize_queryset
+from django2pydantic.trusted import construct_trusted
 
 if TYPE_CHECKING:
+    from django.db.models.manager import BaseManager
+
     from django2pydantic import BaseSchema
 
 SVar = TypeVar("SVar", bound="BaseSchema")  # type: ignore[type-arg]
 
+_LIST_ADAPTER_ATTRIBUTE = "__d2p_list_adapter__"
+"""Class attribute caching the type adapter of the lists of a schema.
+
+The adapter references its schema, so it is kept on the schema class itself instead of
+in a mapping, which would keep the dynamically built schemas alive.
+"""
+
 
 class BaseMixins(BaseModel):
     """Base Mixins class."""
@@ -38,6 +59,27 @@ class BaseMixins(BaseModel):
         exclude_unset=True,
     )
 
+    @staticmethod
+    def validate_related_pk(value: Any) -> Any:  # noqa: ANN401  # pyright: ignore [reportAny, reportExplicitAny]
+        """Replace a related instance with its primary key.
+
+        Attached to the to-one relation fields which are known to expect a primary key.
+        """
+        if isinstance(value, Model):
+            return value.pk
+        return value  # pyright: ignore [reportAny]
+
+    @staticmethod
+    def validate_related_pks(value: Any) -> Any:  # noqa: ANN401  # pyright: ignore [reportAny, reportExplicitAny]
+        """Replace the related instances with their primary keys.
+
+        Attached to the to-many relation fields which are known to expect a list of
+        primary keys.
+        """
+        if isinstance(value, list | tuple):
+            return [o.pk if isinstance(o, Model) else o for o in value]  # pyright: ignore [reportUnknownVariableType]
+        return value  # pyright: ignore [reportAny]
+
     @staticmethod
     def validate_relation(  # pyright: ignore [reportAny]
         value: Any,  # noqa: ANN401  # pyright: ignore [reportAny, reportExplicitAny]
@@ -66,6 +108,201 @@ class BaseMixins(BaseModel):
 
             raise ValueError(value) from validation_err  # pyright: ignore[reportUnknownArgumentType]
 
+    @classmethod
+    def from_orm_trusted(cls, obj: Any) -> Self:  # noqa: ANN401  # pyright: ignore [reportExplicitAny]
+        """Construct the schema from a Django model instance without validating it.
+
+        For data read from the database, which already has the types the schema
+        declares. The fields are read like in model_validate() and nested schemas are
+        constructed recursively, but only the properties, methods and the types
+        validation would normalize (e.g. URLs, IP addresses and emails) are validated.
+        Falls back to model_validate() for other inputs and for schemas with
+        validators of their own.
+
+        Example:
+        ```
+        book = BookSchema.from_orm_trusted(Book.objects.get(pk=1))
+        ```
+        """
+        return construct_trusted(cls, obj)
+
+    @classmethod
+    def optimize_queryset[TModel: Model](
+        cls,
+        queryset: "QuerySet[TModel] | BaseManager[TModel]",
+    ) -> "QuerySet[TModel]":
+        """Apply the select_related(), prefetch_related() and only() the schema needs.
+
+        Example:
+        ```
+        books = BookSchema.optimize_queryset(Book.objects.filter(published=True))
+        ```
+        """
+        return optimize_queryset(cls, queryset)
+
+    @classmethod
+    def list_adapter(cls) -> TypeAdapter[list[Self]]:
+        """Return the cached type adapter of the lists of the schema."""
+        # Look up the class itself only, the subclasses have adapters of their own
+        adapter = cast(
+            "TypeAdapter[list[Self]] | None", cls.__dict__.get(_LIST_ADAPTER_ATTRIBUTE)
+        )
+        if adapter is None:
+            adapter = TypeAdapter(list[cls])
+            type.__setattr__(cls, _LIST_ADAPTER_ATTRIBUTE, adapter)
+        return adapter
+
+    @classmethod
+    def validate_many(cls, objects: Iterable[Any]) -> list[Self]:  # pyright: ignore [reportExplicitAny]
+        """Validate many Django model instances.
+
+        The keys of the inferred to-many relations are loaded with one query per
+        relation for all the instances, instead of fetching the related objects of
+        every instance. The whole list is validated with a single call.
+        """
+        instances = list(objects)
+        model_classes = {type(instance) for instance in instances}
+        if len(model_classes) == 1:
+            model = model_classes.pop()
+            plan = get_accessor_plan(cls, model) if issubclass(model, Model) else None
+            if plan is not None:
+                return cls.list_adapter().validate_python(
+                    read_attributes_many(instances, plan)
+                )
+        return cls.list_adapter().validate_python(instances)
+
+    @classmethod
+    def from_queryset(
+        cls,
+        queryset: "QuerySet[Any] | BaseManager[Any]",  # pyright: ignore [reportExplicitAny]
+    ) -> list[Self]:
+        """Validate the instances of an optimized queryset.
+
+        Example:
+        ```
+        books = BookSchema.from_queryset(Book.objects.filter(published=True))
+        ```
+        """
+        return cls.validate_many(cls.optimize_queryset(queryset))
+
+    @classmethod
+    def from_values(
+        cls,
+        queryset: "QuerySet[Any] | BaseManager[Any]",  # pyright: ignore [reportExplicitAny]
+    ) -> list[Self]:
+        """Validate the rows of a queryset without building model instances.
+
+        The schema fields are read with a single values_list() query, including the
+        nested schemas of forward relations, and the rows are mapped straight to the
+        field values.
+
+        Raises:
+            ValueError: If the schema reads something values_list() can not provide,
+                such as to-many relations, file URLs, properties or methods.
+
+        Example:
+        ```
+        books = BookSchema.from_values(Book.objects.filter(published=True))
+        ```
+        """
+        queryset = queryset.all()
+        plan = get_values_plan(cls, queryset.model)
+        if plan is None:
+            msg = (
+                f"Schema {cls.__name__} can not be read from the values of "
+                f"{queryset.model.__name__} rows"
+            )
+            raise ValueError(msg)
+        rows = queryset.values_list(*plan.paths)
+        return cls.list_adapter().validate_python([plan.mapper(row) for row in rows])
+
+    @classmethod
+    def dump_many(
+        cls,
+        objects: "Iterable[Any] | QuerySet[Any]",  # pyright: ignore [reportExplicitAny]
+        **kwargs: Any,  # noqa: ANN401  # pyright: ignore [reportExplicitAny]
+    ) -> list[Any]:  # pyright: ignore [reportExplicitAny]
+        """Validate and serialize many Django model instances.
+
+        Querysets are optimized first. The keyword arguments are passed on to the
+        list adapter's dump_python(); unset fields are excluded by default, as in
+        model_dump().
+
+        Example:
+        ```
+        data = BookSchema.dump_many(Book.objects.all(), mode="json")
+        ```
+        """
+        instances = (
+            cls.from_queryset(objects)
+            if isinstance(objects, QuerySet)
+            else cls.validate_many(objects)
+        )
+        kwargs.setdefault("exclude_unset", True)
+        return cls.list_adapter().dump_python(instances, **kwargs)
+
+    @classmethod
+    def _iter_chunks(
+        cls,
+        queryset: "QuerySet[Any] | BaseManager[Any]",  # pyright: ignore [reportExplicitAny]
+        chunk_size: int,
+    ) -> Iterator[list[Self]]:
+        """Validate an optimized queryset chunk by chunk without caching the rows."""
+        rows = cls.optimize_queryset(queryset).iterator(chunk_size=chunk_size)
+        for chunk in batched(rows, chunk_size):
+            yield cls.validate_many(chunk)
+
+    @classmethod
+    def iter_dump(
+        cls,
+        queryset: "QuerySet[Any] | BaseManager[Any]",  # pyright: ignore [reportExplicitAny]
+        chunk_size: int = 2000,
+        **kwargs: Any,  # noqa: ANN401  # pyright: ignore [reportExplicitAny]
+    ) -> Iterator[Any]:  # pyright: ignore [reportExplicitAny]
+        """Serialize a queryset row by row, holding one chunk of rows at a time.
+
+        The rows are read with QuerySet.iterator() and the relations are prefetched
+        per chunk. The keyword arguments are passed on as in dump_many().
+
+        Example:
+        ```
+        for data in BookSchema.iter_dump(Book.objects.all(), mode="json"):
+            writer.writerow(data)
+        ```
+        """
+        kwargs.setdefault("exclude_unset", True)
+        adapter = cls.list_adapter()
+        for instances in cls._iter_chunks(queryset, chunk_size):
+            yield from adapter.dump_python(instances, **kwargs)
+
+    @classmethod
+    def iter_dump_json(
+        cls,
+        queryset: "QuerySet[Any] | BaseManager[Any]",  # pyright: ignore [reportExplicitAny]
+        chunk_size: int = 2000,
+        **kwargs: Any,  # noqa: ANN401  # pyright: ignore [reportExplicitAny]
+    ) -> Iterator[bytes]:
+        """Serialize a queryset to a JSON array in pieces of one chunk of rows.
+
+        The keyword arguments are passed on to the list adapter's dump_json().
+
+        Example:
+        ```
+        return StreamingHttpResponse(
+            BookSchema.iter_dump_json(Book.objects.all()),
+            content_type="application/json",
+        )
+        ```
+        """
+        kwargs.setdefault("exclude_unset", True)
+        adapter = cls.list_adapter()
+        separator = b"["
+        for instances in cls._iter_chunks(queryset, chunk_size):
+            # Strip the brackets of the chunk's array
+            yield separator + adapter.dump_json(instances, **kwargs)[1:-1]
+            separator = b","
+        yield b"[]" if separator == b"[" else b"]"
+
     @model_validator(mode="wrap")  # type: ignore[arg-type]
     @classmethod
     def _run_root_validator(
@@ -74,6 +311,21 @@ class BaseMixins(BaseModel):
         handler: ModelWrapValidatorHandler[SVar],
         info: ValidationInfo,
     ) -> SVar:
-        """Run the root validator."""
+        """Run the root validator.
+
+        Django model instances are read with the schema's compiled accessor plan;
+        other inputs are wrapped in a DjangoGetter. The `related__field` keys of
+        values() and named values_list() rows are nested first.
+        """
+        if isinstance(values, ModelValues):
+            return handler(values)
+        if isinstance(values, Model):
+            plan = get_accessor_plan(cls, type(values))
+            if plan is not None:
+                return handler(read_attributes(values, plan))
+        elif isinstance(values, tuple) and hasattr(values, "_fields"):
+            values = nest_values(values._asdict())  # pyright: ignore [reportAttributeAccessIssue, reportUnknownMemberType, reportUnknownArgumentType]
+        elif isinstance(values, dict):
+            values = nest_values(values)  # pyright: ignore [reportUnknownArgumentType]
         values = DjangoGetter(values, cls, info.context)  # pyright: ignore [reportAny]
         return handler(values)
@@ -0,0 +1,441 @@
+"""Queryset optimizations derived from the schema fields."""
+
+import inspect
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass, replace
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+from weakref import WeakKeyDictionary
+
+from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
+from django.db.models import (
+    F,
+    FileField,
+    JSONField,
+    ManyToOneRel,
+    Model,
+    Prefetch,
+    QuerySet,
+)
+from pydantic import BaseModel
+
+from django2pydantic.getter import (
+    KeyTree,
+    ModelValues,
+    get_json_keys_schema,
+    get_key_paths,
+    get_key_tree,
+    get_model_attributes,
+)
+from django2pydantic.utils import find_model
+
+if TYPE_CHECKING:
+    from django.db.models.manager import BaseManager
+
+__all__ = [
+    "PrefetchPlan",
+    "QueryPlan",
+    "ValuesPlan",
+    "depends_on",
+    "get_query_plan",
+    "get_values_plan",
+    "optimize_queryset",
+]
+
+
+@dataclass(frozen=True)
+class PrefetchPlan:
+    """A relation prefetched for a schema."""
+
+    lookup: str
+    """The prefetch_related() lookup."""
+
+    related_model: type[Model] | None = None
+    """The related model. None if prefetched without a custom queryset."""
+
+    schema: type[BaseModel] | None = None
+    """The nested schema. None if only the keys of the related objects are read."""
+
+    related_fields: tuple[str, ...] = ()
+    """The fields of the related model Django needs to match the related objects."""
+
+
+@dataclass(frozen=True)
+class QueryPlan:
+    """The related objects and columns a schema reads from a Django model."""
+
+    select_related: tuple[str, ...] = ()
+    """The lookups of the to-one relations joined in the same query."""
+
+    prefetch_related: tuple[PrefetchPlan, ...] = ()
+    """The prefetched relations."""
+
+    only: tuple[str, ...] | None = None
+    """The fields to load with only(). None if all the fields are loaded."""
+
+    annotations: tuple[str, ...] = ()
+    """The lookups of the JSON keys read instead of the whole documents.
+
+    Each key is annotated under its own lookup, e.g. `settings__theme`.
+    """
+
+
+type RowMapper = Callable[[Sequence[Any]], ModelValues]  # pyright: ignore [reportExplicitAny]
+
+
+@dataclass(frozen=True)
+class ValuesPlan:
+    """The values_list() projection a schema is read from, without model instances."""
+
+    paths: tuple[str, ...]
+    """The values_list() field paths."""
+
+    mapper: RowMapper
+    """Maps a values_list() row to the schema's field values."""
+
+
+_values_plans: WeakKeyDictionary[
+    type[BaseModel], dict[type[Model], ValuesPlan | None]
+] = WeakKeyDictionary()
+
+_query_plans: WeakKeyDictionary[type[BaseModel], dict[type[Model], QueryPlan]] = (
+    WeakKeyDictionary()
+)
+
+
+def depends_on[TFunc: Callable[..., Any]](*fields: str) -> Callable[[TFunc], TFunc]:  # pyright: ignore [reportExplicitAny]
+    """Declare the model fields a property or method reads.
+
+    Without the declaration, schemas reading the property load all the fields.
+
+    Example:
+    ```
+    class Person(models.Model):
+        first_name = models.CharField(max_length=100)
+        last_name = models.CharField(max_length=100)
+
+        @property
+        @depends_on("first_name", "last_name")
+        def full_name(self) -> str:
+            return f"{self.first_name} {self.last_name}"
+    ```
+    """
+
+    def decorator(func: TFunc) -> TFunc:
+        func.depends_on = fields  # type: ignore[attr-defined]  # pyright: ignore [reportFunctionMemberAccess]
+        return func
+
+    return decorator
+
+
+def _get_dependencies(attribute: Any) -> tuple[str, ...] | None:  # noqa: ANN401  # pyright: ignore [reportExplicitAny]
+    """Get the fields a property or method declared with depends_on() reads."""
+    if isinstance(attribute, property):
+        attribute = attribute.fget
+    elif isinstance(attribute, cached_property):
+        attribute = attribute.func  # pyright: ignore [reportUnknownMemberType]
+    elif isinstance(attribute, staticmethod | classmethod):
+        attribute = attribute.__func__  # pyright: ignore [reportUnknownMemberType]
+    return getattr(attribute, "depends_on", None)
+
+
+def _get_related_fields(field: Any) -> tuple[str, ...]:  # noqa: ANN401  # pyright: ignore [reportExplicitAny]
+    """Get the fields of a to-many relation's related model Django prefetches by."""
+    if isinstance(field, GenericRelation):
+        return (field.object_id_field_name, field.content_type_field_name)
+    if isinstance(field, ManyToOneRel):
+        return (field.field.name,)
+    return ()
+
+
+def _prefixed(prefix: str, plan: QueryPlan) -> QueryPlan:
+    """Prefix the lookups of a nested schema's plan with the relation's lookup."""
+    return QueryPlan(
+        select_related=(
+            prefix,
+            *(f"{prefix}__{lookup}" for lookup in plan.select_related),
+        ),
+        prefetch_related=tuple(
+            replace(prefetch, lookup=f"{prefix}__{prefetch.lookup}")
+            for prefetch in plan.prefetch_related
+        ),
+        only=(
+            (prefix,)
+            if plan.only is None
+            else (
+                prefix,
+                *(f"{prefix}__{name}" for name in plan.only),
+                # The related instances can not be annotated, the documents are loaded
+                *(
+                    f"{prefix}__{lookup.split('__', 1)[0]}"
+                    for lookup in plan.annotations
+                ),
+            )
+        ),
+    )
+
+
+def get_query_plan(schema: type[BaseModel], model: type[Model]) -> QueryPlan:  # noqa: C901, PLR0912
+    """Get the related objects and columns a schema reads from a Django model.
+
+    The forward to-one relations with nested schemas are joined with select_related()
+    and their own relations are followed with prefixed lookups. The to-many
+    relations and generic foreign keys are prefetched, with the nested schema's own
+    plan applied to the prefetch queryset. The forward to-one relations typed as
+    keys are read from their attnames and need neither.
+
+    Only the fields the schema reads are loaded. Properties and methods have to
+    declare the fields they read with depends_on(), otherwise all the fields are
+    loaded.
+
+    The keys JSON fields with nested schemas read are annotated instead of loading
+    the whole documents.
+
+    The plan is computed once per schema and Django model.
+    """
+    plans = _query_plans.setdefault(schema, {})
+    try:
+        return plans[model]
+    except KeyError:
+        pass
+
+    model_attributes = get_model_attributes(model)
+    select_related: list[str] = []
+    prefetch_related: list[PrefetchPlan] = []
+    only: list[str] | None = []
+    annotations: list[str] = []
+    for field_name, field_info in schema.model_fields.items():
+        key = field_info.validation_alias or field_name
+        if not isinstance(key, str):
+            only = None
+            continue
+        field = model_attributes.get(key)
+        if field is None:
+            try:
+                attribute = inspect.getattr_static(model, key)
+            except AttributeError:
+                # E.g. queryset annotations, which are loaded regardless
+                continue
+            dependencies = None if key == "pk" else _get_dependencies(attribute)
+            if only is not None and key != "pk":
+                only = None if dependencies is None else [*only, *dependencies]
+            continue
+
+        nested_schema = find_model(field_info.annotation)
+        field_only: tuple[str, ...] = (field.name,)
+        keys_schema = get_json_keys_schema(nested_schema)
+        if isinstance(field, JSONField) and keys_schema is not None:
+            annotations.extend(get_key_paths(key, get_key_tree(keys_schema)))
+            field_only = ()
+        elif not field.is_relation:
+            pass
+        elif field.many_to_many or field.one_to_many:
+            prefetch_related.append(
+                PrefetchPlan(
+                    key, field.related_model, nested_schema, _get_related_fields(field)
+                )
+            )
+            # The instances are matched by the key the relation refers to
+            field_only = (
+                (field.field.target_field.name,)
+                if isinstance(field, ManyToOneRel)
+                else ()
+            )
+        elif isinstance(field, GenericForeignKey):
+            prefetch_related.append(PrefetchPlan(key))
+            field_only = (field.ct_field, field.fk_field)
+        elif nested_schema is not None:
+            nested_plan = _prefixed(
+                key, get_query_plan(nested_schema, field.related_model)
+            )
+            select_related.extend(nested_plan.select_related)
+            prefetch_related.extend(nested_plan.prefetch_related)
+            field_only = nested_plan.only or ()
+        elif not field.concrete:
+            # Reverse one-to-one relations are not available by attname
+            select_related.append(key)
+            field_only = (f"{key}__{field.related_model._meta.pk.name}",)  # noqa: SLF001
+        if only is not None:
+            only.extend(field_only)
+
+    plan = plans[model] = QueryPlan(
+        select_related=tuple(select_related),
+        prefetch_related=tuple(prefetch_related),
+        only=None if only is None else tuple(dict.fromkeys(only)),
+        annotations=tuple(annotations),
+    )
+    return plan
+
+
+def _apply_plan[TModel: Model](
+    queryset: "QuerySet[TModel]",
+    plan: QueryPlan,
+    related_fields: tuple[str, ...] = (),
+) -> "QuerySet[TModel]":
+    """Apply a query plan to a queryset."""
+    if plan.annotations:
+        queryset = queryset.annotate(
+            **{lookup: F(lookup) for lookup in plan.annotations}
+        )
+    if plan.select_related:
+        queryset = queryset.select_related(*plan.select_related)
+    if plan.prefetch_related:
+        lookups: list[str | Prefetch] = []
+        for prefetch in plan.prefetch_related:
+            if prefetch.related_model is None:
+                lookups.append(prefetch.lookup)
+                continue
+            related_queryset = prefetch.related_model._default_manager.all()  # noqa: SLF001
+            related_plan = (
+                get_query_plan(prefetch.schema, prefetch.related_model)
+                if prefetch.schema is not None
+                else QueryPlan(only=(prefetch.related_model._meta.pk.name,))  # noqa: SLF001
+            )
+            lookups.append(
+                Prefetch(
+                    prefetch.lookup,
+                    queryset=_apply_plan(
+                        related_queryset, related_plan, prefetch.related_fields
+                    ),
+                )
+            )
+        queryset = queryset.prefetch_related(*lookups)
+    if plan.only is not None:
+        queryset = queryset.only(*plan.only, *related_fields)
+    return queryset
+
+
+def optimize_queryset[TModel: Model](
+    schema: type[BaseModel],
+    queryset: "QuerySet[TModel] | BaseManager[TModel]",
+) -> "QuerySet[TModel]":
+    """Apply the schema's select_related(), prefetch_related() and only().
+
+    Example:
+    ```
+    books = optimize_queryset(BookSchema, Book.objects.filter(published=True))
+    ```
+    """
+    queryset = queryset.all()
+    return _apply_plan(queryset, get_query_plan(schema, queryset.model))
+
+
+def _compile_row_mapper(
+    keys: tuple[str, ...],
+    nested: tuple[tuple[str, int | None, int, int, RowMapper], ...],
+) -> RowMapper:
+    """Compile the mapper of a values_list() row to the schema's field values.
+
+    The row starts with the values of the keys. The nested schemas' values follow,
+    each optionally preceded by the foreign key telling if the relation is null.
+    """
+
+    def map_row(row: Sequence[Any]) -> ModelValues:  # pyright: ignore [reportExplicitAny]
+        values = ModelValues(zip(keys, row, strict=False))
+        for key, null_index, start, end, nested_mapper in nested:
+            values[key] = (
+                None
+                if null_index is not None and row[null_index] is None
+                else nested_mapper(row[start:end])
+            )
+        return values
+
+    return map_row
+
+
+def _compile_keys_mapper(tree: KeyTree) -> RowMapper:
+    """Compile the mapper of the JSON keys' values of a row to the keys."""
+
+    def map_keys(values: Iterator[Any], tree: KeyTree) -> ModelValues:  # pyright: ignore [reportExplicitAny]
+        return ModelValues(
+            (
+                key,
+                next(values) if nested_tree is None else map_keys(values, nested_tree),
+            )
+            for key, nested_tree in tree
+        )
+
+    def map_row(row: Sequence[Any]) -> ModelValues:  # pyright: ignore [reportExplicitAny]
+        return map_keys(iter(row), tree)
+
+    return map_row
+
+
+def get_values_plan(  # noqa: C901, PLR0911, PLR0912
+    schema: type[BaseModel],
+    model: type[Model],
+) -> ValuesPlan | None:
+    """Get the values_list() projection a schema can be read from.
+
+    Regular fields and relations typed as keys are read by their names, and forward
+    to-one relations with nested schemas and the keys of JSON fields with nested
+    schemas by prefixed paths. Keys which are not
+    attributes of the model are read as queryset annotations.
+
+    None if the schema reads something values_list() can not provide, e.g. to-many
+    relations, file URLs, properties or methods. The plan is computed once per
+    schema and Django model.
+    """
+    plans = _values_plans.setdefault(schema, {})
+    try:
+        return plans[model]
+    except KeyError:
+        plans[model] = None
+
+    model_attributes = get_model_attributes(model)
+    keys: list[str] = []
+    nested: list[tuple[str, str | None, tuple[str, ...], RowMapper]] = []
+    for field_name, field_info in schema.model_fields.items():
+        key = field_info.validation_alias or field_name
+        if not isinstance(key, str):
+            return None
+        field = model_attributes.get(key)
+        if field is None:
+            if key != "pk" and hasattr(model, key):
+                return None
+            keys.append(key)
+        elif isinstance(field, JSONField) and (
+            keys_schema := get_json_keys_schema(field_info.annotation)
+        ):
+            tree = get_key_tree(keys_schema)
+            nested.append(
+                (key, None, get_key_paths(key, tree), _compile_keys_mapper(tree))
+            )
+        elif not field.is_relation:
+            if isinstance(field, FileField) or not field.concrete:
+                return None
+            keys.append(key)
+        elif not field.concrete or field.many_to_many or field.one_to_many:
+            return None
+        elif (nested_schema := find_model(field_info.annotation)) is None:
+            keys.append(key)
+        else:
+            nested_plan = get_values_plan(nested_schema, field.related_model)
+            if nested_plan is None:
+                return None
+            nested.append(
+                (
+                    key,
+                    field.name if field.null else None,
+                    tuple(f"{key}__{path}" for path in nested_plan.paths),
+                    nested_plan.mapper,
+                )
+            )
+
+    paths = list(keys)
+    nested_entries: list[tuple[str, int | None, int, int, RowMapper]] = []
+    for key, null_path, nested_paths, nested_mapper in nested:
+        null_index = None
+        if null_path is not None:
+            null_index = len(paths)
+            paths.append(null_path)
+        nested_entries.append(
+            (key, null_index, len(paths), len(paths) + len(nested_paths), nested_mapper)
+        )
+        paths.extend(nested_paths)
+
+    plan = plans[model] = ValuesPlan(
+        paths=tuple(paths),
+        mapper=_compile_row_mapper(tuple(keys), tuple(nested_entries)),
+    )
+    return plan
@@ -2,20 +2,37 @@
 
 import logging
 from collections.abc import Callable
-from typing import ClassVar, TypeVar, override
+from functools import cached_property
+from types import UnionType
+from typing import Any, ClassVar, TypeVar, override
 from uuid import UUID
 
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
 from django.db.models import ForeignObjectRel
+from pydantic.fields import FieldInfo
 from pydantic_core import PydanticUndefinedType
 
 from django2pydantic.handlers.base import PydanticConverter
-from django2pydantic.types import SupportedParentFields
+from django2pydantic.handlers.numbers import (
+    DEFAULT_INTEGER_FIELD_RANGES,
+    INTEGER_FIELD_RANGES,
+    IntegerFieldRanges,
+)
+from django2pydantic.types import (
+    ChoicesStrategy,
+    SupportedParentFields,
+    SupportedPydanticTypes,
+    TypeProfile,
+)
 
 CallableOutput = TypeVar("CallableOutput", int, str, bool, UUID, float)
 DefaultCallable = Callable[..., CallableOutput]
 
 Undefined = PydanticUndefinedType
 
+type InferredType = UnionType | SupportedPydanticTypes | list[SupportedPydanticTypes]
+
 
 class FieldTypeRegistry:
     """Registry for Django field type handlers."""
@@ -23,12 +40,110 @@ class FieldTypeRegistry:
     _instance: "ClassVar[FieldTypeRegistry | None]" = None
 
     @override
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        choices_strategy: ChoicesStrategy = ChoicesStrategy.ENUM,
+        choices_threshold: int = 100,
+        type_profile: TypeProfile = TypeProfile.STRICT,
+        vendor: str | None = None,
+        database_alias: str | None = None,
+    ) -> None:
+        """Initialize the registry.
+
+        Args:
+            choices_strategy: How the fields with choices are represented.
+            choices_threshold: The number of choices above which the AUTO choices
+                strategy stops using Enum types.
+            type_profile: Which types represent the fields with validating types,
+                e.g. the cheap output types for read-only schemas.
+            vendor: The database vendor (e.g. "postgresql") whose column ranges
+                constrain the integer fields. Takes precedence over database_alias.
+            database_alias: The database whose vendor is used when vendor is not
+                given. Defaults to the default database.
+        """
         super().__init__()
+        self.choices_strategy: ChoicesStrategy = choices_strategy
+        self.choices_threshold: int = choices_threshold
+        self.type_profile: TypeProfile = type_profile
+        self.vendor: str | None = vendor
+        self.database_alias: str | None = database_alias
         self.handlers: dict[
             type[SupportedParentFields],
             type[PydanticConverter[SupportedParentFields]],
         ] = {}
+        self.revision: int = 0
+        """Incremented on every registration to invalidate built schemas."""
+        self._dispatch_table: dict[
+            type[object],
+            type[PydanticConverter[SupportedParentFields]] | None,
+        ] = {}
+        self._inferred_fields: dict[object, tuple[InferredType, FieldInfo]] = {}
+
+    @property
+    def options(self) -> dict[str, Any]:  # pyright: ignore [reportExplicitAny]
+        """Return the options the registry was initialized with."""
+        return {
+            "choices_strategy": self.choices_strategy,
+            "choices_threshold": self.choices_threshold,
+            "type_profile": self.type_profile,
+            "vendor": self.vendor,
+            "database_alias": self.database_alias,
+        }
+
+    @cached_property
+    def database_vendor(self) -> str | None:
+        """Return the database vendor the schemas are built for.
+
+        Without the vendor option, the vendor of the configured database is looked up
+        from the Django settings, without connecting to the database. None if the
+        database settings are not available.
+        """
+        if self.vendor is not None:
+            return self.vendor
+        alias = self.database_alias or DEFAULT_DB_ALIAS
+        if not settings.configured or alias not in settings.DATABASES:
+            return None
+        return connections[alias].vendor
+
+    @cached_property
+    def integer_field_ranges(self) -> IntegerFieldRanges:
+        """Return the integer field ranges of the database vendor.
+
+        The ranges of Django's built-in backends are taken from a precomputed table.
+        The ranges of other backends are read once from the backend's operations.
+        """
+        vendor = self.database_vendor
+        if vendor is None:
+            return DEFAULT_INTEGER_FIELD_RANGES
+        if vendor not in INTEGER_FIELD_RANGES:
+            alias = self.database_alias or DEFAULT_DB_ALIAS
+            if (
+                not settings.configured
+                or alias not in settings.DATABASES
+                or connections[alias].vendor != vendor
+            ):
+                return DEFAULT_INTEGER_FIELD_RANGES
+            ops = connections[alias].ops
+            INTEGER_FIELD_RANGES[vendor] = {
+                field_name: ops.integer_field_range(field_name)
+                for field_name in DEFAULT_INTEGER_FIELD_RANGES
+            }
+        return INTEGER_FIELD_RANGES[vendor]
+
+    def with_options(self, **options: Any) -> "FieldTypeRegistry":  # noqa: ANN401  # pyright: ignore [reportExplicitAny]
+        """Return a new registry with the same handlers and the given options changed.
+
+        Example:
+        ```
+        registry = field_type_registry.with_options(
+            choices_strategy=ChoicesStrategy.AUTO,
+        )
+        ```
+        """
+        registry = type(self)(**{**self.options, **options})
+        registry.handlers = dict(self.handlers)
+        return registry
 
     @classmethod
     def instance(cls) -> "FieldTypeRegistry":
@@ -43,21 +158,31 @@ class FieldTypeRegistry:
     ) -> None:
         """Register a handler class for a Django field class."""
         self.handlers[handler_class.field()] = handler_class
+        self.revision += 1
+        self._dispatch_table.clear()
+        self._inferred_fields.clear()
 
     def get_handler(
         self,
         field: SupportedParentFields | ForeignObjectRel,
     ) -> PydanticConverter[SupportedParentFields]:
-        """Get the handler for a Django field."""
-        # Primarily use a handler that is registered for the exact Django field class:
-        type_handler = self.handlers.get(type(field), None)
-        if type_handler is not None:
-            return type_handler(field)
+        """Get the handler for a Django field.
+
+        A handler registered for the exact Django field class is preferred; otherwise
+        the handler registered for the closest superclass in the field class's MRO is
+        used.
+        """
+        field_class: type[object] = type(field)
+        try:
+            type_handler = self._dispatch_table[field_class]
+        except KeyError:
+            type_handler = self._resolve_handler(field_class)
+            self._dispatch_table[field_class] = type_handler
 
-        # Secondary, use a handler that is registered for a superclass of the
-        # Django field class:
-        # TODO(maintainer): Implement inheritance-based handler lookup
-        # https://github.com/NextGenContributions/django2pydantic/issues/TBD
+        if type_handler is not None:
+            handler = type_handler(field)
+            handler.registry = self
+            return handler
 
         msg = (
             f"No handler registered for {field} for Django field type {type(field)}. "
@@ -65,6 +190,41 @@ class FieldTypeRegistry:
         )
         raise ValueError(msg)
 
+    def infer_field(
+        self,
+        field: SupportedParentFields | ForeignObjectRel,
+    ) -> tuple[InferredType, FieldInfo]:
+        """Get the Pydantic type and field info inferred from a Django field.
+
+        The result is memoized per field, so the handler runs once per field no matter
+        how many schemas include it. The returned FieldInfo is shared and must not be
+        mutated; use `override_type_and_meta` to get an overridden copy.
+        """
+        try:
+            return self._inferred_fields[field]
+        except KeyError:
+            cacheable = True
+        except TypeError:
+            # E.g. reverse relations with unhashable limit_choices_to
+            cacheable = False
+
+        type_handler = self.get_handler(field)
+        inferred = (type_handler.get_pydantic_type(), type_handler.get_pydantic_field())
+        if cacheable:
+            self._inferred_fields[field] = inferred
+        return inferred
+
+    def _resolve_handler(
+        self,
+        field_class: type[object],
+    ) -> type[PydanticConverter[SupportedParentFields]] | None:
+        """Find the handler for the closest registered class in the field's MRO."""
+        for klass in field_class.__mro__:
+            type_handler = self.handlers.get(klass)  # pyright: ignore [reportArgumentType, reportCallIssue]
+            if type_handler is not None:
+                return type_handler
+        return None
+
     def register_if_module_installed(
         self,
         fq_field_class: str,
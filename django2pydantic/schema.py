@@ -83,16 +83,7 @@ class SchemaResolver(ModelMetaclass):
             )
             raise ValueError(msg)
 
-        if config.field_type_registry is None:
-            config.field_type_registry = field_type_registry
-
-        return create_pydantic_model(
-            config.model,  # pyright: ignore [reportUnknownArgumentType, reportUnknownMemberType]
-            config.field_type_registry,
-            fields=config.fields,
-            model_name=config.name,
-            bases=(BaseMixins, BaseModel),
-        )
+        return build_schema(config)  # pyright: ignore [reportUnknownArgumentType]
 
 
 @dataclass(init=True, kw_only=True)
@@ -119,6 +110,29 @@ class SchemaConfig(Generic[TDjangoModel]):
     If not provided, the schema name will be automatically generated.
     """
 
+    lazy: bool = False
+    """Whether to defer compiling the schema until it is first used.
+
+    When enabled, the Pydantic core schema, validator and serializer of the schema
+    (and of its nested schemas) are built on the first validation, serialization or
+    JSON schema generation instead of at class definition time.
+    """
+
+
+def build_schema(config: "SchemaConfig[TDjangoModel]") -> type[BaseModel]:
+    """Build the Pydantic model of the schema configuration."""
+    if config.field_type_registry is None:
+        config.field_type_registry = field_type_registry
+
+    return create_pydantic_model(
+        config.model,
+        config.field_type_registry,
+        fields=config.fields,
+        model_name=config.name,
+        bases=(BaseMixins, BaseModel),
+        defer_build=config.lazy,
+    )
+
 
 class BaseSchema(BaseModel, Generic[TDjangoModel], ABC, metaclass=SchemaResolver):
     """django2pydantic BaseSchema class."""
@@ -0,0 +1,193 @@
+"""Trusted reads of Django model instances, constructing schemas without validation."""
+
+from collections.abc import Callable
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from types import NoneType, UnionType
+from typing import Annotated, Any, Literal, Union, get_args, get_origin
+from uuid import UUID
+from weakref import WeakKeyDictionary
+
+from annotated_types import BaseMetadata
+from django.db.models import Model
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from pydantic._internal._fields import (  # pyright: ignore [reportPrivateImportUsage]
+    pydantic_general_metadata,
+)
+from pydantic.fields import FieldInfo
+from pydantic.types import UuidVersion
+
+from django2pydantic.getter import (
+    Result,
+    get_accessor_plan,
+    get_model_attributes,
+    read_attributes,
+)
+from django2pydantic.handlers.base import (
+    ChoicesValidator,
+    DecimalDigitsHint,
+    FormatHint,
+)
+from django2pydantic.utils import find_model
+
+__all__ = ["construct_trusted", "get_trusted_plan"]
+
+type Converter = Callable[[Any], Result]  # pyright: ignore [reportExplicitAny]
+type TrustedPlan = tuple[tuple[str, str, Converter | None], ...]
+
+_GeneralMetadata = type(pydantic_general_metadata())
+
+_TRUSTED_TYPES: frozenset[Any] = frozenset(  # pyright: ignore [reportExplicitAny]
+    (Any, str, int, float, bool, Decimal, date, datetime, time, timedelta, UUID)
+)
+"""Types the database values already have, which validation would return as is."""
+
+_TRUSTED_METADATA = (
+    BaseMetadata,
+    _GeneralMetadata,
+    ChoicesValidator,
+    DecimalDigitsHint,
+    FormatHint,
+    UuidVersion,
+)
+"""Metadata which only checks or describes the values, e.g. lengths and choices."""
+
+_trusted_plans: WeakKeyDictionary[
+    type[BaseModel], dict[type[Model], TrustedPlan | None]
+] = WeakKeyDictionary()
+
+
+def _is_trusted(annotation: Any) -> bool:  # noqa: ANN401  # pyright: ignore [reportExplicitAny]
+    """Check if validation would return a database value of the type as is.
+
+    Types which normalize the values, e.g. URLs, IP addresses, emails and JSON, are
+    not trusted.
+    """
+    if annotation in _TRUSTED_TYPES or annotation is NoneType:
+        return True
+    if isinstance(annotation, type):
+        return issubclass(annotation, Enum)
+    origin = get_origin(annotation)
+    if origin is Literal:
+        return True
+    if origin is Annotated:
+        base, *metadata = get_args(annotation)
+        return _is_trusted(base) and all(
+            isinstance(item, _TRUSTED_METADATA) for item in metadata
+        )
+    if origin in {Union, UnionType, list}:
+        return all(_is_trusted(arg) for arg in get_args(annotation))
+    return False
+
+
+def _get_annotation(field_info: FieldInfo) -> Any:  # noqa: ANN401  # pyright: ignore [reportExplicitAny]
+    """Get the annotation of a field, including its constraints."""
+    if field_info.metadata:
+        return Annotated[field_info.annotation, *field_info.metadata]  # pyright: ignore [reportInvalidTypeArguments]
+    return field_info.annotation
+
+
+def _get_nested_converter(schema: type[BaseModel]) -> Converter:
+    """Get the converter constructing a nested schema from related instances."""
+
+    def convert(value: Any) -> Result:  # noqa: ANN401  # pyright: ignore [reportExplicitAny]
+        if value is None:
+            return None
+        if isinstance(value, list | tuple):
+            return [construct_trusted(schema, o) for o in value]  # pyright: ignore [reportUnknownVariableType]
+        return construct_trusted(schema, value)
+
+    return convert
+
+
+def _get_validating_converter(
+    field_info: FieldInfo,
+    before: Converter | None,
+) -> Converter:
+    """Get the converter validating the values of a field which is not trusted."""
+    adapter = TypeAdapter[Any](  # pyright: ignore [reportExplicitAny]
+        _get_annotation(field_info),
+        config=ConfigDict(arbitrary_types_allowed=True),
+    )
+    if before is None:
+        return adapter.validate_python
+    return lambda value: adapter.validate_python(before(value))  # pyright: ignore [reportAny]
+
+
+def get_trusted_plan(schema: type[BaseModel], model: type[Model]) -> TrustedPlan | None:
+    """Get the converters constructing the field values of a schema without validation.
+
+    The values of concrete model fields are trusted to have the types the database
+    returns and are used as is, after replacing related instances with their primary
+    keys where the schema expects keys. Nested schemas are constructed recursively.
+    Properties, methods and the types validation would normalize are still validated.
+
+    None if the schema has validators of its own or can not be read with an accessor
+    plan. The plan is computed once per schema and Django model.
+    """
+    plans = _trusted_plans.setdefault(schema, {})
+    try:
+        return plans[model]
+    except KeyError:
+        plans[model] = None
+
+    decorators = schema.__pydantic_decorators__
+    accessor_plan = get_accessor_plan(schema, model)
+    if (
+        accessor_plan is None
+        or set(decorators.model_validators) - {"_run_root_validator"}
+        or any(not name.endswith("_relation") for name in decorators.field_validators)
+    ):
+        return None
+
+    model_attributes = get_model_attributes(model)
+    converters: list[tuple[str, str, Converter | None]] = []
+    for (key, _), (field_name, field_info) in zip(
+        accessor_plan, schema.model_fields.items(), strict=True
+    ):
+        field = model_attributes.get(key)
+        relation_validator = decorators.field_validators.get(f"{field_name}_relation")
+        nested_schema = find_model(field_info.annotation)
+        converter: Converter | None
+        if field is not None and nested_schema is not None:
+            converter = _get_nested_converter(nested_schema)
+        elif (
+            relation_validator is not None and relation_validator.info.mode == "before"
+        ):
+            # The validator replacing the related instances with their primary keys
+            before: Converter = relation_validator.func  # pyright: ignore [reportAssignmentType]
+            converter = (
+                before
+                if _is_trusted(_get_annotation(field_info))
+                else _get_validating_converter(field_info, before)
+            )
+        elif (key == "pk" or getattr(field, "concrete", False)) and _is_trusted(
+            _get_annotation(field_info)
+        ):
+            converter = None
+        else:
+            converter = _get_validating_converter(field_info, None)
+        converters.append((key, field_name, converter))
+
+    plan = plans[model] = tuple(converters)
+    return plan
+
+
+def construct_trusted[TSchema: BaseModel](schema: type[TSchema], obj: Any) -> TSchema:  # noqa: ANN401  # pyright: ignore [reportExplicitAny]
+    """Construct a schema from a Django model instance loaded from the database.
+
+    Falls back to validating the object if it is not a Django model instance or the
+    schema can not be constructed without validation.
+    """
+    plan = get_trusted_plan(schema, type(obj)) if isinstance(obj, Model) else None
+    if plan is None:
+        return schema.model_validate(obj)
+
+    values = read_attributes(obj, get_accessor_plan(schema, type(obj)) or ())
+    fields: dict[str, Any] = {}  # pyright: ignore [reportExplicitAny]
+    for key, field_name, converter in plan:
+        if key in values:
+            value = values[key]
+            fields[field_name] = value if converter is None else converter(value)
+    return schema.model_construct(**fields)
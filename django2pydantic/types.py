@@ -2,7 +2,7 @@
 
 from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass
-from enum import Enum, IntEnum
+from enum import Enum, IntEnum, StrEnum
 from typing import Any, TypeVar, Union, Unpack, override
 
 from django.contrib.contenttypes.fields import GenericForeignKey
@@ -21,6 +21,53 @@ class Infer:
     """Used as a marker for inferring the details of a field."""
 
 
+class ChoicesStrategy(StrEnum):
+    """How the fields with choices are represented in the schemas.
+
+    Example:
+    ```
+    FieldTypeRegistry(choices_strategy=ChoicesStrategy.AUTO)
+    ```
+    """
+
+    ENUM = "enum"
+    """An Enum type per field, shown as a separate component in the OpenAPI spec."""
+
+    LITERAL = "literal"
+    """A `Literal[...]` type of the choice values."""
+
+    SET = "set"
+    """The field's plain type with a set membership validator.
+
+    The choice values are still listed as `enum` in the JSON schema. This is the
+    cheapest strategy to build and validate for very large choices lists.
+    """
+
+    AUTO = "auto"
+    """ENUM, or SET for the fields with more choices than the threshold."""
+
+
+class TypeProfile(StrEnum):
+    """Which Pydantic types represent the fields with validating types.
+
+    Example:
+    ```
+    FieldTypeRegistry(type_profile=TypeProfile.OUTPUT)
+    ```
+    """
+
+    STRICT = "strict"
+    """The validating types, e.g. `EmailStr`, `AnyUrl`, `IPvAnyAddress` and `UUID4`."""
+
+    OUTPUT = "output"
+    """Cheap wire types, e.g. `str` and plain `UUID`, for read-only schemas.
+
+    The format hints of the validating types are kept in the JSON schema, and the
+    decimals are not checked for their digits. The values decoded by JSONFields are
+    passed through instead of being encoded and parsed again.
+    """
+
+
 @dataclass(unsafe_hash=True)
 class InferExcept:
     """Infer except override some values.
@@ -1,8 +1,9 @@
 """Utility functions for django2pydantic."""
 
 from types import UnionType
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, get_args
 
+from pydantic import BaseModel
 from pydantic.fields import FieldInfo
 
 from django2pydantic.types import SupportedPydanticTypes
@@ -39,3 +40,19 @@ def override_type_and_meta(
         else:
             setattr(field_info_copy, key, value)
     return pydantic_type, field_info_copy
+
+
+def find_model(annotation: Any) -> type[BaseModel] | None:  # noqa: ANN401  # pyright: ignore [reportExplicitAny]
+    """Find the Pydantic model a type annotation refers to, if any."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    for arg in get_args(annotation):
+        model = find_model(arg)
+        if model is not None:
+            return model
+    return None
+
+
+def contains_model(annotation: Any) -> bool:  # noqa: ANN401  # pyright: ignore [reportExplicitAny]
+    """Check if a type annotation refers to a Pydantic model."""
+    return find_model(annotation) is not None
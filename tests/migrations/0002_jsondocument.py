@@ -0,0 +1,17 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tests", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="JSONDocument",
+            fields=[
+                ("id", models.AutoField(primary_key=True, serialize=False)),
+                ("data", models.JSONField(null=True)),
+            ],
+        ),
+    ]
@@ -23,3 +23,10 @@ class M2MRequired(models.Model):
 
     id = models.AutoField(primary_key=True)
     field = models.ManyToManyField(ForeignModel, blank=False)
+
+
+class JSONDocument(models.Model):
+    """Model for testing queries of JSON fields."""
+
+    id = models.AutoField(primary_key=True)
+    data = models.JSONField(null=True)
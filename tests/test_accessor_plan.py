@@ -0,0 +1,169 @@
+"""Test reading Django model instances with the compiled accessor plans."""
+
+# pyright: reportUnannotatedClassAttribute=false
+from operator import attrgetter
+
+import pytest
+from django.db import models
+from pydantic import BaseModel
+from pytest_django import DjangoAssertNumQueries
+
+from django2pydantic.getter import get_accessor_plan
+from django2pydantic.mixin import BaseMixins
+from django2pydantic.schema import BaseSchema, SchemaConfig
+from django2pydantic.types import Infer
+from tests.models import ForeignModel, M2MOptional
+
+
+def test_model_instance_fields_are_read_by_kind() -> None:
+    """Fields, files, properties and methods should be read like DjangoGetter."""
+
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        name = models.CharField[str, str](max_length=100)
+        attachment = models.FileField(null=True, blank=True)
+
+        @property
+        def upper_name(self) -> str:
+            """Upper case name."""
+            return self.name.upper()
+
+        def name_length(self) -> int:
+            """Length of the name."""
+            return len(self.name)
+
+    class SchemaA(BaseSchema[ModelA]):
+        config = SchemaConfig[ModelA](
+            model=ModelA,
+            fields={
+                "id": Infer,
+                "name": Infer,
+                "attachment": Infer,
+                "upper_name": Infer,
+            },
+        )
+
+    assert SchemaA.model_validate(ModelA(id=1, name="a")).model_dump() == {
+        "id": 1,
+        "name": "a",
+        "attachment": None,
+        "upper_name": "A",
+    }
+    file_schema = SchemaA.model_validate(
+        ModelA(id=1, name="a", attachment="docs/a.txt")
+    )
+    assert file_schema.model_dump()["attachment"].endswith("docs/a.txt")
+
+    plan = dict(get_accessor_plan(SchemaA, ModelA) or ())
+    assert isinstance(plan["name"], attrgetter)
+
+    class MethodSchema(BaseMixins, BaseModel):
+        name_length: int
+
+    assert MethodSchema.model_validate(ModelA(name="abc")).name_length == 3  # noqa: PLR2004
+
+
+def test_missing_attributes_are_left_unset() -> None:
+    """Attributes missing from the instance should fall back to the defaults."""
+
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+
+    class SchemaA(BaseMixins, BaseModel):
+        id: int
+        name: str = "unknown"
+
+    schema = SchemaA.model_validate(ModelA(id=2))
+    assert schema.name == "unknown"
+    assert schema.model_dump() == {"id": 2}
+    assert get_accessor_plan(SchemaA, ModelA) is get_accessor_plan(SchemaA, ModelA)
+
+
+@pytest.mark.django_db
+def test_many_to_many_managers_are_read_as_lists() -> None:
+    """To-many relations should be read as lists of the related objects."""
+
+    class SchemaA(BaseSchema[M2MOptional]):
+        config = SchemaConfig[M2MOptional](
+            model=M2MOptional,
+            fields={"id": Infer, "field": {"id": Infer}},
+        )
+
+    foreign_1 = ForeignModel.objects.create()
+    foreign_2 = ForeignModel.objects.create()
+    instance = M2MOptional.objects.create()
+    instance.field.set([foreign_1, foreign_2])
+
+    assert SchemaA.model_validate(instance).model_dump() == {
+        "id": instance.pk,
+        "field": [{"id": foreign_1.pk}, {"id": foreign_2.pk}],
+    }
+
+
+def test_foreign_key_pks_are_read_without_fetching_related_objects() -> None:
+    """Pk-typed relations should be read from attname, nested ones as objects."""
+
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        name = models.CharField[str, str](max_length=100)
+
+    class ModelB(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        rel_a = models.ForeignKey[ModelA, ModelA](ModelA, on_delete=models.CASCADE)
+        one_a = models.OneToOneField[ModelA, ModelA](
+            ModelA, on_delete=models.CASCADE, null=True, related_name="one_b"
+        )
+
+    class PkSchema(BaseSchema[ModelB]):
+        config = SchemaConfig[ModelB](
+            model=ModelB, fields={"id": Infer, "rel_a": Infer, "one_a": Infer}
+        )
+
+    class NestedSchema(BaseSchema[ModelB]):
+        config = SchemaConfig[ModelB](
+            model=ModelB, fields={"id": Infer, "rel_a": {"name": Infer}}
+        )
+
+    # Accessing the related objects would query the database, which is not allowed
+    assert PkSchema.model_validate(ModelB(id=1, rel_a_id=5)).model_dump() == {
+        "id": 1,
+        "rel_a": 5,
+        "one_a": None,
+    }
+    instance = ModelB(id=1, rel_a=ModelA(id=5, name="a"))
+    assert NestedSchema.model_validate(instance).model_dump() == {
+        "id": 1,
+        "rel_a": {"name": "a"},
+    }
+
+
+@pytest.mark.django_db
+def test_many_to_many_pks_are_loaded_in_bulk(
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    """The related keys of many instances should be loaded with a single query."""
+
+    class SchemaA(BaseSchema[M2MOptional]):
+        config = SchemaConfig[M2MOptional](
+            model=M2MOptional,
+            fields={"id": Infer, "field": Infer},
+        )
+
+    foreign_1 = ForeignModel.objects.create()
+    foreign_2 = ForeignModel.objects.create()
+    instance_1 = M2MOptional.objects.create()
+    instance_1.field.set([foreign_1, foreign_2])
+    instance_2 = M2MOptional.objects.create()
+    instance_2.field.set([foreign_2])
+    instance_3 = M2MOptional.objects.create()
+    instances = list(M2MOptional.objects.order_by("id"))
+
+    with django_assert_num_queries(1):
+        schemas = SchemaA.validate_many(instances)
+
+    assert [schema.model_dump() for schema in schemas] == [
+        {"id": instance_1.pk, "field": [foreign_1.pk, foreign_2.pk]},
+        {"id": instance_2.pk, "field": [foreign_2.pk]},
+        {"id": instance_3.pk, "field": []},
+    ]
+    assert SchemaA.model_validate(instance_1).model_dump() == schemas[0].model_dump()
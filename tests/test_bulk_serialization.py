@@ -0,0 +1,181 @@
+"""Test validating and serializing querysets in bulk."""
+
+# pyright: reportUnannotatedClassAttribute=false
+import gc
+import json
+import weakref
+
+import pytest
+from django.db import models
+from pytest_django import DjangoAssertNumQueries
+
+from django2pydantic.base import clear_schema_cache, create_pydantic_model
+from django2pydantic.defaults import field_type_registry
+from django2pydantic.mixin import BaseMixins
+from django2pydantic.queryset import get_values_plan
+from django2pydantic.schema import BaseSchema, SchemaConfig
+from django2pydantic.types import Infer
+from tests.models import ForeignModel, M2MOptional
+
+
+@pytest.mark.django_db
+def test_queryset_is_serialized_with_a_query_per_relation(
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    """The queryset should be optimized, validated and dumped as a whole."""
+
+    class SchemaA(BaseSchema[M2MOptional]):
+        config = SchemaConfig[M2MOptional](
+            model=M2MOptional,
+            fields={"id": Infer, "field": {"id": Infer}},
+        )
+
+    foreign_1 = ForeignModel.objects.create()
+    foreign_2 = ForeignModel.objects.create()
+    instance_1 = M2MOptional.objects.create()
+    instance_1.field.set([foreign_1, foreign_2])
+    instance_2 = M2MOptional.objects.create()
+
+    with django_assert_num_queries(2):
+        data = SchemaA.dump_many(M2MOptional.objects.order_by("id"), mode="json")
+
+    assert data == [
+        {"id": instance_1.pk, "field": [{"id": foreign_1.pk}, {"id": foreign_2.pk}]},
+        {"id": instance_2.pk, "field": []},
+    ]
+    assert [
+        schema.model_dump()
+        for schema in SchemaA.from_queryset(M2MOptional.objects.order_by("id"))
+    ] == data
+
+
+def test_list_adapter_is_cached_per_schema() -> None:
+    """The list type adapter should be built once per schema."""
+
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        name = models.CharField[str, str](max_length=100)
+
+    class SchemaA(BaseSchema[ModelA]):
+        config = SchemaConfig[ModelA](model=ModelA, fields=["id", "name"])
+
+    assert SchemaA.list_adapter() is SchemaA.list_adapter()
+    assert SchemaA.dump_many([ModelA(id=1, name="a"), ModelA(id=2, name="b")]) == [
+        {"id": 1, "name": "a"},
+        {"id": 2, "name": "b"},
+    ]
+
+
+def test_list_adapter_does_not_keep_its_schema_alive() -> None:
+    """Dynamically built schemas should be freed along with their list adapters."""
+
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+
+    schema = create_pydantic_model(
+        ModelA, field_type_registry, fields=["id"], bases=(BaseMixins,)
+    )
+    adapter = schema.list_adapter()  # pyright: ignore [reportAttributeAccessIssue, reportUnknownMemberType, reportUnknownVariableType]
+    schema_ref = weakref.ref(schema)
+    clear_schema_cache()
+    del schema, adapter
+    _ = gc.collect()
+
+    assert schema_ref() is None
+
+
+@pytest.mark.django_db
+def test_queryset_is_streamed_in_chunks() -> None:
+    """The rows should be serialized chunk by chunk, prefetching per chunk."""
+
+    class SchemaA(BaseSchema[M2MOptional]):
+        config = SchemaConfig[M2MOptional](
+            model=M2MOptional,
+            fields={"id": Infer, "field": Infer},
+        )
+
+    foreign = ForeignModel.objects.create()
+    instances = [M2MOptional.objects.create() for _ in range(3)]
+    instances[1].field.set([foreign])
+    expected = [
+        {"id": instances[0].pk, "field": []},
+        {"id": instances[1].pk, "field": [foreign.pk]},
+        {"id": instances[2].pk, "field": []},
+    ]
+    queryset = M2MOptional.objects.order_by("id")
+
+    assert list(SchemaA.iter_dump(queryset, chunk_size=2)) == expected
+    pieces = list(SchemaA.iter_dump_json(queryset, chunk_size=2))
+    assert len(pieces) == 3  # noqa: PLR2004
+    assert json.loads(b"".join(pieces)) == expected
+    assert b"".join(SchemaA.iter_dump_json(queryset.none())) == b"[]"
+
+
+def test_values_plan_maps_rows_to_nested_schemas() -> None:
+    """Rows of the values_list() projection should validate like the instances."""
+
+    class Author(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        name = models.CharField[str, str](max_length=100)
+
+    class Book(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        title = models.CharField[str, str](max_length=100)
+        author = models.ForeignKey[Author, Author](
+            Author, on_delete=models.CASCADE, null=True
+        )
+        editor = models.ForeignKey[Author, Author](
+            Author, on_delete=models.CASCADE, related_name="edited_books"
+        )
+
+    class BookSchema(BaseSchema[Book]):
+        config = SchemaConfig[Book](
+            model=Book,
+            fields={
+                "id": Infer,
+                "title": Infer,
+                "editor": Infer,
+                "author": {"id": Infer, "name": Infer},
+            },
+        )
+
+    plan = get_values_plan(BookSchema, Book)
+    assert plan is not None
+    assert plan.paths == (
+        "id",
+        "title",
+        "editor",
+        "author",
+        "author__id",
+        "author__name",
+    )
+
+    author = Author(id=2, name="Author")
+    rows = [(1, "A", 3, 2, 2, "Author"), (4, "B", 3, None, None, None)]
+    instances = [
+        Book(id=1, title="A", editor_id=3, author=author),
+        Book(id=4, title="B", editor_id=3, author=None),
+    ]
+    assert BookSchema.list_adapter().validate_python(
+        [plan.mapper(row) for row in rows]
+    ) == BookSchema.validate_many(instances)
+
+
+@pytest.mark.django_db
+def test_queryset_rows_are_validated_without_model_instances() -> None:
+    """Schemas should be read from values_list() rows where possible."""
+
+    class ForeignSchema(BaseSchema[ForeignModel]):
+        config = SchemaConfig[ForeignModel](model=ForeignModel, fields=["id"])
+
+    class SchemaA(BaseSchema[M2MOptional]):
+        config = SchemaConfig[M2MOptional](model=M2MOptional, fields=["id", "field"])
+
+    foreign = ForeignModel.objects.create()
+
+    assert [
+        schema.model_dump()
+        for schema in ForeignSchema.from_values(ForeignModel.objects)
+    ] == [{"id": foreign.pk}]
+    with pytest.raises(ValueError, match="can not be read from the values"):
+        _ = SchemaA.from_values(M2MOptional.objects.all())
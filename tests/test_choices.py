@@ -1,9 +1,18 @@
 """Test choices are set as enum."""
 
+from enum import Enum
+
 import pytest
 from django.db import models
 from django.utils.translation import gettext as _
-
+from pydantic import BaseModel, ValidationError
+from pydantic.json_schema import models_json_schema
+
+from django2pydantic.base import create_pydantic_model
+from django2pydantic.defaults import field_type_registry
+from django2pydantic.registry import FieldTypeRegistry
+from django2pydantic.schema import BaseSchema, SchemaConfig
+from django2pydantic.types import ChoicesStrategy, Infer
 from tests.utils import get_openapi_schema_from_field
 
 
@@ -84,3 +93,124 @@ def test_field_integer_enum_choices_are_set_as_enum() -> None:
     )
     assert openapi_schema["properties"]["field"]["enum"] == Choices.values
     assert openapi_schema["properties"]["field"]["type"] == "integer"
+
+
+def test_choices_enum_is_shared_across_schemas() -> None:
+    """The same field with choices should use one Enum type in every schema."""
+
+    class Status(models.TextChoices):
+        DRAFT = "draft", "Draft"
+        PUBLISHED = "published", "Published"
+
+    class Article(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        status = models.CharField[str, str](max_length=10, choices=Status.choices)
+
+    class Comment(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        article = models.ForeignKey[Article, Article](Article, on_delete=models.CASCADE)
+
+    class ArticleSchema(BaseSchema[Article]):
+        config = SchemaConfig[Article](
+            model=Article, fields={"id": Infer, "status": Infer}
+        )
+
+    class ArticleStatusSchema(BaseSchema[Article]):
+        config = SchemaConfig[Article](model=Article, fields={"status": Infer})
+
+    class CommentSchema(BaseSchema[Comment]):
+        config = SchemaConfig[Comment](
+            model=Comment,
+            fields={"id": Infer, "article": {"status": Infer}},
+        )
+
+    status_enum = ArticleSchema.model_fields["status"].annotation
+    assert status_enum is ArticleStatusSchema.model_fields["status"].annotation
+    nested_schema = CommentSchema.model_fields["article"].annotation
+    assert nested_schema.model_fields["status"].annotation is status_enum  # type: ignore[union-attr]
+
+    _, openapi_schema = models_json_schema(
+        [(ArticleSchema, "validation"), (CommentSchema, "validation")]
+    )
+    enum_names = [name for name in openapi_schema["$defs"] if name.endswith("Enum")]
+    assert enum_names == ["ArticleStatusEnum"]
+
+
+def test_changed_choices_create_a_new_enum() -> None:
+    """Different choices of the same model field should not share the Enum type."""
+
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        status = models.CharField[str, str](max_length=10, choices=[("a", "A")])
+
+    field = ModelA._meta.get_field("status")  # noqa: SLF001
+    enum_1 = field_type_registry.get_handler(field).get_pydantic_type()
+    field.choices = [("a", "A"), ("b", "B")]
+    enum_2 = field_type_registry.get_handler(field).get_pydantic_type()
+
+    assert enum_1 is not enum_2
+    assert [member.value for member in enum_2] == ["a", "b"]  # type: ignore[union-attr]
+
+
+class _Currency(models.Model):
+    id = models.AutoField[int, int](primary_key=True)
+    code = models.CharField[str, str](
+        max_length=3, choices=[("EUR", "Euro"), ("SEK", "Krona"), ("USD", "Dollar")]
+    )
+
+    class Meta:
+        app_label = "tests"
+
+
+def _currency_schema(registry: FieldTypeRegistry) -> type[BaseModel]:
+    return create_pydantic_model(_Currency, registry, fields={"code": Infer})
+
+
+def test_literal_choices_strategy() -> None:
+    """LITERAL strategy should validate the choices with a Literal type."""
+    registry = field_type_registry.with_options(
+        choices_strategy=ChoicesStrategy.LITERAL
+    )
+    schema = _currency_schema(registry)
+
+    json_schema = schema.model_json_schema()
+    assert "$defs" not in json_schema
+    assert json_schema["properties"]["code"]["enum"] == ["EUR", "SEK", "USD"]
+    assert schema.model_validate({"code": "SEK"}).model_dump() == {"code": "SEK"}
+    with pytest.raises(ValidationError):
+        _ = schema.model_validate({"code": "GBP"})
+
+
+def test_set_choices_strategy() -> None:
+    """SET strategy should validate the choices with a membership check."""
+    registry = field_type_registry.with_options(choices_strategy=ChoicesStrategy.SET)
+    schema = _currency_schema(registry)
+
+    json_schema = schema.model_json_schema()
+    assert "$defs" not in json_schema
+    assert json_schema["properties"]["code"]["type"] == "string"
+    assert json_schema["properties"]["code"]["enum"] == ["EUR", "SEK", "USD"]
+    assert schema.model_validate({"code": "SEK"}).model_dump() == {"code": "SEK"}
+    with pytest.raises(ValidationError, match="one of the choices"):
+        _ = schema.model_validate({"code": "GBP"})
+
+
+@pytest.mark.parametrize(
+    ("choices_threshold", "uses_enum"),
+    [(3, True), (2, False)],
+)
+def test_auto_choices_strategy_uses_threshold(
+    choices_threshold: int,
+    uses_enum: bool,  # noqa: FBT001
+) -> None:
+    """AUTO strategy should use Enum types only up to the threshold."""
+    registry = field_type_registry.with_options(
+        choices_strategy=ChoicesStrategy.AUTO,
+        choices_threshold=choices_threshold,
+    )
+    schema = _currency_schema(registry)
+
+    annotation = schema.model_fields["code"].annotation
+    assert (isinstance(annotation, type) and issubclass(annotation, Enum)) is uses_enum
+    with pytest.raises(ValidationError):
+        _ = schema.model_validate({"code": "GBP"})
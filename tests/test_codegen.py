@@ -0,0 +1,122 @@
+"""Test the ahead-of-time code generation of static schema modules."""
+
+# pyright: reportUnannotatedClassAttribute=false
+import importlib.util
+from decimal import Decimal
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING
+
+import pytest
+from django.db import models
+
+from django2pydantic.codegen import CodegenError, generate_module, write_module
+from django2pydantic.schema import BaseSchema, SchemaConfig
+from django2pydantic.types import Infer, InferExcept
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+
+def _import_module(path: Path) -> ModuleType:
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_generated_module_is_equivalent_to_the_built_schemas(tmp_path: Path) -> None:
+    """The generated schemas should have the same JSON schema and validation."""
+
+    class Author(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        name = models.CharField[str, str](max_length=100)
+        email = models.EmailField[str, str](null=True, blank=True)
+        slug = models.SlugField[str, str]()
+
+    class Book(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        title = models.CharField[str, str](max_length=100, help_text="Book title")
+        price = models.DecimalField[Decimal, Decimal](max_digits=6, decimal_places=2)
+        genre = models.CharField[str, str](
+            max_length=10,
+            choices=[("fiction", "Fiction"), ("sci-fi", "Science fiction")],
+            blank=True,
+        )
+        rating = models.IntegerField[int, int](
+            choices=[(1, "Bad"), (2, "Good")], default=2
+        )
+        author = models.ForeignKey[Author, Author](Author, on_delete=models.CASCADE)
+        editor = models.ForeignKey[Author, Author](
+            Author, on_delete=models.CASCADE, related_name="edited_books"
+        )
+
+    class BookSchema(BaseSchema[Book]):
+        config = SchemaConfig[Book](
+            model=Book,
+            fields={
+                "id": Infer,
+                "title": InferExcept(description="The title"),
+                "price": Infer,
+                "genre": Infer,
+                "rating": Infer,
+                "author": {"id": Infer, "name": Infer, "email": Infer, "slug": Infer},
+                "editor": Infer,
+            },
+        )
+
+    path = tmp_path / "generated_schemas.py"
+    write_module(path, BookSchema)
+    module = _import_module(path)
+    generated_schema: type[BaseModel] = module.BookSchema
+
+    assert module.__all__ == ["BookSchema"]
+    assert generated_schema.model_json_schema() == BookSchema.model_json_schema()
+
+    author = Author(id=1, name="Author", email="", slug="author")
+    book = Book(
+        id=2,
+        title="Title",
+        price=Decimal("9.90"),
+        genre="sci-fi",
+        author=author,
+        editor=author,
+    )
+    assert generated_schema.model_validate(book).model_dump() == (
+        BookSchema.model_validate(book).model_dump()
+    )
+
+
+def test_schema_config_can_be_generated_without_a_schema_class() -> None:
+    """Schema configurations should be rendered without declaring a schema class."""
+
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+
+    source = generate_module(
+        SchemaConfig[ModelA](model=ModelA, fields=["id"], name="ModelASchema"),
+        header='"""Schemas."""',
+    )
+
+    assert source.startswith('"""Schemas."""\n')
+    assert "class ModelASchema(BaseMixins, BaseModel):" in source
+    _ = compile(source, "<generated>", "exec")
+
+
+def test_unrenderable_values_raise_codegen_error() -> None:
+    """Values which can not be imported by the generated module should raise."""
+
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        name = models.CharField[str, str](max_length=100)
+
+    class SchemaA(BaseSchema[ModelA]):
+        config = SchemaConfig[ModelA](
+            model=ModelA,
+            fields={"id": Infer, "name": InferExcept(default_factory=lambda: "name")},
+        )
+
+    with pytest.raises(CodegenError, match="can not be imported"):
+        _ = generate_module(SchemaA)
@@ -0,0 +1,250 @@
+"""Test the persistent on-disk cache of inferred field types."""
+
+# pyright: reportUnannotatedClassAttribute=false
+import sys
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+import pytest
+from django.core.validators import MaxValueValidator
+from django.db import models
+from django.test import override_settings
+
+from django2pydantic.base import create_pydantic_model
+from django2pydantic.defaults import field_type_registry
+from django2pydantic.handlers.text import CharFieldHandler
+from django2pydantic.registry import FieldTypeRegistry
+from django2pydantic.types import Infer, InferExcept
+
+
+class Status(models.TextChoices):
+    """Status choices."""
+
+    DRAFT = "draft", "Draft"
+    PUBLISHED = "published", "Published"
+
+
+def _copy_registry() -> FieldTypeRegistry:
+    registry = FieldTypeRegistry()
+    registry.handlers = dict(field_type_registry.handlers)
+    return registry
+
+
+def _fail(*_args: Any, **_kwargs: Any) -> None:  # noqa: ANN401  # pyright: ignore [reportExplicitAny]
+    msg = "Field type handlers should not be used"
+    raise AssertionError(msg)
+
+
+def test_inferred_fields_are_reused_from_the_disk_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A second build should reuse the inferred fields without the handlers."""
+
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        slug = models.SlugField[str, str](max_length=50)
+        email = models.EmailField[str, str](null=True, blank=True)
+        price = models.DecimalField[Decimal, Decimal](max_digits=10, decimal_places=2)
+        status = models.CharField[str, str](
+            max_length=10, choices=Status.choices, blank=True
+        )
+        priority = models.IntegerField[int, int](choices=[(1, "Low"), (2, "High")])
+
+    fields = {
+        "id": Infer,
+        "slug": Infer,
+        "email": Infer,
+        "price": InferExcept(description="Price in euros"),
+        "status": Infer,
+        "priority": Infer,
+    }
+    registry = _copy_registry()
+
+    with override_settings(DJANGO2PYDANTIC_CACHE_DIR=tmp_path):
+        schema_1 = create_pydantic_model(
+            ModelA, registry, fields=fields, model_name="First"
+        )
+        assert len(list(tmp_path.glob("*.pickle"))) == 1
+
+        monkeypatch.setattr(registry, "get_handler", _fail)
+        schema_2 = create_pydantic_model(
+            ModelA, registry, fields=fields, model_name="Second"
+        )
+
+    json_schema_1 = schema_1.model_json_schema()
+    json_schema_2 = schema_2.model_json_schema()
+    assert json_schema_1["properties"] == json_schema_2["properties"]
+    assert json_schema_1["$defs"] == json_schema_2["$defs"]
+    assert json_schema_2["properties"]["price"]["description"] == "Price in euros"
+
+    instance = schema_2.model_validate(
+        {
+            "id": 1,
+            "slug": "a-slug",
+            "price": Decimal("1.50"),
+            "status": "draft",
+            "priority": 2,
+        },
+    )
+    assert instance.model_dump(mode="json") == {
+        "id": 1,
+        "slug": "a-slug",
+        "email": None,
+        "price": "1.50",
+        "status": "draft",
+        "priority": 2,
+    }
+
+
+def test_enums_from_the_disk_cache_are_shared_with_built_schemas(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Schemas loaded from the disk cache should use the interned choices enums."""
+
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        priority = models.IntegerField[int, int](choices=[(1, "Low"), (2, "High")])
+
+    registry = _copy_registry()
+    with override_settings(DJANGO2PYDANTIC_CACHE_DIR=tmp_path):
+        built = create_pydantic_model(
+            ModelA, registry, fields=["priority"], model_name="First"
+        )
+        monkeypatch.setattr(registry, "get_handler", _fail)
+        loaded = create_pydantic_model(
+            ModelA, registry, fields=["priority"], model_name="Second"
+        )
+
+    built_enum = built.model_fields["priority"].annotation
+    assert isinstance(built_enum, type)
+    assert issubclass(built_enum, Enum)
+    assert loaded.model_fields["priority"].annotation is built_enum
+
+
+def test_changed_fields_definition_is_not_served_from_the_disk_cache(
+    tmp_path: Path,
+) -> None:
+    """A different fields definition should be stored under a different key."""
+
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        name = models.CharField[str, str](max_length=100)
+
+    with override_settings(DJANGO2PYDANTIC_CACHE_DIR=tmp_path):
+        _ = create_pydantic_model(
+            ModelA, field_type_registry, fields={"name": InferExcept(title="A")}
+        )
+        schema = create_pydantic_model(
+            ModelA, field_type_registry, fields={"name": InferExcept(title="B")}
+        )
+
+    assert len(list(tmp_path.glob("*.pickle"))) == 2  # noqa: PLR2004
+    assert schema.model_json_schema()["properties"]["name"]["title"] == "B"
+
+
+class _CustomCharFieldHandler(CharFieldHandler):
+    """Custom handler for Char fields."""
+
+
+def test_changed_handler_package_version_is_not_served_from_the_disk_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A new version of a custom handler's package should use a different key."""
+
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        name = models.CharField[str, str](max_length=100)
+
+    registry = _copy_registry()
+    registry.register(_CustomCharFieldHandler)
+    package = sys.modules[_CustomCharFieldHandler.__module__.partition(".")[0]]
+
+    with override_settings(DJANGO2PYDANTIC_CACHE_DIR=tmp_path):
+        monkeypatch.setattr(package, "__version__", "1.0", raising=False)
+        _ = create_pydantic_model(ModelA, registry, fields=["name"], model_name="A")
+        monkeypatch.setattr(package, "__version__", "1.1")
+        _ = create_pydantic_model(ModelA, registry, fields=["name"], model_name="B")
+
+    assert len(list(tmp_path.glob("*.pickle"))) == 2  # noqa: PLR2004
+
+
+def test_changed_validator_is_not_served_from_the_disk_cache(tmp_path: Path) -> None:
+    """Changed validator arguments should be stored under a different key."""
+
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        value = models.IntegerField[int, int](validators=[MaxValueValidator(10)])
+
+    with override_settings(DJANGO2PYDANTIC_CACHE_DIR=tmp_path):
+        _ = create_pydantic_model(
+            ModelA, _copy_registry(), fields=["value"], model_name="A"
+        )
+        field = ModelA._meta.get_field("value")  # noqa: SLF001
+        field._validators = [MaxValueValidator(20)]  # noqa: SLF001  # pyright: ignore [reportAttributeAccessIssue]
+        _ = field.__dict__.pop("validators", None)
+        schema = create_pydantic_model(
+            ModelA, _copy_registry(), fields=["value"], model_name="B"
+        )
+
+    assert len(list(tmp_path.glob("*.pickle"))) == 2  # noqa: PLR2004
+    assert schema.model_json_schema()["properties"]["value"]["maximum"] == 20  # noqa: PLR2004
+
+
+def test_unreadable_disk_cache_entry_is_ignored(tmp_path: Path) -> None:
+    """A corrupted cache entry should be ignored and the fields inferred again."""
+
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+
+    with override_settings(DJANGO2PYDANTIC_CACHE_DIR=tmp_path):
+        _ = create_pydantic_model(
+            ModelA, field_type_registry, fields=["id"], model_name="First"
+        )
+        for entry in tmp_path.glob("*.pickle"):
+            _ = entry.write_bytes(b"corrupted")
+        schema = create_pydantic_model(
+            ModelA, field_type_registry, fields=["id"], model_name="Second"
+        )
+
+    assert schema.model_json_schema()["properties"]["id"]["type"] == "integer"
+
+
+def test_unwritable_disk_cache_is_skipped(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Schemas should be built when the cache entries can not be written."""
+
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+
+    regular_file = tmp_path / "file"
+    _ = regular_file.write_text("")
+    with override_settings(DJANGO2PYDANTIC_CACHE_DIR=regular_file / "cache"):
+        schema = create_pydantic_model(
+            ModelA, field_type_registry, fields=["id"], model_name="First"
+        )
+    assert schema.model_json_schema()["properties"]["id"]["type"] == "integer"
+
+    def fail_replace(*_args: Any, **_kwargs: Any) -> None:  # noqa: ANN401  # pyright: ignore [reportExplicitAny]
+        raise PermissionError
+
+    monkeypatch.setattr(Path, "replace", fail_replace)
+    with override_settings(DJANGO2PYDANTIC_CACHE_DIR=tmp_path / "cache"):
+        _ = create_pydantic_model(
+            ModelA, field_type_registry, fields=["id"], model_name="Second"
+        )
+    assert not list((tmp_path / "cache").iterdir())
+
+
+def test_disk_cache_is_not_used_without_the_setting(tmp_path: Path) -> None:
+    """Nothing should be written to disk when the cache directory is not set."""
+
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+
+    with override_settings(DJANGO2PYDANTIC_CACHE_DIR=None):
+        _ = create_pydantic_model(ModelA, field_type_registry, fields=["id"])
+
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,175 @@
+"""Test the field type registry."""
+
+# pyright: reportUnannotatedClassAttribute=false
+from typing import override
+
+import pytest
+from django.db import models
+
+from django2pydantic.base import create_pydantic_model
+from django2pydantic.defaults import field_type_registry
+from django2pydantic.handlers import CharFieldHandler, IntegerFieldHandler
+from django2pydantic.registry import FieldTypeRegistry
+from django2pydantic.schema import BaseSchema, SchemaConfig
+from django2pydantic.types import Infer, InferExcept
+
+
+class LowerCaseCharField(models.CharField[str, str]):
+    """Custom CharField subclass without a dedicated handler."""
+
+
+class PercentageField(models.PositiveSmallIntegerField[int, int]):
+    """Custom PositiveSmallIntegerField subclass without a dedicated handler."""
+
+
+class UpperCaseCharFieldHandler(CharFieldHandler):
+    """Handler registered for a custom CharField subclass."""
+
+    @classmethod
+    @override
+    def field(cls) -> type[models.CharField[str, str]]:
+        return LowerCaseCharField
+
+    @property
+    @override
+    def description(self) -> str | None:
+        return "Custom handler"
+
+
+def test_handler_of_closest_superclass_is_used_for_field_subclass() -> None:
+    """Field subclasses should resolve to the handler of their closest superclass."""
+
+    class ModelA(models.Model):
+        name = LowerCaseCharField(max_length=10)
+        percentage = PercentageField()
+
+    name_handler = field_type_registry.get_handler(ModelA._meta.get_field("name"))  # noqa: SLF001
+    assert type(name_handler) is CharFieldHandler
+
+    percentage_handler = field_type_registry.get_handler(
+        ModelA._meta.get_field("percentage")  # noqa: SLF001
+    )
+    assert percentage_handler.get_pydantic_type() is int
+
+
+def test_field_subclasses_can_be_used_in_schemas() -> None:
+    """Schemas should support fields which are subclasses of supported fields."""
+
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        name = LowerCaseCharField(max_length=10)
+        percentage = PercentageField()
+
+    class SchemaA(BaseSchema[ModelA]):
+        config = SchemaConfig[ModelA](
+            model=ModelA,
+            fields={"id": Infer, "name": Infer, "percentage": Infer},
+        )
+
+    properties = SchemaA.model_json_schema()["properties"]
+    assert properties["name"]["type"] == "string"
+    assert properties["name"]["maxLength"] == 10  # noqa: PLR2004
+    assert properties["percentage"]["type"] == "integer"
+    assert properties["percentage"]["minimum"] == 0
+
+
+def test_registering_a_handler_invalidates_the_resolved_handlers() -> None:
+    """A newly registered handler should take precedence over the resolved one."""
+
+    class ModelA(models.Model):
+        name = LowerCaseCharField(max_length=10)
+
+    registry = FieldTypeRegistry()
+    registry.register(CharFieldHandler)
+    registry.register(IntegerFieldHandler)
+    field = ModelA._meta.get_field("name")  # noqa: SLF001
+
+    assert type(registry.get_handler(field)) is CharFieldHandler
+    registry.register(UpperCaseCharFieldHandler)
+    assert type(registry.get_handler(field)) is UpperCaseCharFieldHandler
+
+
+def test_field_without_handler_in_its_mro_raises_error() -> None:
+    """A field class without any registered handler in its MRO should raise."""
+
+    class ModelA(models.Model):
+        name = LowerCaseCharField(max_length=10)
+
+    registry = FieldTypeRegistry()
+    registry.register(IntegerFieldHandler)
+
+    with pytest.raises(ValueError, match="No handler registered"):
+        _ = registry.get_handler(ModelA._meta.get_field("name"))  # noqa: SLF001
+
+
+def test_relation_field_subclasses_can_be_nested() -> None:
+    """Relation field subclasses should support nested fields definitions."""
+
+    class CustomForeignKey(models.ForeignKey[models.Model, models.Model]):
+        """Custom ForeignKey subclass without a dedicated handler."""
+
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        name = models.CharField[str, str](max_length=100)
+
+    class ModelB(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        rel_a = CustomForeignKey(ModelA, on_delete=models.CASCADE)
+
+    class SchemaB(BaseSchema[ModelB]):
+        config = SchemaConfig[ModelB](
+            model=ModelB,
+            fields={"id": Infer, "rel_a": {"id": Infer, "name": Infer}},
+        )
+
+    openapi_schema = SchemaB.model_json_schema()
+    ref = openapi_schema["properties"]["rel_a"]["$ref"].split("/")[-1]
+    assert openapi_schema["$defs"][ref]["properties"]["name"]["type"] == "string"
+
+
+def test_inferred_fields_are_memoized_per_field(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A field should be converted once no matter how many schemas include it."""
+
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        name = models.CharField[str, str](max_length=100)
+
+    registry = field_type_registry.with_options()
+    calls: list[object] = []
+    get_handler = registry.get_handler
+
+    def counting_get_handler(field: models.Field[str, str]) -> object:
+        calls.append(field)
+        return get_handler(field)
+
+    monkeypatch.setattr(registry, "get_handler", counting_get_handler)
+
+    for name in ("SchemaA", "SchemaB"):
+        _ = create_pydantic_model(
+            ModelA, registry, fields={"id": Infer, "name": Infer}, model_name=name
+        )
+
+    assert len(calls) == 2  # noqa: PLR2004
+
+
+def test_overrides_do_not_modify_the_memoized_field_info() -> None:
+    """InferExcept overrides should apply to a copy of the memoized field info."""
+
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        name = models.CharField[str, str](max_length=100)
+
+    registry = field_type_registry.with_options()
+    overridden = create_pydantic_model(
+        ModelA, registry, fields={"name": InferExcept(title="Overridden")}
+    )
+    inferred = create_pydantic_model(
+        ModelA, registry, fields={"name": Infer}, model_name="Inferred"
+    )
+
+    _, field_info = registry.infer_field(ModelA._meta.get_field("name"))  # noqa: SLF001
+    assert field_info.title == "name"
+    assert overridden.model_fields["name"].title == "Overridden"
+    assert inferred.model_fields["name"].title == "name"
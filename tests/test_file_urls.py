@@ -0,0 +1,90 @@
+"""Test resolving the URLs of the files read from file fields."""
+
+# pyright: reportUnannotatedClassAttribute=false
+from collections.abc import Sequence
+
+from django.db import models
+from django.db.models.fields.files import FieldFile
+from django.test import override_settings
+
+from django2pydantic.files import CachedFileURLs, PrefixedFileURLs, file_urls
+from django2pydantic.schema import BaseSchema, SchemaConfig
+from django2pydantic.types import Infer
+
+
+class _Attachment(models.Model):
+    id = models.AutoField[int, int](primary_key=True)
+    document = models.FileField(null=True, blank=True)
+    image = models.ImageField(null=True, blank=True)
+
+    class Meta:
+        app_label = "tests"
+
+
+class _AttachmentSchema(BaseSchema[_Attachment]):
+    config = SchemaConfig[_Attachment](
+        model=_Attachment,
+        fields={"id": Infer, "document": Infer, "image": Infer},
+    )
+
+
+class _CountingResolver:
+    """Resolve the files with the default resolver, recording the batches."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[str | None]] = []
+
+    def __call__(self, files: Sequence[FieldFile]) -> list[str | None]:
+        self.batches.append([file.name for file in files])
+        return file_urls(files)
+
+
+_INSTANCES = [
+    _Attachment(id=1, document="docs/a b.txt", image="images/a.png"),
+    _Attachment(id=2, document="docs/b.txt"),
+    _Attachment(id=3),
+]
+
+
+def test_file_urls_are_resolved_in_batches() -> None:
+    """The files of many instances should be resolved with one call per field."""
+    expected = [
+        _AttachmentSchema.model_validate(instance).model_dump()
+        for instance in _INSTANCES
+    ]
+    resolver = _CountingResolver()
+
+    with override_settings(DJANGO2PYDANTIC_FILE_URL_RESOLVER=resolver):
+        schemas = _AttachmentSchema.validate_many(_INSTANCES)
+
+    assert [schema.model_dump() for schema in schemas] == expected
+    assert expected[0]["document"].endswith("docs/a%20b.txt")
+    assert expected[2] == {"id": 3, "document": None, "image": None}
+    assert resolver.batches == [
+        ["docs/a b.txt", "docs/b.txt", None],
+        ["images/a.png", None, None],
+    ]
+
+
+@override_settings(DJANGO2PYDANTIC_FILE_URL_RESOLVER="django2pydantic.files.file_names")
+def test_file_names_can_be_read_without_urls() -> None:
+    """The file names resolver should read the stored names."""
+    assert _AttachmentSchema.model_validate(_INSTANCES[0]).model_dump() == {
+        "id": 1,
+        "document": "docs/a b.txt",
+        "image": "images/a.png",
+    }
+
+
+def test_prefixed_and_cached_urls_match_storage_urls() -> None:
+    """The prefixed URLs should match the storage's, and be cached by name."""
+    files = [instance.document for instance in _INSTANCES]
+    resolver = _CountingResolver()
+    cached = CachedFileURLs(resolver, maxsize=1)
+
+    assert PrefixedFileURLs()(files) == file_urls(files)
+    assert cached(files) == file_urls(files)
+    assert cached(files[1:]) == file_urls(files[1:])
+    assert cached(files) == file_urls(files)
+    # Only the most recently resolved file is kept in the cache
+    assert resolver.batches == [["docs/a b.txt", "docs/b.txt"], ["docs/a b.txt"]]
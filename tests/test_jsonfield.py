@@ -1,7 +1,17 @@
+from typing import override
+
+import pytest
 from django.db import models
+from pydantic import BaseModel, ValidationError
 
-from django2pydantic import BaseSchema, Infer
+from django2pydantic import BaseSchema, Infer, InferExcept
+from django2pydantic.base import create_pydantic_model
+from django2pydantic.defaults import field_type_registry
+from django2pydantic.handlers.base import DjangoFieldHandler
+from django2pydantic.queryset import get_query_plan
 from django2pydantic.schema import SchemaConfig
+from django2pydantic.types import TypeProfile
+from tests.models import JSONDocument
 
 
 def test_schema_with_jsonfield_should_accept_python_object() -> None:
@@ -24,3 +34,152 @@ def test_schema_with_jsonfield_should_accept_python_object() -> None:
     _ = SchemaA(config=123)
     _ = SchemaA(config=123.0)
     _ = SchemaA(config=True)
+
+
+def test_output_profile_passes_decoded_values_through() -> None:
+    """OUTPUT profile should not encode and parse the decoded values again."""
+
+    class ModelB(models.Model):
+        config = models.JSONField(null=True)
+
+    strict_schema = create_pydantic_model(
+        ModelB, field_type_registry, fields={"config": Infer}
+    )
+    output_schema = create_pydantic_model(
+        ModelB,
+        field_type_registry.with_options(type_profile=TypeProfile.OUTPUT),
+        fields={"config": Infer},
+    )
+
+    config = {"name": "test", "items": [1, 2.0, None]}
+    assert output_schema.model_validate({"config": config}).config is config  # pyright: ignore [reportAttributeAccessIssue]
+    # A decoded JSON string is not parsed as a JSON document
+    assert output_schema.model_validate({"config": "123"}).config == "123"  # pyright: ignore [reportAttributeAccessIssue]
+    assert (
+        output_schema.model_validate({"config": config}).model_dump_json()
+        == strict_schema.model_validate({"config": config}).model_dump_json()
+    )
+    assert output_schema.model_json_schema(
+        mode="serialization"
+    ) == strict_schema.model_json_schema(mode="serialization")
+
+
+class _DocumentSchema(BaseSchema[JSONDocument]):
+    config = SchemaConfig[JSONDocument](
+        model=JSONDocument,
+        fields={
+            "id": Infer,
+            "data": {
+                "theme": Infer,
+                "size": InferExcept(annotation=int | None),
+                "layout": {"columns": Infer},
+            },
+        },
+    )
+
+
+def test_json_keys_are_read_from_the_document() -> None:
+    """Nested fields of a JSON field should read the keys of the document."""
+    document = JSONDocument(
+        id=1, data={"theme": "dark", "size": 2, "layout": {"rows": 3}, "other": 4}
+    )
+
+    assert _DocumentSchema.model_validate(document).model_dump() == {
+        "id": 1,
+        "data": {"theme": "dark", "size": 2, "layout": {"columns": None}},
+    }
+    assert _DocumentSchema.model_validate(JSONDocument(id=2)).model_dump() == {
+        "id": 2,
+        "data": {"theme": None, "size": None, "layout": {"columns": None}},
+    }
+    with pytest.raises(ValidationError):
+        _ = _DocumentSchema.model_validate(JSONDocument(id=3, data={"size": "big"}))
+
+
+@pytest.mark.django_db
+def test_json_keys_are_queried_without_the_documents() -> None:
+    """Optimized querysets and values rows should only read the keys."""
+    documents = [
+        JSONDocument.objects.create(
+            data={"theme": "dark", "size": 2, "layout": {"columns": [1, 2]}}
+        ),
+        JSONDocument.objects.create(data={"theme": "light", "other": "x" * 1000}),
+        JSONDocument.objects.create(data=None),
+    ]
+    expected = [
+        _DocumentSchema.model_validate(document).model_dump() for document in documents
+    ]
+
+    queryset = _DocumentSchema.optimize_queryset(JSONDocument.objects.order_by("id"))
+    assert all(instance.get_deferred_fields() == {"data"} for instance in queryset)
+    assert [
+        schema.model_dump() for schema in _DocumentSchema.from_queryset(queryset)
+    ] == expected
+    assert [
+        schema.model_dump()
+        for schema in _DocumentSchema.from_values(JSONDocument.objects.order_by("id"))
+    ] == expected
+
+
+def test_invalid_json_key_definition_raises_error() -> None:
+    """Unsupported key definitions should be reported."""
+
+    class ModelC(models.Model):
+        data = models.JSONField()
+
+    with pytest.raises(AttributeError, match=r"key 'data\.theme'"):
+        _ = create_pydantic_model(
+            ModelC, field_type_registry, fields={"data": {"theme": 1}}
+        )
+
+
+class _Inner(BaseModel):
+    """The documents of the typed JSON field."""
+
+    name: str
+    age: int
+
+
+class _InnerField(models.JSONField):  # pyright: ignore [reportMissingTypeArgument]
+    """JSON field decoding its documents to a Pydantic model."""
+
+
+class _InnerFieldHandler(DjangoFieldHandler[_InnerField]):
+    """Handler for the typed JSON field."""
+
+    @classmethod
+    @override
+    def field(cls) -> type[_InnerField]:
+        return _InnerField
+
+    @override
+    def get_pydantic_type_raw(self) -> type[_Inner]:
+        return _Inner
+
+
+def test_json_field_typed_by_a_model_is_not_read_as_keys() -> None:
+    """JSON fields validating the whole documents with a model should be read as is."""
+
+    class ModelD(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        pf = _InnerField(null=True)
+
+    registry = field_type_registry.with_options()
+    registry.register(_InnerFieldHandler)
+
+    class SchemaD(BaseSchema[ModelD]):
+        config = SchemaConfig[ModelD](
+            model=ModelD,
+            fields={"id": Infer, "pf": Infer},
+            field_type_registry=registry,
+        )
+
+    instance = ModelD(id=1, pf=_Inner(name="x", age=3))
+    assert SchemaD.model_validate(instance).model_dump() == {
+        "id": 1,
+        "pf": {"name": "x", "age": 3},
+    }
+
+    plan = get_query_plan(SchemaD, ModelD)
+    assert plan.annotations == ()
+    assert plan.only is None or "pf" in plan.only
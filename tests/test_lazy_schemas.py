@@ -0,0 +1,83 @@
+"""Test that lazy schemas are compiled on first use."""
+
+from django.db import models
+
+from django2pydantic.schema import BaseSchema, SchemaConfig
+from django2pydantic.types import Infer
+
+
+def test_lazy_schema_is_compiled_on_first_validation() -> None:
+    """Lazy schema should not be compiled until it is used for validation."""
+
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        name = models.CharField[str, str](max_length=100)
+
+    class SchemaA(BaseSchema[ModelA]):
+        config = SchemaConfig[ModelA](
+            model=ModelA,
+            fields={"id": Infer, "name": Infer},
+            lazy=True,
+        )
+
+    assert not SchemaA.__pydantic_complete__
+
+    instance = SchemaA.model_validate(ModelA(id=1, name="a"))
+    assert SchemaA.__pydantic_complete__
+    assert instance.model_dump() == {"id": 1, "name": "a"}
+
+
+def test_lazy_schema_is_compiled_on_json_schema_generation() -> None:
+    """Lazy schema should produce the same JSON schema as an eager schema."""
+
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        name = models.CharField[str, str](max_length=100)
+
+    class LazySchemaA(BaseSchema[ModelA]):
+        config = SchemaConfig[ModelA](
+            model=ModelA,
+            fields={"id": Infer, "name": Infer},
+            name="LazySchemaA",
+            lazy=True,
+        )
+
+    class EagerSchemaA(BaseSchema[ModelA]):
+        config = SchemaConfig[ModelA](
+            model=ModelA,
+            fields={"id": Infer, "name": Infer},
+            name="EagerSchemaA",
+        )
+
+    assert EagerSchemaA.__pydantic_complete__
+    lazy_json_schema = LazySchemaA.model_json_schema()
+    eager_json_schema = EagerSchemaA.model_json_schema()
+    assert lazy_json_schema["properties"] == eager_json_schema["properties"]
+
+
+def test_nested_schemas_of_lazy_schema_are_lazy() -> None:
+    """Nested schemas of a lazy schema should be compiled with the parent schema."""
+
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        name = models.CharField[str, str](max_length=100)
+
+    class ModelB(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        rel_a = models.ForeignKey[ModelA, ModelA](ModelA, on_delete=models.CASCADE)
+
+    class SchemaB(BaseSchema[ModelB]):
+        config = SchemaConfig[ModelB](
+            model=ModelB,
+            fields={"id": Infer, "rel_a": {"id": Infer, "name": Infer}},
+            lazy=True,
+        )
+
+    nested_schema = SchemaB.model_fields["rel_a"].annotation
+    assert nested_schema is not None
+    assert not nested_schema.__pydantic_complete__  # type: ignore[union-attr]
+
+    instance = SchemaB.model_validate(
+        {"id": 1, "rel_a": ModelA(id=2, name="a")},
+    )
+    assert instance.model_dump() == {"id": 1, "rel_a": {"id": 2, "name": "a"}}
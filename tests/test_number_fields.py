@@ -1,5 +1,8 @@
 """Number fields tests."""
 
+from unittest.mock import patch
+
+import annotated_types
 import pydantic
 import pytest
 from django.core.validators import (
@@ -8,7 +11,9 @@ from django.core.validators import (
     StepValueValidator,
 )
 from django.db import models
+from django.db.utils import ConnectionHandler
 
+from django2pydantic.defaults import field_type_registry
 from tests.utils import pydantic_schema_from_field
 
 IntegerField = type[
@@ -99,3 +104,52 @@ def test_example_value_is_set_based_on_le_and_or_ge(
     openapi_schema = pydantic_model.model_json_schema()
     assert openapi_schema["properties"]["field"]["example"] == [11, 20]
     assert pydantic_model(field=15)
+
+
+def _positive_integer_field() -> models.Field[int, int]:
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        field = models.PositiveIntegerField[int, int]()
+
+    return ModelA._meta.get_field("field")  # noqa: SLF001  # pyright: ignore [reportReturnType]
+
+
+@pytest.mark.parametrize(
+    ("vendor", "expected_max"),
+    [
+        ("postgresql", 2147483647),
+        ("mysql", 4294967295),
+        ("oracle", 99999999999),
+        ("sqlite", 9223372036854775807),
+    ],
+)
+def test_integer_field_range_follows_the_registry_vendor(
+    vendor: str, expected_max: int
+) -> None:
+    """The integer ranges should be those of the registry's database vendor."""
+    registry = field_type_registry.with_options(vendor=vendor)
+    handler = registry.get_handler(_positive_integer_field())
+
+    assert handler.get_pydantic_field().metadata == [
+        annotated_types.Ge(0),
+        annotated_types.Le(expected_max),
+    ]
+
+
+def test_integer_field_range_with_vendor_does_not_use_the_database() -> None:
+    """Integer ranges should resolve without the database connection."""
+    registry = field_type_registry.with_options(vendor="mysql")
+    field = _positive_integer_field()
+
+    with patch.object(
+        ConnectionHandler, "__getitem__", side_effect=AssertionError("DB accessed")
+    ):
+        assert registry.get_handler(field).le == 4294967295  # noqa: PLR2004
+
+
+def test_integer_field_range_uses_the_database_alias_vendor() -> None:
+    """Without the vendor option, the vendor of the database alias should be used."""
+    registry = field_type_registry.with_options(database_alias="default")
+
+    assert registry.database_vendor == "sqlite"
+    assert registry.get_handler(_positive_integer_field()).le == 9223372036854775807  # noqa: PLR2004
@@ -0,0 +1,189 @@
+"""Test the queryset optimizations derived from the schema fields."""
+
+# pyright: reportUnannotatedClassAttribute=false
+import pytest
+from django.db import models
+from django.db.models import Prefetch
+from pytest_django import DjangoAssertNumQueries
+
+from django2pydantic.queryset import (
+    PrefetchPlan,
+    QueryPlan,
+    depends_on,
+    get_query_plan,
+)
+from django2pydantic.schema import BaseSchema, SchemaConfig
+from django2pydantic.types import Infer
+from tests.models import ForeignModel, M2MOptional
+
+
+def test_query_plan_follows_the_nested_relations() -> None:
+    """Nested to-one relations should be joined and to-many ones prefetched."""
+
+    class Publisher(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        name = models.CharField[str, str](max_length=100)
+
+    class Author(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        name = models.CharField[str, str](max_length=100)
+        publisher = models.ForeignKey[Publisher, Publisher](
+            Publisher, on_delete=models.CASCADE
+        )
+
+    class Tag(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        name = models.CharField[str, str](max_length=100)
+
+    class Book(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        author = models.ForeignKey[Author, Author](
+            Author, on_delete=models.CASCADE, related_name="books"
+        )
+        editor = models.ForeignKey[Author, Author](
+            Author, on_delete=models.CASCADE, related_name="edited_books"
+        )
+        tags = models.ManyToManyField(Tag, related_name="books")  # pyright: ignore[reportUnknownVariableType]
+
+    class BookSchema(BaseSchema[Book]):
+        config = SchemaConfig[Book](
+            model=Book,
+            fields={
+                "id": Infer,
+                "author": {"name": Infer, "publisher": {"name": Infer}},
+                "editor": Infer,
+                "tags": {"name": Infer},
+            },
+        )
+
+    class AuthorSchema(BaseSchema[Author]):
+        config = SchemaConfig[Author](
+            model=Author,
+            fields={"id": Infer, "books": Infer},
+        )
+
+    book_plan = get_query_plan(BookSchema, Book)
+    assert book_plan.select_related == ("author", "author__publisher")
+    assert [prefetch.lookup for prefetch in book_plan.prefetch_related] == ["tags"]
+    assert get_query_plan(AuthorSchema, Author) == QueryPlan(
+        prefetch_related=(PrefetchPlan("books", Book, None, ("author",)),),
+        only=("id",),
+    )
+
+    queryset = BookSchema.optimize_queryset(Book.objects.all())
+    assert queryset.query.select_related == {"author": {"publisher": {}}}
+    (prefetch,) = queryset._prefetch_related_lookups  # noqa: SLF001  # pyright: ignore [reportAttributeAccessIssue]
+    assert isinstance(prefetch, Prefetch)
+    assert prefetch.prefetch_through == "tags"
+    assert prefetch.queryset is not None
+    assert prefetch.queryset.model is Tag
+
+
+@pytest.mark.django_db
+def test_optimized_queryset_is_validated_without_further_queries(
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    """The prefetched relations should be used by the validation."""
+
+    class SchemaA(BaseSchema[M2MOptional]):
+        config = SchemaConfig[M2MOptional](
+            model=M2MOptional,
+            fields={"id": Infer, "field": Infer},
+        )
+
+    foreign = ForeignModel.objects.create()
+    instance = M2MOptional.objects.create()
+    instance.field.set([foreign])
+
+    with django_assert_num_queries(2):
+        instances = list(SchemaA.optimize_queryset(M2MOptional.objects.all()))
+    with django_assert_num_queries(0):
+        schemas = [
+            *SchemaA.validate_many(instances),
+            SchemaA.model_validate(instances[0]),
+        ]
+
+    assert [schema.model_dump() for schema in schemas] == [
+        {"id": instance.pk, "field": [foreign.pk]},
+    ] * 2
+
+
+def test_only_the_fields_read_by_the_schema_are_loaded() -> None:
+    """The queryset should load only the columns the schema and nested schemas read."""
+
+    class Author(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        first_name = models.CharField[str, str](max_length=100)
+        last_name = models.CharField[str, str](max_length=100)
+        biography = models.TextField[str, str]()
+
+        @property
+        @depends_on("first_name", "last_name")
+        def full_name(self) -> str:
+            """Full name."""
+            return f"{self.first_name} {self.last_name}"
+
+    class Book(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        title = models.CharField[str, str](max_length=100)
+        content = models.TextField[str, str]()
+        metadata = models.JSONField[dict[str, str], dict[str, str]]()
+        author = models.ForeignKey[Author, Author](
+            Author, on_delete=models.CASCADE, related_name="books"
+        )
+        editor = models.ForeignKey[Author, Author](
+            Author, on_delete=models.CASCADE, related_name="edited_books"
+        )
+
+    class BookSchema(BaseSchema[Book]):
+        config = SchemaConfig[Book](
+            model=Book,
+            fields={
+                "title": Infer,
+                "editor": Infer,
+                "author": {"id": Infer, "full_name": Infer},
+            },
+        )
+
+    assert get_query_plan(BookSchema, Book).only == (
+        "title",
+        "editor",
+        "author",
+        "author__id",
+        "author__first_name",
+        "author__last_name",
+    )
+    sql = str(BookSchema.optimize_queryset(Book.objects.all()).query)
+    assert "title" in sql
+    assert "editor_id" in sql
+    assert "first_name" in sql
+    assert "content" not in sql
+    assert "metadata" not in sql
+    assert "biography" not in sql
+
+    class AuthorSchema(BaseSchema[Author]):
+        config = SchemaConfig[Author](model=Author, fields=["id", "books"])
+
+    queryset = AuthorSchema.optimize_queryset(Author.objects.all())
+    (prefetch,) = queryset._prefetch_related_lookups  # noqa: SLF001  # pyright: ignore [reportAttributeAccessIssue]
+    prefetch_sql = str(prefetch.queryset.query)
+    assert "author_id" in prefetch_sql
+    assert "title" not in prefetch_sql
+
+
+def test_properties_without_dependencies_load_all_fields() -> None:
+    """Properties without declared dependencies may read any field."""
+
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        name = models.CharField[str, str](max_length=100)
+
+        @property
+        def upper_name(self) -> str:
+            """Upper case name."""
+            return self.name.upper()
+
+    class SchemaA(BaseSchema[ModelA]):
+        config = SchemaConfig[ModelA](model=ModelA, fields=["id", "upper_name"])
+
+    assert get_query_plan(SchemaA, ModelA).only is None
@@ -6,6 +6,7 @@ import uuid
 import pytest
 from django.db import models
 
+from django2pydantic.mixin import BaseMixins
 from django2pydantic.schema import BaseSchema, SchemaConfig
 from django2pydantic.types import Infer
 from tests.utils import django_model_factory, get_openapi_schema_from_field
@@ -637,3 +638,63 @@ def test_inferred_fk_field_should_be_an_id() -> None:
             12,
         ],
     }
+
+
+def test_pk_typed_relations_are_validated_without_trying_the_instances(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Relations typed as primary keys should not fall back on validation errors."""
+
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+
+    class ModelB(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        rel_a = models.ForeignKey[ModelA, ModelA](ModelA, on_delete=models.CASCADE)
+        rel_many_a = models.ManyToManyField(ModelA, related_name="many_b")  # pyright: ignore[reportUnknownVariableType]
+
+    def fail(*_: object) -> None:
+        msg = "The fallback validator should not be used"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(BaseMixins, "validate_relation", staticmethod(fail))
+
+    class SchemaB(BaseSchema[ModelB]):
+        config = SchemaConfig[ModelB](
+            model=ModelB,
+            fields={"id": Infer, "rel_a": Infer, "rel_many_a": Infer},
+        )
+
+    b = SchemaB.model_validate(
+        {
+            "id": 10,
+            "rel_a": ModelA(id=1),
+            "rel_many_a": [ModelA(id=2), ModelA(id=3)],
+        },
+    )
+    assert b.model_dump() == {"id": 10, "rel_a": 1, "rel_many_a": [2, 3]}
+
+
+def test_pk_typed_reverse_one_to_one_relation_is_a_single_id() -> None:
+    """A reverse one-to-one relation typed as a primary key should be a single id."""
+
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+
+    class ModelB(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        a = models.OneToOneField[ModelA, ModelA](
+            ModelA,
+            on_delete=models.CASCADE,
+            related_name="b",
+        )
+
+    class SchemaA(BaseSchema[ModelA]):
+        config = SchemaConfig[ModelA](
+            model=ModelA,
+            fields={"id": Infer, "b": Infer},
+        )
+
+    a = ModelA(id=1)
+    _ = ModelB(id=7, a=a)
+    assert SchemaA.model_validate(a).model_dump() == {"id": 1, "b": 7}
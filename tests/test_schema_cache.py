@@ -0,0 +1,232 @@
+"""Test that the built Pydantic models are memoized."""
+
+from django.db import models
+
+from django2pydantic.base import create_pydantic_model
+from django2pydantic.defaults import field_type_registry
+from django2pydantic.mixin import BaseMixins
+from django2pydantic.registry import FieldTypeRegistry
+from django2pydantic.schema import BaseSchema, SchemaConfig
+from django2pydantic.types import Infer, InferExcept, TypeProfile
+
+
+def test_same_fields_definition_returns_the_same_model() -> None:
+    """The same build arguments should return the already built model."""
+
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        name = models.CharField[str, str](max_length=100)
+
+    schema_1 = create_pydantic_model(
+        ModelA, field_type_registry, fields={"id": Infer, "name": Infer}
+    )
+    schema_2 = create_pydantic_model(
+        ModelA, field_type_registry, fields={"id": Infer, "name": Infer}
+    )
+    assert schema_1 is schema_2
+
+
+def test_equivalent_fields_definitions_share_the_same_model() -> None:
+    """Dict and compact fields definitions of the same fields share the model."""
+
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        name = models.CharField[str, str](max_length=100)
+
+    schema_dict = create_pydantic_model(
+        ModelA, field_type_registry, fields={"id": Infer, "name": Infer}
+    )
+    schema_compact = create_pydantic_model(
+        ModelA, field_type_registry, fields=["id", ("name", Infer)]
+    )
+    assert schema_dict is schema_compact
+
+
+def test_different_build_arguments_create_different_models() -> None:
+    """Changing any of the build arguments should build a new model."""
+
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        name = models.CharField[str, str](max_length=100)
+
+    schema = create_pydantic_model(ModelA, field_type_registry, fields=["id", "name"])
+
+    assert schema is not create_pydantic_model(
+        ModelA, field_type_registry, fields=["name", "id"]
+    )
+    assert schema is not create_pydantic_model(
+        ModelA, field_type_registry, fields=["id", "name"], model_name="Other"
+    )
+    assert schema is not create_pydantic_model(
+        ModelA, field_type_registry, fields=["id", "name"], bases=(BaseMixins,)
+    )
+    other_registry = FieldTypeRegistry()
+    other_registry.handlers = dict(field_type_registry.handlers)
+    assert schema is not create_pydantic_model(
+        ModelA, other_registry, fields=["id", "name"]
+    )
+    assert schema is not create_pydantic_model(
+        ModelA,
+        field_type_registry,
+        fields={"id": Infer, "name": InferExcept(title="Other title")},
+    )
+
+
+def test_different_infer_except_overrides_create_different_models() -> None:
+    """InferExcept overrides are part of the memoization key."""
+
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+
+    schema_1 = create_pydantic_model(
+        ModelA, field_type_registry, fields={"id": InferExcept(title="First")}
+    )
+    schema_2 = create_pydantic_model(
+        ModelA, field_type_registry, fields={"id": InferExcept(title="Second")}
+    )
+    schema_3 = create_pydantic_model(
+        ModelA, field_type_registry, fields={"id": InferExcept(title="First")}
+    )
+    assert schema_1 is not schema_2
+    assert schema_1 is schema_3
+    assert schema_2.model_json_schema()["properties"]["id"]["title"] == "Second"
+
+
+def test_equal_overrides_of_different_types_create_different_models() -> None:
+    """Overrides which are equal but of different types should not share models."""
+
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        flag = models.IntegerField[int, int]()
+
+    schema_int = create_pydantic_model(
+        ModelA, field_type_registry, fields={"flag": InferExcept(default=1)}
+    )
+    schema_bool = create_pydantic_model(
+        ModelA, field_type_registry, fields={"flag": InferExcept(default=True)}
+    )
+    schema_list = create_pydantic_model(
+        ModelA, field_type_registry, fields={"flag": InferExcept(examples=[1])}
+    )
+    schema_tuple = create_pydantic_model(
+        ModelA, field_type_registry, fields={"flag": InferExcept(examples=(1,))}
+    )
+    assert schema_int is not schema_bool
+    assert schema_bool.model_fields["flag"].default is True
+    assert schema_list is not schema_tuple
+
+
+def test_unhashable_field_definitions_are_built_without_memoization() -> None:
+    """Unhashable override values should not prevent building the model."""
+
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+
+    class Unhashable:
+        __hash__ = None  # type: ignore[assignment]
+
+    fields = {"id": InferExcept(json_schema_extra={"x": Unhashable()})}  # type: ignore[dict-item]
+    schema_1 = create_pydantic_model(ModelA, field_type_registry, fields=fields)
+    schema_2 = create_pydantic_model(ModelA, field_type_registry, fields=fields)
+    assert schema_1 is not schema_2
+
+
+def test_registering_a_handler_invalidates_the_memoized_models() -> None:
+    """Registering a new handler should cause the models to be rebuilt."""
+
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+
+    registry = FieldTypeRegistry()
+    registry.handlers = dict(field_type_registry.handlers)
+    schema_1 = create_pydantic_model(ModelA, registry, fields=["id"])
+    registry.register(field_type_registry.handlers[models.AutoField])
+    schema_2 = create_pydantic_model(ModelA, registry, fields=["id"])
+    assert schema_1 is not schema_2
+
+
+def test_schemas_with_the_same_config_share_the_same_model() -> None:
+    """BaseSchema subclasses with identical configuration share the built model."""
+
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        name = models.CharField[str, str](max_length=100)
+
+    class SchemaA(BaseSchema[ModelA]):
+        config = SchemaConfig[ModelA](model=ModelA, fields=["id", "name"])
+
+    class SchemaB(BaseSchema[ModelA]):
+        config = SchemaConfig[ModelA](model=ModelA, fields=["id", "name"])
+
+    assert SchemaA is SchemaB
+
+
+def test_nested_schemas_are_shared_across_parent_schemas() -> None:
+    """The same nested fields definition should produce one nested schema."""
+
+    class Author(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        name = models.CharField[str, str](max_length=100)
+        email = models.EmailField[str, str]()
+
+    class Book(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        author = models.ForeignKey[Author, Author](Author, on_delete=models.CASCADE)
+
+    class Article(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        author = models.ForeignKey[Author, Author](Author, on_delete=models.CASCADE)
+
+    class BookSchema(BaseSchema[Book]):
+        config = SchemaConfig[Book](
+            model=Book,
+            fields={"id": Infer, "author": {"id": Infer, "name": Infer}},
+        )
+
+    class ArticleSchema(BaseSchema[Article]):
+        config = SchemaConfig[Article](
+            model=Article,
+            fields={"id": Infer, "author": {"id": Infer, "name": Infer}},
+        )
+
+    class ArticleWithEmailSchema(BaseSchema[Article]):
+        config = SchemaConfig[Article](
+            model=Article,
+            fields={"id": Infer, "author": {"id": Infer, "email": Infer}},
+            name="ArticleWithEmailSchema",
+        )
+
+    book_author = BookSchema.model_fields["author"].annotation
+    article_author = ArticleSchema.model_fields["author"].annotation
+    article_with_email_author = ArticleWithEmailSchema.model_fields["author"].annotation
+    assert book_author is article_author
+    assert book_author is not article_with_email_author
+
+    book_ref = BookSchema.model_json_schema()["properties"]["author"]["$ref"]
+    article_ref = ArticleSchema.model_json_schema()["properties"]["author"]["$ref"]
+    assert book_ref == article_ref
+    assert book_ref.split("/")[-1].startswith("AuthorSchema_")
+
+
+def test_nested_schema_names_differ_between_registry_options() -> None:
+    """Registries building different types should not share nested schema names."""
+
+    class Author(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        email = models.EmailField[str, str]()
+
+    class Book(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        author = models.ForeignKey[Author, Author](Author, on_delete=models.CASCADE)
+
+    fields = {"id": Infer, "author": {"id": Infer, "email": Infer}}
+    strict_schema = create_pydantic_model(Book, field_type_registry, fields=fields)
+    output_schema = create_pydantic_model(
+        Book,
+        field_type_registry.with_options(type_profile=TypeProfile.OUTPUT),
+        fields=fields,
+    )
+
+    strict_author = strict_schema.model_fields["author"].annotation
+    output_author = output_schema.model_fields["author"].annotation
+    assert strict_author.__name__ != output_author.__name__  # pyright: ignore [reportOptionalMemberAccess]
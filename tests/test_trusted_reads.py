@@ -0,0 +1,174 @@
+"""Test constructing schemas from Django model instances without validation."""
+
+# pyright: reportUnannotatedClassAttribute=false
+import uuid
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.db import models
+from pydantic import BaseModel, ValidationError, field_validator
+
+from django2pydantic.mixin import BaseMixins
+from django2pydantic.schema import BaseSchema, SchemaConfig
+from django2pydantic.trusted import get_trusted_plan
+from django2pydantic.types import Infer
+from tests.models import ForeignModel, M2MOptional
+
+
+def test_trusted_reads_match_validated_reads() -> None:
+    """Constructed schemas should serialize exactly like the validated ones."""
+
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        name = models.CharField[str, str](max_length=10)
+
+    class ModelB(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        name = models.CharField[str, str](max_length=10)
+        email = models.EmailField[str, str]()
+        url = models.URLField[str, str](blank=True)
+        ip = models.GenericIPAddressField[str, str](null=True)
+        price = models.DecimalField[Decimal, Decimal](max_digits=5, decimal_places=2)
+        code = models.UUIDField[uuid.UUID, uuid.UUID]()
+        day = models.DateField[date, date]()
+        size = models.CharField[str, str](
+            max_length=1, choices=[("s", "Small"), ("l", "Large")]
+        )
+        data = models.JSONField[dict[str, int], dict[str, int]](null=True)
+        rel_a = models.ForeignKey[ModelA, ModelA](
+            ModelA, on_delete=models.CASCADE, related_name="+"
+        )
+        nested_a = models.ForeignKey[ModelA | None, ModelA | None](
+            ModelA, on_delete=models.CASCADE, null=True, related_name="+"
+        )
+
+        @property
+        def label(self) -> str:
+            """Label of the instance."""
+            return f"{self.name}-{self.size}"
+
+    class SchemaB(BaseSchema[ModelB]):
+        config = SchemaConfig[ModelB](
+            model=ModelB,
+            fields={
+                "id": Infer,
+                "name": Infer,
+                "email": Infer,
+                "url": Infer,
+                "ip": Infer,
+                "price": Infer,
+                "code": Infer,
+                "day": Infer,
+                "size": Infer,
+                "data": Infer,
+                "rel_a": Infer,
+                "nested_a": {"id": Infer, "name": Infer},
+                "label": Infer,
+            },
+        )
+
+    instances = [
+        ModelB(
+            id=1,
+            name="b",
+            email="b@example.com",
+            url="https://example.com",
+            ip="10.0.0.1",
+            price=Decimal("1.50"),
+            code=uuid.UUID(int=1),
+            day=date(2024, 1, 31),
+            size="s",
+            data={"a": 1},
+            rel_a_id=3,
+            nested_a=ModelA(id=4, name="a"),
+        ),
+        ModelB(
+            id=2,
+            name="c",
+            email="c@example.com",
+            url="",
+            price=Decimal(2),
+            code=uuid.UUID(int=2),
+            day=date(2024, 2, 1),
+            size="l",
+            rel_a_id=3,
+        ),
+    ]
+
+    for instance in instances:
+        validated = SchemaB.model_validate(instance)
+        trusted = SchemaB.from_orm_trusted(instance)
+        assert type(trusted) is SchemaB
+        assert trusted.model_dump_json() == validated.model_dump_json()
+        assert trusted.model_dump() == validated.model_dump()
+        assert trusted.model_fields_set == validated.model_fields_set
+
+    plan = {
+        key: converter for key, _, converter in get_trusted_plan(SchemaB, ModelB) or ()
+    }
+    assert [key for key, converter in plan.items() if converter is None] == [
+        "id",
+        "name",
+        "price",
+        "code",
+        "day",
+        "size",
+    ]
+
+    # The database values are not checked against the constraints
+    too_long = ModelA(id=5, name="a" * 20)
+    instance = ModelB(
+        id=3, name="a" * 20, price=Decimal(1), rel_a_id=3, nested_a=too_long
+    )
+    with pytest.raises(ValidationError):
+        SchemaB.model_validate(instance)
+    assert SchemaB.from_orm_trusted(instance).nested_a.name == "a" * 20  # pyright: ignore [reportOptionalMemberAccess, reportAttributeAccessIssue]
+
+
+@pytest.mark.django_db
+def test_trusted_reads_of_to_many_relations() -> None:
+    """To-many relations should be read as keys or constructed nested schemas."""
+
+    class PkSchema(BaseSchema[M2MOptional]):
+        config = SchemaConfig[M2MOptional](
+            model=M2MOptional, fields={"id": Infer, "field": Infer}
+        )
+
+    class NestedSchema(BaseSchema[M2MOptional]):
+        config = SchemaConfig[M2MOptional](
+            model=M2MOptional, fields={"id": Infer, "field": {"id": Infer}}
+        )
+
+    foreign_1 = ForeignModel.objects.create()
+    foreign_2 = ForeignModel.objects.create()
+    instance = M2MOptional.objects.create()
+    instance.field.set([foreign_1, foreign_2])
+
+    for schema in (PkSchema, NestedSchema):
+        assert (
+            schema.from_orm_trusted(instance).model_dump_json()
+            == schema.model_validate(instance).model_dump_json()
+        )
+
+
+def test_schemas_with_own_validators_are_validated() -> None:
+    """Schemas with validators of their own and other inputs should be validated."""
+
+    class ModelA(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        name = models.CharField[str, str](max_length=10)
+
+    class SchemaA(BaseMixins, BaseModel):
+        id: int
+        name: str
+
+        @field_validator("name")
+        @classmethod
+        def upper_name(cls, value: str) -> str:
+            """Upper case the name."""
+            return value.upper()
+
+    assert get_trusted_plan(SchemaA, ModelA) is None
+    assert SchemaA.from_orm_trusted(ModelA(id=1, name="a")).name == "A"
+    assert SchemaA.from_orm_trusted({"id": 1, "name": "b"}).name == "B"
@@ -0,0 +1,86 @@
+"""Test the type profiles of the field type registry."""
+
+# pyright: reportUnannotatedClassAttribute=false
+import uuid
+from decimal import Decimal
+
+import pytest
+from django.db import models
+from pydantic import BaseModel, ValidationError
+
+from django2pydantic.base import create_pydantic_model
+from django2pydantic.defaults import field_type_registry
+from django2pydantic.registry import FieldTypeRegistry
+from django2pydantic.types import Infer, TypeProfile
+
+
+class _Contact(models.Model):
+    id = models.AutoField[int, int](primary_key=True)
+    email = models.EmailField[str, str]()
+    website = models.URLField[str, str]()
+    ip = models.GenericIPAddressField[str, str]()
+    key = models.UUIDField[uuid.UUID, uuid.UUID](default=uuid.uuid4)
+    balance = models.DecimalField[Decimal, Decimal](max_digits=5, decimal_places=2)
+    document = models.FilePathField[str, str](path="/nonexistent")
+
+    class Meta:
+        app_label = "tests"
+
+
+_FIELDS = ("email", "website", "ip", "key", "balance", "document")
+
+
+def _contact_schema(registry: FieldTypeRegistry) -> type[BaseModel]:
+    return create_pydantic_model(
+        _Contact, registry, fields=dict.fromkeys(_FIELDS, Infer)
+    )
+
+
+def test_output_profile_keeps_the_json_schema() -> None:
+    """OUTPUT profile should describe the fields like the validating types do."""
+    strict_schema = _contact_schema(field_type_registry)
+    output_schema = _contact_schema(
+        field_type_registry.with_options(type_profile=TypeProfile.OUTPUT)
+    )
+
+    for mode in ("validation", "serialization"):
+        json_schemas = [
+            schema.model_json_schema(mode=mode)
+            for schema in (strict_schema, output_schema)
+        ]
+        for json_schema in json_schemas:
+            # The example is generated with the default uuid4()
+            del json_schema["properties"]["key"]["examples"]
+        assert json_schemas[0] == json_schemas[1]
+
+
+def test_output_profile_uses_plain_types() -> None:
+    """OUTPUT profile should read the values without parsing or checking them."""
+    strict_schema = _contact_schema(field_type_registry)
+    output_schema = _contact_schema(
+        field_type_registry.with_options(type_profile=TypeProfile.OUTPUT)
+    )
+    values = {
+        "email": "a@example.com",
+        "website": "https://example.com/",
+        "ip": "10.0.0.1",
+        "key": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        "balance": Decimal("123.456"),
+        "document": "/nonexistent/a.txt",
+    }
+
+    output = output_schema.model_validate(values)
+    assert output.model_dump() == values
+    assert output.model_dump_json() == (
+        '{"email":"a@example.com","website":"https://example.com/",'
+        '"ip":"10.0.0.1","key":"12345678-1234-5678-1234-567812345678",'
+        '"balance":"123.456","document":"/nonexistent/a.txt"}'
+    )
+    # The UUID version, the decimal digits and the missing file are not allowed
+    with pytest.raises(ValidationError) as exc_info:
+        _ = strict_schema.model_validate(values)
+    assert {error["loc"][0] for error in exc_info.value.errors()} == {
+        "key",
+        "balance",
+        "document",
+    }
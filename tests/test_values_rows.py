@@ -0,0 +1,77 @@
+"""Test validating values() and values_list() rows with related field keys."""
+
+# pyright: reportUnannotatedClassAttribute=false
+from collections import namedtuple
+
+from django.db import models
+
+from django2pydantic.getter import nest_values
+from django2pydantic.schema import BaseSchema, SchemaConfig
+from django2pydantic.types import Infer
+
+
+def test_related_field_keys_are_nested() -> None:
+    """The `related__field` keys should be nested on every level."""
+    assert nest_values(
+        {
+            "id": 1,
+            "book__title": "Title",
+            "book__author__id": 2,
+            "book__author__name": "Name",
+        },
+    ) == {
+        "id": 1,
+        "book": {"title": "Title", "author": {"id": 2, "name": "Name"}},
+    }
+
+
+def test_plain_value_takes_precedence_over_related_keys() -> None:
+    """A key given as is should not be replaced by the related field keys."""
+    row = {"id": 1, "author": 2, "author__name": "Name"}
+    assert nest_values(row) == row
+
+
+def test_values_rows_are_validated_with_nested_schemas() -> None:
+    """The values() and named values_list() rows should fill the nested schemas."""
+
+    class Publisher(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        name = models.CharField[str, str](max_length=100)
+
+    class Author(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        name = models.CharField[str, str](max_length=100)
+        publisher = models.ForeignKey[Publisher, Publisher](
+            Publisher, on_delete=models.CASCADE
+        )
+
+    class Book(models.Model):
+        id = models.AutoField[int, int](primary_key=True)
+        title = models.CharField[str, str](max_length=100)
+        author = models.ForeignKey[Author, Author](Author, on_delete=models.CASCADE)
+
+    class BookSchema(BaseSchema[Book]):
+        config = SchemaConfig[Book](
+            model=Book,
+            fields={
+                "id": Infer,
+                "title": Infer,
+                "author": {"id": Infer, "publisher": {"name": Infer}},
+            },
+        )
+
+    row = {
+        "id": 1,
+        "title": "Title",
+        "author__id": 2,
+        "author__publisher__name": "Publisher",
+    }
+    expected = {
+        "id": 1,
+        "title": "Title",
+        "author": {"id": 2, "publisher": {"name": "Publisher"}},
+    }
+    assert BookSchema.model_validate(row).model_dump() == expected
+
+    Row = namedtuple("Row", list(row))  # noqa: PYI024
+    assert BookSchema.model_validate(Row(**row)).model_dump() == expected